@@ -1,6 +1,8 @@
 from GlobalUtils.logger import *
 from GlobalUtils.globalUtils import *
 from binance.enums import *
+from APICaller.Binance.binanceUtils import *
+from concurrent.futures import ThreadPoolExecutor
 
 from dotenv import load_dotenv
 
@@ -8,7 +10,7 @@ load_dotenv()
 
 class BinanceCaller:
     def __init__(self):
-        self.client = GLOBAL_BINANCE_CLIENT
+        self.client = ClientRegistry.get('Binance')
 
     def get_price(self, symbol: str) -> float:
         try:
@@ -27,20 +29,47 @@ class BinanceCaller:
         return None
 
     def get_funding_rates(self, symbols: list):
+        """
+        Mark price and last funding rate for every symbol come from a single premium index request;
+        only the open interest / long-short ratio lookups are per symbol, and those run on a bounded pool.
+        """
         funding_rates = []
         try:
-            for symbol in symbols:
-                funding_rate_data = self._fetch_funding_rate_for_symbol(symbol)
-                skew = self.get_skew(symbol)
-                parsed_data = self._parse_funding_rate_data(funding_rate_data, symbol)
-                parsed_data['skew_usd'] = skew
-                if parsed_data:
-                    funding_rates.append(parsed_data)
+            premium_index_by_symbol = self.get_premium_index_for_all_symbols()
+            if not premium_index_by_symbol:
+                logger.error("BinanceAPICaller - Premium index unavailable, skipping Binance for this cycle.")
+                return None
+
+            target_symbols = [symbol for symbol in symbols if symbol in premium_index_by_symbol]
+            missing_symbols = set(symbols) - set(target_symbols)
+            if missing_symbols:
+                logger.warning(f"BinanceAPICaller - No premium index data for symbols: {missing_symbols}")
+
+            with ThreadPoolExecutor(max_workers=BINANCE_MAX_CONCURRENT_REQUESTS, thread_name_prefix='BinanceCaller') as executor:
+                skews = executor.map(
+                    lambda symbol: self.get_skew(symbol, float(premium_index_by_symbol[symbol]['markPrice'])),
+                    target_symbols
+                )
+
+                for symbol, skew in zip(target_symbols, skews):
+                    parsed_data = self._parse_funding_rate_data(premium_index_by_symbol[symbol], symbol)
+                    if parsed_data:
+                        parsed_data['skew_usd'] = skew
+                        funding_rates.append(parsed_data)
+
             return funding_rates
         except Exception as e:
             logger.error(f"BinanceAPICaller - Failed to fetch or parse funding rates for symbols. Error: {e}")
             return None
 
+    def get_premium_index_for_all_symbols(self) -> dict:
+        try:
+            response = self.client.mark_price()
+            return index_premium_index_by_symbol(response)
+        except Exception as e:
+            logger.error(f"BinanceAPICaller - Error fetching premium index for all symbols: {e}")
+            return {}
+
     def get_historical_funding_rate_for_symbol(self, symbol: str, limit: int) -> list:
         try:
             response = self.client.funding_rate(symbol=symbol, limit=limit)
@@ -60,7 +89,8 @@ class BinanceCaller:
         
     def _parse_funding_rate_data(self, funding_rate_data, symbol: str):
         if funding_rate_data:
-            rate_as_float = float(funding_rate_data.get('fundingRate'))
+            rate = funding_rate_data.get('fundingRate', funding_rate_data.get('lastFundingRate'))
+            rate_as_float = float(rate)
             return {
                 'exchange': 'Binance',
                 'symbol': symbol,
@@ -70,19 +100,15 @@ class BinanceCaller:
             logger.error(f"BinanceAPICaller - No funding rate data available for symbol: {symbol}")
             return None
 
-    def get_skew(self, symbol: str) -> float:
+    def get_skew(self, symbol: str, price: float = None) -> float:
         try:
             response = self.client.open_interest(symbol)
             response2 = self.client.long_short_account_ratio(symbol, period='5m')
-            price = self.get_price(symbol)
-            open_interest_in_asset = float(response['openInterest'])
+            if price is None:
+                price = self.get_price(symbol)
 
-            amount_long = float(response2[0]['longAccount']) * open_interest_in_asset
-            amount_short = float(response2[0]['shortAccount']) * open_interest_in_asset
-
-            skew = (amount_long - amount_short) * price
+            skew = calculate_skew_usd(response, response2, price)
             return skew
         except Exception as e:
             logger.error(f'BinanceAPICaller - Error while calculating skew for symbol {symbol}. Error: {e}')
             return None
-
@@ -1,11 +1,34 @@
 import os
 from dotenv import load_dotenv
 from binance.um_futures import UMFutures as Binance
+from GlobalUtils.logger import logger
 load_dotenv()
 
+# Upper bound on concurrent per-symbol requests (open interest / long-short ratio) so a cycle
+# stays well inside Binance's request weight limit.
+BINANCE_MAX_CONCURRENT_REQUESTS = 5
+
 def get_binance_client() -> Binance:
     api_key = str(os.getenv('BINANCE_API_KEY'))
     api_secret = str(os.getenv('BINANCE_API_SECRET'))
     client = Binance(api_key, api_secret)
 
-    return client
\ No newline at end of file
+    return client
+
+def index_premium_index_by_symbol(response: list) -> dict:
+    try:
+        return {entry['symbol']: entry for entry in response}
+    except Exception as e:
+        logger.error(f"BinanceUtils - Failed to index premium index response by symbol. Error: {e}")
+        return {}
+
+def calculate_skew_usd(open_interest_response: dict, long_short_ratio_response: list, price: float) -> float:
+    try:
+        open_interest_in_asset = float(open_interest_response['openInterest'])
+        amount_long = float(long_short_ratio_response[0]['longAccount']) * open_interest_in_asset
+        amount_short = float(long_short_ratio_response[0]['shortAccount']) * open_interest_in_asset
+
+        return (amount_long - amount_short) * price
+    except Exception as e:
+        logger.error(f"BinanceUtils - Failed to calculate skew from open interest {open_interest_response} and long/short ratio {long_short_ratio_response}. Error: {e}")
+        return None
@@ -1,11 +1,12 @@
 from APICaller.ByBit.ByBitUtils import *
 from GlobalUtils.logger import logger
 from GlobalUtils.globalUtils import *
+from GlobalUtils.FundingCalendar import FundingCalendar
 import math
 
 class ByBitCaller:
     def __init__(self):
-        self.client = GLOBAL_BYBIT_CLIENT
+        self.client = ClientRegistry.get('ByBit')
 
     def _fetch_funding_rate_data(self, symbol: str):
         try:
@@ -77,20 +78,84 @@ class ByBitCaller:
             return None
 
     def get_funding_rates(self, symbols: list) -> list:
+        """
+        Bulk path: one `get_tickers` call for every linear contract plus one (paged) instruments call,
+        with the target symbols sliced out locally, so the request count per cycle does not grow
+        with the number of symbols. The same responses refresh the ByBit FundingCalendar.
+        """
         funding_rates = []
         try:
+            tickers_by_symbol = self.get_all_linear_tickers()
+            funding_intervals = self.get_all_funding_intervals()
+            if not tickers_by_symbol or not funding_intervals:
+                logger.error("ByBitCaller - Bulk ticker or instrument data unavailable, skipping ByBit for this cycle.")
+                return None
+
+            FundingCalendar.update_schedule('ByBit', build_funding_schedule(tickers_by_symbol, funding_intervals))
+
             for symbol in symbols:
-                funding_rate_data = self.get_funding_rate_for_symbol(symbol)
-                if funding_rate_data:
-                    funding_rates.append(funding_rate_data)
-                else:
+                ticker = tickers_by_symbol.get(symbol)
+                interval = funding_intervals.get(symbol)
+                if ticker is None or not interval:
+                    logger.warning(f"ByBitCaller - No ticker or funding interval found for {symbol}.")
                     continue
 
+                funding_rate_info = parse_funding_rate_from_ticker(ticker, interval)
+                if funding_rate_info:
+                    funding_rates.append(funding_rate_info)
+
             return funding_rates
         except Exception as e:
             logger.error(f"ByBitCaller - Failed to fetch or parse funding rates for symbols. Error: {e}")
             return None
 
+    def load_funding_schedule(self) -> dict:
+        try:
+            schedule = build_funding_schedule(self.get_all_linear_tickers(), self.get_all_funding_intervals())
+            FundingCalendar.update_schedule('ByBit', schedule)
+            return schedule
+
+        except Exception as e:
+            logger.error(f"ByBitCaller - Failed to load funding schedule. Error: {e}")
+            return None
+
+    def get_all_linear_tickers(self) -> dict:
+        try:
+            response = self.client.get_tickers(category='linear')
+            return index_tickers_by_symbol(response)
+
+        except Exception as e:
+            logger.error(f"ByBitCaller - Failed to fetch linear tickers. Error: {e}")
+            return {}
+
+    def get_all_funding_intervals(self) -> dict:
+        try:
+            funding_intervals_hours = {}
+            cursor = None
+            while True:
+                params = {'category': 'linear', 'limit': INSTRUMENTS_INFO_PAGE_LIMIT}
+                if cursor:
+                    params['cursor'] = cursor
+                response = self.client.get_instruments_info(**params)
+                if not is_successful_list_response(response):
+                    logger.error(f"ByBitCaller - Unexpected response while paging instruments info: {response}")
+                    return funding_intervals_hours
+
+                for instrument in response['result']['list']:
+                    funding_interval_mins = instrument.get('fundingInterval')
+                    if funding_interval_mins:
+                        funding_intervals_hours[instrument['symbol']] = float(funding_interval_mins) / 60
+
+                cursor = response['result'].get('nextPageCursor')
+                if not cursor:
+                    break
+
+            return funding_intervals_hours
+
+        except Exception as e:
+            logger.error(f"ByBitCaller - Failed to fetch funding intervals for linear instruments. Error: {e}")
+            return {}
+
     def get_funding_interval_for_symbol(self, symbol: str) -> int:
         try:
             response = self.client.get_instruments_info(
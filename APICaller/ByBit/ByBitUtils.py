@@ -2,6 +2,8 @@ from pybit.unified_trading import HTTP
 import os
 from dotenv import load_dotenv
 from enum import Enum
+from GlobalUtils.logger import logger
+from GlobalUtils.globalUtils import normalize_funding_rate_to_8hrs
 
 load_dotenv()
 
@@ -23,4 +25,49 @@ def get_ByBit_client() -> HTTP:
     )
     return client
 
-GLOBAL_BYBIT_CLIENT = get_ByBit_client()
\ No newline at end of file
+INSTRUMENTS_INFO_PAGE_LIMIT = 1000
+
+def is_successful_list_response(response: dict) -> bool:
+    return bool(response) and response.get('retCode') == 0 and 'result' in response and 'list' in response['result']
+
+def index_tickers_by_symbol(response: dict) -> dict:
+    try:
+        if not is_successful_list_response(response):
+            logger.error(f"ByBitUtils - Unexpected response while indexing linear tickers: {response}")
+            return {}
+        return {ticker['symbol']: ticker for ticker in response['result']['list']}
+
+    except Exception as e:
+        logger.error(f"ByBitUtils - Failed to index linear tickers by symbol. Error: {e}")
+        return {}
+
+def parse_funding_rate_from_ticker(ticker: dict, funding_interval_hours: float) -> dict:
+    try:
+        symbol = ticker['symbol']
+        rate = float(ticker['fundingRate'])
+        index_price = float(ticker['indexPrice'])
+        open_interest_in_asset = float(ticker['openInterest'])
+        normalized_rate = normalize_funding_rate_to_8hrs(rate, funding_interval_hours)
+
+        return {
+            'exchange': 'ByBit',
+            'symbol': symbol,
+            'funding_rate': normalized_rate,
+            'skew_usd': open_interest_in_asset * index_price
+        }
+
+    except Exception as e:
+        logger.error(f"ByBitUtils - Failed to parse funding rate from ticker {ticker}. Error: {e}")
+        return None
+
+def build_funding_schedule(tickers_by_symbol: dict, funding_intervals_hours: dict) -> dict:
+    schedule = {}
+    for symbol, ticker in tickers_by_symbol.items():
+        try:
+            interval = funding_intervals_hours.get(symbol)
+            next_funding_time = ticker.get('nextFundingTime')
+            if interval and next_funding_time:
+                schedule[symbol] = (int(next_funding_time), float(interval))
+        except Exception as e:
+            logger.error(f"ByBitUtils - Failed to read funding schedule from ticker {ticker}. Error: {e}")
+    return schedule
@@ -1,13 +1,14 @@
 from GlobalUtils.globalUtils import *
 from GlobalUtils.logger import logger
 from APICaller.GMX.GMXCallerUtils import *
+from APICaller.GMX.GMXMarketSnapshot import GMXSnapshotService
 from APICaller.master.MasterUtils import get_target_tokens_for_GMX
 set_paths()
 
 class GMXCaller:
     def __init__(self):
         self.stats_caller = build_stats_class()
-        self.config = ARBITRUM_CONFIG_OBJECT
+        self.config = get_arbitrum_config()
 
     def get_funding_rates(self, symbols: list) -> list:
         try:
@@ -121,18 +122,13 @@ class GMXCaller:
 
     def _collect_data_raw(self) -> dict:
         try:
-            oracle_prices = OraclePrices(ARBITRUM_CONFIG_OBJECT.chain).get_recent_prices()
-            open_interest = OpenInterest(ARBITRUM_CONFIG_OBJECT)._get_data_processing(oracle_prices)
-            liquidity = self.stats_caller.get_available_liquidity(open_interest, oracle_prices)
-            borrow_apr = self.stats_caller.get_borrow_apr(oracle_prices)
-            funding_apr = self.stats_caller.get_funding_apr(open_interest, oracle_prices)
-
+            snapshot = GMXSnapshotService.get_snapshot()
 
             data_raw = {
-                'liquidity': liquidity,
-                'borrow_apr': borrow_apr,
-                'funding_apr': funding_apr,
-                'open_interest': open_interest
+                'liquidity': snapshot.liquidity,
+                'borrow_apr': snapshot.borrow_apr,
+                'funding_apr': snapshot.funding_apr,
+                'open_interest': snapshot.open_interest
             }
 
             return data_raw
@@ -9,6 +9,7 @@ from gmx_python_sdk.scripts.v2.get.get_borrow_apr import GetBorrowAPR
 from gmx_python_sdk.scripts.v2.get.get_funding_apr import GetFundingFee
 from gmx_python_sdk.scripts.v2.get.get_open_interest import OpenInterest
 from GlobalUtils.logger import logger
+from GlobalUtils.ClientRegistry import ClientRegistry
 
 from gmx_python_sdk.scripts.v2.get.get_available_liquidity import (
     GetAvailableLiquidity
@@ -44,7 +45,8 @@ def get_config_object() -> ConfigManager:
 
     return config_object
 
-ARBITRUM_CONFIG_OBJECT = get_config_object()
+def get_arbitrum_config() -> ConfigManager:
+    return ClientRegistry.get('GMX')
 
 
 class GetGMXv2Stats:
@@ -130,7 +132,7 @@ def build_stats_class() -> GetGMXv2Stats:
         to_json = True
         to_csv = True
 
-        config = ARBITRUM_CONFIG_OBJECT
+        config = get_arbitrum_config()
 
         stats_class = GetGMXv2Stats(
             config=config,
@@ -1,16 +1,65 @@
 from gmx_python_sdk.scripts.v2.gmx_utils import *
 from gmx_python_sdk.scripts.v2.get.get import GetData
 from gmx_python_sdk.scripts.v2.get.get_open_interest import OpenInterest
-from APICaller.GMX.GMXCallerUtils import ARBITRUM_CONFIG_OBJECT
+from APICaller.GMX.GMXCallerUtils import get_arbitrum_config
+from GlobalUtils.ClientRegistry import ClientRegistry
 from GlobalUtils.logger import logger
 from decimal import Decimal, getcontext
 getcontext().prec = 50
 
-DATASTORE_CONTRACT_OBJECT = get_datastore_contract(ARBITRUM_CONFIG_OBJECT)
-READER_CONTRACT_OBJECT = get_reader_contract(ARBITRUM_CONFIG_OBJECT)
-
 DATASTORE_ADDRESS = '0xFD70de6b91282D8017aA4E741e9Ae325CAb992d8'
 
+MULTICALL3_ADDRESS = '0xcA11bde05977b3631167028862bE2a173976CA11'
+MULTICALL3_ABI = [
+    {
+        "inputs": [
+            {
+                "components": [
+                    {"internalType": "address", "name": "target", "type": "address"},
+                    {"internalType": "bool", "name": "allowFailure", "type": "bool"},
+                    {"internalType": "bytes", "name": "callData", "type": "bytes"}
+                ],
+                "internalType": "struct Multicall3.Call3[]",
+                "name": "calls",
+                "type": "tuple[]"
+            }
+        ],
+        "name": "aggregate3",
+        "outputs": [
+            {
+                "components": [
+                    {"internalType": "bool", "name": "success", "type": "bool"},
+                    {"internalType": "bytes", "name": "returnData", "type": "bytes"}
+                ],
+                "internalType": "struct Multicall3.Result[]",
+                "name": "returnData",
+                "type": "tuple[]"
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function"
+    }
+]
+MULTICALL_BATCH_SIZE = 500
+
+def build_datastore_contract_object():
+    return get_datastore_contract(get_arbitrum_config())
+
+def build_reader_contract_object():
+    return get_reader_contract(get_arbitrum_config())
+
+def build_multicall_contract_object():
+    return get_datastore_contract_object().w3.eth.contract(address=MULTICALL3_ADDRESS, abi=MULTICALL3_ABI)
+
+def get_datastore_contract_object():
+    return ClientRegistry.get('GMXDatastore')
+
+def get_reader_contract_object():
+    return ClientRegistry.get('GMXReader')
+
+def get_multicall_contract_object():
+    return ClientRegistry.get('GMXMulticall')
+
 FUNDING_FACTOR = create_hash_string("FUNDING_FACTOR")
 FUNDING_EXPONENT_FACTOR = create_hash_string("FUNDING_EXPONENT_FACTOR")
 FUNDING_INCREASE_FACTOR_PER_SECOND = create_hash_string("FUNDING_INCREASE_FACTOR_PER_SECOND")
@@ -57,6 +106,11 @@ SINGLE_SWAP_GAS_LIMIT = create_hash_string("SINGLE_SWAP_GAS_LIMIT")
 SWAP_ORDER_GAS_LIMIT = create_hash_string("SWAP_ORDER_GAS_LIMIT")
 VIRTUAL_TOKEN_ID = create_hash_string("VIRTUAL_TOKEN_ID")
 
+POSITION_IMPACT_FACTOR = create_hash_string("POSITION_IMPACT_FACTOR")
+POSITION_IMPACT_EXPONENT_FACTOR = create_hash_string("POSITION_IMPACT_EXPONENT_FACTOR")
+MAX_POSITION_IMPACT_FACTOR = create_hash_string("MAX_POSITION_IMPACT_FACTOR")
+POSITION_IMPACT_POOL_AMOUNT = create_hash_string("POSITION_IMPACT_POOL_AMOUNT")
+
 MIN_COLLATERAL_FACTOR = create_hash_string("MIN_COLLATERAL_FACTOR")
 MIN_COLLATERAL_USD = create_hash_string("MIN_COLLATERAL_USD")
 MIN_POSITION_SIZE_USD = create_hash_string("MIN_POSITION_SIZE_USD")
@@ -123,6 +177,18 @@ def max_position_impact_factor_for_liquidations_key(market):
     return create_hash(["bytes32", "address"],
         [MAX_POSITION_IMPACT_FACTOR_FOR_LIQUIDATIONS_KEY, market])
 
+def position_impact_factor_key(market: str, is_positive: bool):
+    return create_hash(["bytes32", "address", "bool"], [POSITION_IMPACT_FACTOR, market, is_positive])
+
+def position_impact_exponent_factor_key(market: str):
+    return create_hash(["bytes32", "address"], [POSITION_IMPACT_EXPONENT_FACTOR, market])
+
+def max_position_impact_factor_key(market: str, is_positive: bool):
+    return create_hash(["bytes32", "address", "bool"], [MAX_POSITION_IMPACT_FACTOR, market, is_positive])
+
+def position_impact_pool_amount_key(market: str):
+    return create_hash(["bytes32", "address"], [POSITION_IMPACT_POOL_AMOUNT, market])
+
 def decrease_order_gas_limit_key():
     return DECREASE_ORDER_GAS_LIMIT
 
@@ -251,7 +317,7 @@ def get_index_token_address_for_symbol(symbol):
 def get_min_collateral_factor(market: str) -> float:
     try:
         min_collateral_factor_key = minCollateralFactorKey(market)
-        min_collateral_func = DATASTORE_CONTRACT_OBJECT.functions.getUint(min_collateral_factor_key)
+        min_collateral_func = get_datastore_contract_object().functions.getUint(min_collateral_factor_key)
         min_collateral_factor = min_collateral_func.call()
         min_collateral_factor = min_collateral_factor / 10**30
 
@@ -264,7 +330,7 @@ def get_min_collateral_factor(market: str) -> float:
 def get_funding_exponent(market: str) -> float:
     try:
         funding_exponent_key = funding_exponent_factor_key(market)
-        funding_exponent_func = DATASTORE_CONTRACT_OBJECT.functions.getUint(funding_exponent_key)
+        funding_exponent_func = get_datastore_contract_object().functions.getUint(funding_exponent_key)
         funding_exponent = funding_exponent_func.call()
         funding_exponent = funding_exponent / 10**30
 
@@ -277,7 +343,7 @@ def get_funding_exponent(market: str) -> float:
 def get_funding_factor(market: str) -> float:
     try:
         funding_factor_key_variable = funding_factor_key(market)
-        funding_factor_func = DATASTORE_CONTRACT_OBJECT.functions.getUint(funding_factor_key_variable)
+        funding_factor_func = get_datastore_contract_object().functions.getUint(funding_factor_key_variable)
         funding_factor = funding_factor_func.call()
         print(funding_factor)
         funding_factor = funding_factor / 10**30
@@ -291,7 +357,7 @@ def get_funding_factor(market: str) -> float:
 def get_funding_increase_factor(market: str) -> float:
     try:
         funding_increase_factor_key_variable = funding_increase_factor_key(market)
-        funding_increase_factor_func = DATASTORE_CONTRACT_OBJECT.functions.getUint(funding_increase_factor_key_variable)
+        funding_increase_factor_func = get_datastore_contract_object().functions.getUint(funding_increase_factor_key_variable)
         funding_increase_factor = funding_increase_factor_func.call()
         funding_increase_factor = funding_increase_factor / 10**30
 
@@ -304,7 +370,7 @@ def get_funding_increase_factor(market: str) -> float:
 def get_funding_decrease_factor(market: str) -> float:
     try:
         funding_decrease_factor_key_variable = funding_decrease_factor_key(market)
-        funding_decrease_factor_func = DATASTORE_CONTRACT_OBJECT.functions.getUint(funding_decrease_factor_key_variable)
+        funding_decrease_factor_func = get_datastore_contract_object().functions.getUint(funding_decrease_factor_key_variable)
         funding_decrease_factor = funding_decrease_factor_func.call()
         funding_decrease_factor = funding_decrease_factor / Decimal("10")**30
         funding_decrease_factor = float(funding_decrease_factor)
@@ -318,7 +384,7 @@ def get_funding_decrease_factor(market: str) -> float:
 def get_threshold_for_stable_funding(market: str) -> float:
     try:
         threshold_for_stable_key = threshold_for_stable_funding_key(market)
-        threshold_for_stable_func = DATASTORE_CONTRACT_OBJECT.functions.getUint(threshold_for_stable_key)
+        threshold_for_stable_func = get_datastore_contract_object().functions.getUint(threshold_for_stable_key)
         threshold_for_stable = threshold_for_stable_func.call()
         threshold_for_stable = threshold_for_stable / 10**30
 
@@ -330,8 +396,8 @@ def get_threshold_for_stable_funding(market: str) -> float:
 
 def get_threshold_for_decrease_funding(market: str) -> float:
     try:
-        threshold_for_decrease_key = threshold_for_stable_funding_key(market)
-        threshold_for_decrease_func = DATASTORE_CONTRACT_OBJECT.functions.getUint(threshold_for_decrease_key)
+        threshold_for_decrease_key = threshold_for_decrease_funding_key(market)
+        threshold_for_decrease_func = get_datastore_contract_object().functions.getUint(threshold_for_decrease_key)
         threshold_for_decrease = threshold_for_decrease_func.call()
         threshold_for_decrease = threshold_for_decrease / 10**30
         
@@ -344,7 +410,7 @@ def get_threshold_for_decrease_funding(market: str) -> float:
 def get_max_funding_factor_for_market(market: str) -> float:
     try:
         max_funding_factor_key_variable = max_funding_factor_key(market)
-        max_funding_factor_func = DATASTORE_CONTRACT_OBJECT.functions.getUint(max_funding_factor_key_variable)
+        max_funding_factor_func = get_datastore_contract_object().functions.getUint(max_funding_factor_key_variable)
         max_funding_factor = max_funding_factor_func.call()
         max_funding_factor = max_funding_factor / 10**30
         
@@ -357,7 +423,7 @@ def get_max_funding_factor_for_market(market: str) -> float:
 def get_borrow_rate_for_market(market: str) -> float:
     try:
         borrow_rate_key_variable = borrow_factor_key(market)
-        borrow_rate_factor_func = DATASTORE_CONTRACT_OBJECT.functions.getUint(borrow_rate_key_variable)
+        borrow_rate_factor_func = get_datastore_contract_object().functions.getUint(borrow_rate_key_variable)
         borrow_rate_factor = borrow_rate_factor_func.call()
         borrow_rate_factor = borrow_rate_factor / 10**30
         
@@ -374,7 +440,7 @@ def get_claimable_funding_amount(market: str, token: str, account: str) -> float
             token,
             account
         )
-        claimable_funding_amount_func = DATASTORE_CONTRACT_OBJECT.functions.getUint(claimable_funding_amount_key)
+        claimable_funding_amount_func = get_datastore_contract_object().functions.getUint(claimable_funding_amount_key)
         claimable_funding_amount = claimable_funding_amount_func.call()
         
         return claimable_funding_amount
@@ -382,3 +448,27 @@ def get_claimable_funding_amount(market: str, token: str, account: str) -> float
     except Exception as e:
         logger.error(f'GMXPositionControllerUtils - Failed to call claimable funding amount from datastore contract. Error: {e}')
         return None
+
+def get_datastore_uints(keys: list, batch_size: int = MULTICALL_BATCH_SIZE) -> list:
+    """
+    Reads DataStore.getUint for every key through Multicall3, batch_size keys per RPC call.
+    Values come back in key order, with None for any individual call that reverted.
+    """
+    try:
+        datastore_contract = get_datastore_contract_object()
+        multicall_contract = get_multicall_contract_object()
+        values = []
+        for start in range(0, len(keys), batch_size):
+            calls = [
+                (datastore_contract.address, True, datastore_contract.encodeABI(fn_name='getUint', args=[key]))
+                for key in keys[start:start + batch_size]
+            ]
+            results = multicall_contract.functions.aggregate3(calls).call()
+            for success, return_data in results:
+                values.append(int.from_bytes(return_data, 'big') if success and return_data else None)
+
+        return values
+    
+    except Exception as e:
+        logger.error(f'GMXPositionControllerUtils - Failed to batch getUint calls through multicall. Error: {e}')
+        return None
@@ -0,0 +1,85 @@
+from APICaller.GMX.GMXCallerUtils import *
+from GlobalUtils.logger import logger
+from types import MappingProxyType
+from typing import NamedTuple
+import threading
+import time
+import os
+
+DEFAULT_GMX_SNAPSHOT_TTL_SECONDS = 30
+
+class GMXMarketSnapshot(NamedTuple):
+    prices: MappingProxyType
+    open_interest: MappingProxyType
+    liquidity: MappingProxyType
+    borrow_apr: MappingProxyType
+    funding_apr: MappingProxyType
+    timestamp: float
+
+def freeze(data):
+    if isinstance(data, dict):
+        return MappingProxyType({key: freeze(value) for key, value in data.items()})
+    return data
+
+def get_snapshot_ttl_seconds() -> float:
+    ttl = os.getenv('GMX_SNAPSHOT_TTL_SECONDS')
+    return float(ttl) if ttl else DEFAULT_GMX_SNAPSHOT_TTL_SECONDS
+
+
+class GMXSnapshotService:
+    """
+    Fetches GMX oracle prices, open interest, liquidity, borrow APR and funding APR once and serves
+    the same read-only snapshot to the caller, the profitability checker and the position monitor
+    until the TTL expires.
+    """
+    _snapshot = None
+    _lock = threading.Lock()
+    _ttl_seconds = get_snapshot_ttl_seconds()
+
+    @classmethod
+    def get_snapshot(cls, force_refresh: bool = False) -> GMXMarketSnapshot:
+        try:
+            with cls._lock:
+                if force_refresh or not cls._is_fresh(cls._snapshot):
+                    snapshot = cls._fetch_snapshot()
+                    if snapshot is not None:
+                        cls._snapshot = snapshot
+                    elif cls._snapshot is not None:
+                        logger.warning(f"GMXSnapshotService - Refresh failed, serving snapshot from {time.time() - cls._snapshot.timestamp:.1f}s ago.")
+                return cls._snapshot
+
+        except Exception as e:
+            logger.error(f"GMXSnapshotService - Failed to get GMX market snapshot. Error: {e}", exc_info=True)
+            return None
+
+    @classmethod
+    def invalidate(cls):
+        with cls._lock:
+            cls._snapshot = None
+
+    @classmethod
+    def _is_fresh(cls, snapshot: GMXMarketSnapshot) -> bool:
+        return snapshot is not None and time.time() - snapshot.timestamp < cls._ttl_seconds
+
+    @classmethod
+    def _fetch_snapshot(cls) -> GMXMarketSnapshot:
+        try:
+            stats_caller = build_stats_class()
+            oracle_prices = OraclePrices(get_arbitrum_config().chain).get_recent_prices()
+            open_interest = OpenInterest(get_arbitrum_config())._get_data_processing(oracle_prices)
+            liquidity = stats_caller.get_available_liquidity(open_interest, oracle_prices)
+            borrow_apr = stats_caller.get_borrow_apr(oracle_prices)
+            funding_apr = stats_caller.get_funding_apr(open_interest, oracle_prices)
+
+            return GMXMarketSnapshot(
+                prices=freeze(oracle_prices),
+                open_interest=freeze(open_interest),
+                liquidity=freeze(liquidity),
+                borrow_apr=freeze(borrow_apr),
+                funding_apr=freeze(funding_apr),
+                timestamp=time.time()
+            )
+
+        except Exception as e:
+            logger.error(f"GMXSnapshotService - Failed to fetch GMX market data. Error: {e}", exc_info=True)
+            return None
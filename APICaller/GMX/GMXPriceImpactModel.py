@@ -0,0 +1,135 @@
+from APICaller.GMX.GMXContractUtils import *
+from APICaller.GMX.GMXMarketSnapshot import GMXMarketSnapshot
+from GlobalUtils.logger import logger
+from typing import NamedTuple
+import threading
+
+FLOAT_PRECISION = 10**30
+
+class GMXImpactParams(NamedTuple):
+    positive_factor: float
+    negative_factor: float
+    exponent: float
+    max_positive_factor: float
+    impact_pool_amount: int
+
+def build_impact_params(positive_factor: int, negative_factor: int, exponent: int, max_positive_factor: int, impact_pool_amount: int) -> GMXImpactParams:
+    """
+    Converts the raw datastore values (factors and exponent scaled by 10^30) into GMXImpactParams.
+    """
+    return GMXImpactParams(
+        positive_factor=positive_factor / FLOAT_PRECISION,
+        negative_factor=negative_factor / FLOAT_PRECISION,
+        exponent=exponent / FLOAT_PRECISION,
+        max_positive_factor=max_positive_factor / FLOAT_PRECISION,
+        impact_pool_amount=impact_pool_amount
+    )
+
+def apply_impact_factor(diff_usd: float, factor: float, exponent: float) -> float:
+    return (diff_usd ** exponent) * factor
+
+def calculate_position_price_impact_usd(
+    params: GMXImpactParams,
+    long_open_interest_usd: float,
+    short_open_interest_usd: float,
+    absolute_size_usd: float,
+    is_long: bool,
+    index_token_min_price_full: int
+) -> float:
+    """
+    Mirrors PositionPricingUtils.getPriceImpactUsd for a position increase, including the
+    positive-impact caps applied at execution. Returns signed USD impact (negative = cost to the trader).
+    Virtual inventory impact is not modelled.
+    """
+    next_long_open_interest = long_open_interest_usd + absolute_size_usd if is_long else long_open_interest_usd
+    next_short_open_interest = short_open_interest_usd if is_long else short_open_interest_usd + absolute_size_usd
+
+    initial_diff_usd = abs(long_open_interest_usd - short_open_interest_usd)
+    next_diff_usd = abs(next_long_open_interest - next_short_open_interest)
+    is_same_side_rebalance = (long_open_interest_usd <= short_open_interest_usd) == (next_long_open_interest <= next_short_open_interest)
+
+    if is_same_side_rebalance:
+        factor = params.positive_factor if next_diff_usd < initial_diff_usd else params.negative_factor
+        price_impact_usd = apply_impact_factor(initial_diff_usd, factor, params.exponent) - apply_impact_factor(next_diff_usd, factor, params.exponent)
+    else:
+        positive_impact_usd = apply_impact_factor(initial_diff_usd, params.positive_factor, params.exponent)
+        negative_impact_usd = apply_impact_factor(next_diff_usd, params.negative_factor, params.exponent)
+        price_impact_usd = positive_impact_usd - negative_impact_usd
+
+    if price_impact_usd > 0:
+        impact_pool_usd = params.impact_pool_amount * index_token_min_price_full / FLOAT_PRECISION
+        max_impact_usd = absolute_size_usd * params.max_positive_factor
+        price_impact_usd = min(price_impact_usd, impact_pool_usd, max_impact_usd)
+
+    return price_impact_usd
+
+
+class GMXPriceImpactModel:
+    """
+    Evaluates GMX position price impact in-process. Impact factors, exponent and impact pool
+    amount are read from the datastore once per market per snapshot; open interest and prices
+    come from the snapshot itself, so any number of sizes can be priced without further RPC calls.
+    """
+    _lock = threading.Lock()
+    _snapshot_timestamp = None
+    _params = {}
+
+    @classmethod
+    def get_price_impact_usd(cls, symbol: str, market_key: str, is_long: bool, absolute_trade_size_usd: float, snapshot: GMXMarketSnapshot) -> float:
+        try:
+            params = cls.get_params(symbol, market_key, snapshot)
+            index_token_address = get_index_token_address_for_symbol(symbol)
+
+            return calculate_position_price_impact_usd(
+                params,
+                snapshot.open_interest['long'][symbol],
+                snapshot.open_interest['short'][symbol],
+                absolute_trade_size_usd,
+                is_long,
+                int(snapshot.prices[index_token_address]['minPriceFull'])
+            )
+
+        except Exception as e:
+            logger.error(f"GMXPriceImpactModel - Failed to calculate price impact for {symbol}, size {absolute_trade_size_usd}, is_long = {is_long}. Error: {e}", exc_info=True)
+            return None
+
+    @classmethod
+    def get_price_impact_usd_for_sizes(cls, symbol: str, market_key: str, is_long: bool, sizes_usd: list, snapshot: GMXMarketSnapshot) -> list:
+        return [
+            cls.get_price_impact_usd(symbol, market_key, is_long, size_usd, snapshot)
+            for size_usd in sizes_usd
+        ]
+
+    @classmethod
+    def get_params(cls, symbol: str, market_key: str, snapshot: GMXMarketSnapshot) -> GMXImpactParams:
+        with cls._lock:
+            if snapshot.timestamp != cls._snapshot_timestamp:
+                cls._params = {}
+                cls._snapshot_timestamp = snapshot.timestamp
+
+            params = cls._params.get(symbol)
+            if params is None:
+                params = cls._load_params(market_key)
+                cls._params[symbol] = params
+
+            return params
+
+    @classmethod
+    def invalidate(cls):
+        with cls._lock:
+            cls._params = {}
+            cls._snapshot_timestamp = None
+
+    @classmethod
+    def _load_params(cls, market_key: str) -> GMXImpactParams:
+        values = get_datastore_uints([
+            position_impact_factor_key(market_key, True),
+            position_impact_factor_key(market_key, False),
+            position_impact_exponent_factor_key(market_key),
+            max_position_impact_factor_key(market_key, True),
+            position_impact_pool_amount_key(market_key)
+        ])
+        if values is None or None in values:
+            raise ValueError(f'Incomplete price impact parameters for market {market_key}')
+
+        return build_impact_params(*values)
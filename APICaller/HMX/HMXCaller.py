@@ -3,7 +3,7 @@ from GlobalUtils.logger import logger
 
 class HMXCaller:
     def __init__(self):
-        self.client = GLOBAL_HMX_CLIENT
+        self.client = ClientRegistry.get('HMX')
 
     def get_funding_rates(self, symbols: list) -> dict:
         if not symbols:
@@ -1,5 +1,6 @@
 from GlobalUtils.logger import *
 from GlobalUtils.globalUtils import *
+from GlobalUtils.FundingCalendar import FundingCalendar
 import math
 from dotenv import load_dotenv
 
@@ -31,14 +32,20 @@ class OKXCaller:
 
     def get_funding_rates(self, symbols: list):
         funding_rates = []
+        funding_schedule = {}
         try:
             for symbol in symbols:
-                funding_rate_data = self._fetch_funding_rate_for_symbol(symbol)
+                funding_rate_response = self._fetch_funding_rate_response_for_symbol(symbol)
+                if funding_rate_response:
+                    funding_schedule[symbol] = parse_funding_schedule_entry(funding_rate_response)
+                funding_rate_data = float(funding_rate_response['fundingRate']) if funding_rate_response else None
                 skew = self.get_skew(symbol)
                 parsed_data = self._parse_funding_rate_data(funding_rate_data, symbol)
-                parsed_data['skew_usd'] = skew
                 if parsed_data:
+                    parsed_data['skew_usd'] = skew
                     funding_rates.append(parsed_data)
+
+            FundingCalendar.update_schedule('OKX', {symbol: entry for symbol, entry in funding_schedule.items() if entry})
             return funding_rates
         except Exception as e:
             logger.error(f"OkxAPICaller - Failed to fetch or parse funding rates for symbols. Error: {e}")
@@ -80,14 +87,20 @@ class OKXCaller:
             logger.error(f'OKXCaller - Error while calculating funding events for symbol={symbol}. Error: {e}')
             return None
 
-    def _fetch_funding_rate_for_symbol(self, symbol: str):
+    def _fetch_funding_rate_response_for_symbol(self, symbol: str) -> dict:
         try:
             futures_funding_rate = self.okx_pub_client.get_funding_rate(instId=symbol)
             if futures_funding_rate and len(futures_funding_rate['data']) > 0:
-                return float(futures_funding_rate['data'][0]['fundingRate'])
+                return futures_funding_rate['data'][0]
         except Exception as e:
             logger.error(f"OkxAPICaller - Error fetching funding rate for {symbol}: {e}")
         return None
+
+    def _fetch_funding_rate_for_symbol(self, symbol: str):
+        response_data = self._fetch_funding_rate_response_for_symbol(symbol)
+        if response_data:
+            return float(response_data['fundingRate'])
+        return None
         
     def _parse_funding_rate_data(self, funding_rate_data, symbol: str):
         if funding_rate_data:
@@ -124,4 +137,15 @@ class OKXCaller:
             return skew
         except Exception as e:
             logger.error(f'OkxAPICaller - Error while calculating skew for symbol {symbol}. Error: {e}')
-            return None
\ No newline at end of file
+            return None
+
+def parse_funding_schedule_entry(response_data: dict) -> tuple:
+    try:
+        # fundingTime is the upcoming settlement, nextFundingTime the one after it.
+        settlement_time = int(response_data['fundingTime'])
+        next_settlement_time = int(response_data['nextFundingTime'])
+        interval_hours = (next_settlement_time - settlement_time) / 3_600_000
+        return (settlement_time, interval_hours)
+    except Exception as e:
+        logger.error(f"OkxAPICaller - Failed to parse funding schedule from {response_data}. Error: {e}")
+        return None
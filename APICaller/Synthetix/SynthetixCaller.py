@@ -1,11 +1,11 @@
 from synthetix import *
 from APICaller.Synthetix.SynthetixUtils import *
 from GlobalUtils.logger import *
-from GlobalUtils.globalUtils import GLOBAL_SYNTHETIX_CLIENT
+from GlobalUtils.ClientRegistry import ClientRegistry
 
 class SynthetixCaller:
     def __init__(self):
-        self.client = GLOBAL_SYNTHETIX_CLIENT
+        self.client = ClientRegistry.get('Synthetix')
 
     def get_funding_rates(self, symbols: list):
         try:
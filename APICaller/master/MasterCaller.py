@@ -1,44 +1,35 @@
-from APICaller.Synthetix.SynthetixCaller import SynthetixCaller
-from APICaller.Binance.binanceCaller import BinanceCaller
-from APICaller.ByBit.ByBitCaller import ByBitCaller
-from APICaller.HMX.HMXCaller import HMXCaller
-from APICaller.OKX.okxCaller import OKXCaller
-from APICaller.GMX.GMXCaller import GMXCaller
-from APICaller.master.MasterUtils import get_all_target_token_lists, get_target_exchanges
+from APICaller.master.MasterUtils import get_target_token_lists_by_exchange, get_target_exchanges, get_fetch_deadline_for_exchange
 from GlobalUtils.logger import *
+from GlobalUtils.ClientRegistry import LazyExchangeObjects
+from GlobalUtils.ExchangeAdapters import ExchangeAdapterRegistry
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+import time
 
-class MasterCaller:
-    def __init__(self):
-        self.synthetix = SynthetixCaller()
-        self.binance = BinanceCaller()
-        self.bybit = ByBitCaller()
-        self.hmx = HMXCaller()
-        self.gmx = GMXCaller()
-        # self.okx = OKXCaller()
-        self.target_token_list_by_exchange = get_all_target_token_lists()
+class MasterCaller(LazyExchangeObjects):
+    _exchange_role = 'caller'
+
+    def __init__(self, concurrent_fetch: bool = True):
+        self.concurrent_fetch = concurrent_fetch
+        self.target_token_list_by_exchange = get_target_token_lists_by_exchange()
         self.target_exchanges = get_target_exchanges()
         self.filtered_exchange_objects_and_tokens = self.filter_exchanges_and_tokens()
 
     def filter_exchanges_and_tokens(self):
-        try:
-            all_exchanges = {
-                "Synthetix": (self.synthetix, self.target_token_list_by_exchange[0]),
-                "Binance": (self.binance, self.target_token_list_by_exchange[1]),
-                "ByBit": (self.bybit, self.target_token_list_by_exchange[2]),
-                "HMX": (self.hmx, self.target_token_list_by_exchange[3]),
-                "GMX": (self.gmx, self.target_token_list_by_exchange[4]),
-                # "OKX": (self.okx, self.target_token_list_by_exchange[5])
-            }
-
-            filtered_exchanges = {}
-            for exchange_name in self.target_exchanges:
-                if exchange_name in all_exchanges:
-                    filtered_exchanges[exchange_name] = all_exchanges[exchange_name]
+        # Only the target exchanges' callers (and their clients) are ever built.
+        filtered_exchanges = {}
+        for exchange_name in self.target_exchanges:
+            if not ExchangeAdapterRegistry.is_registered(exchange_name):
+                logger.warning(f"MasterAPICaller - No adapter registered for {exchange_name}. Skipping.")
+                continue
+            try:
+                filtered_exchanges[exchange_name] = (
+                    getattr(self, exchange_name.lower()),
+                    self.target_token_list_by_exchange.get(exchange_name, [])
+                )
+            except Exception as e:
+                logger.error(f"MasterAPICaller - Error building caller for {exchange_name}: {e}")
 
-            return filtered_exchanges
-        except Exception as e:
-            logger.error(f"MasterAPICaller - Error filtering exchanges and tokens: {e}")
-            return {}
+        return filtered_exchanges
   
     def get_funding_rates(self) -> list:
         funding_rates = []
@@ -46,22 +37,84 @@ class MasterCaller:
             logger.error("MasterAPICaller - No exchanges and tokens available for fetching funding rates.")
             return funding_rates
 
+        if self.concurrent_fetch:
+            rates_by_exchange = self._fetch_funding_rates_concurrently()
+        else:
+            rates_by_exchange = self._fetch_funding_rates_sequentially()
+
+        for rates in rates_by_exchange.values():
+            funding_rates.extend(rates)
+
+        if not funding_rates:
+            logger.error("MasterAPICaller - No funding rates obtained from any exchanges.")
+            return None
+
+        return funding_rates
+
+    def _get_exchanges_with_tokens(self) -> dict:
+        exchanges_with_tokens = {}
         for exchange_name, (exchange, tokens) in self.filtered_exchange_objects_and_tokens.items():
             if not tokens:
                 logger.warning(f"MasterAPICaller - No tokens available for {exchange_name}. Skipping.")
                 continue
+            exchanges_with_tokens[exchange_name] = (exchange, tokens)
+
+        return exchanges_with_tokens
 
+    def _fetch_funding_rates_concurrently(self) -> dict:
+        """
+        Queries every target exchange at once, so a cycle takes as long as the slowest venue
+        that answers within its deadline rather than the sum of all venue latencies.
+        Each exchange's deadline is measured from the start of the cycle; venues that are late
+        or raise are dropped for this cycle and their worker is abandoned.
+        """
+        rates_by_exchange = {}
+        exchanges_with_tokens = self._get_exchanges_with_tokens()
+        if not exchanges_with_tokens:
+            return rates_by_exchange
+
+        executor = ThreadPoolExecutor(max_workers=len(exchanges_with_tokens), thread_name_prefix='MasterCaller')
+        start_time = time.monotonic()
+        try:
+            futures = {
+                exchange_name: executor.submit(exchange.get_funding_rates, tokens)
+                for exchange_name, (exchange, tokens) in exchanges_with_tokens.items()
+            }
+
+            for exchange_name, future in futures.items():
+                deadline = start_time + get_fetch_deadline_for_exchange(exchange_name)
+                remaining_seconds = max(0.0, deadline - time.monotonic())
+                try:
+                    rates = future.result(timeout=remaining_seconds)
+                except FuturesTimeoutError:
+                    future.cancel()
+                    logger.warning(f"MasterAPICaller - {exchange_name} missed its {get_fetch_deadline_for_exchange(exchange_name)}s deadline, dropping it from this cycle.")
+                    continue
+                except Exception as e:
+                    logger.error(f"MasterAPICaller - Error getting funding rates from {exchange_name}: {e}")
+                    continue
+
+                if rates:
+                    rates_by_exchange[exchange_name] = rates
+                else:
+                    logger.warning(f"MasterAPICaller - No funding rates returned from {exchange_name}.")
+
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        logger.info(f"MasterAPICaller - Fetched funding rates from {list(rates_by_exchange.keys())} in {time.monotonic() - start_time:.2f}s")
+        return rates_by_exchange
+
+    def _fetch_funding_rates_sequentially(self) -> dict:
+        rates_by_exchange = {}
+        for exchange_name, (exchange, tokens) in self._get_exchanges_with_tokens().items():
             try:
                 rates = exchange.get_funding_rates(tokens)
                 if rates:
-                    funding_rates.extend(rates)
+                    rates_by_exchange[exchange_name] = rates
                 else:
                     logger.warning(f"MasterAPICaller - No funding rates returned from {exchange_name}.")
             except Exception as e:
                 logger.error(f"MasterAPICaller - Error getting funding rates from {exchange_name}: {e}")
 
-        if not funding_rates:
-            logger.error("MasterAPICaller - No funding rates obtained from any exchanges.")
-            return None
-
-        return funding_rates
+        return rates_by_exchange
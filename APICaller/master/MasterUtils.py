@@ -1,4 +1,5 @@
 from GlobalUtils.logger import logger
+from GlobalUtils.ExchangeAdapters import ExchangeAdapterRegistry
 
 TARGET_TOKENS = [
     {"token": "BTC", "is_target": True},
@@ -33,6 +34,19 @@ TARGET_EXCHANGES = [
     {"exchange": "GMX", "is_target": True},
 ]
 
+# Per-exchange deadline (seconds) for a single funding rate fetch when exchanges are queried concurrently.
+# Venues that miss their deadline are dropped for that cycle rather than holding up the others.
+EXCHANGE_FETCH_DEADLINES_SECONDS = {
+    "Synthetix": 10,
+    "Binance": 10,
+    "ByBit": 10,
+    "HMX": 10,
+    "OKX": 10,
+    "GMX": 20,
+}
+
+DEFAULT_EXCHANGE_FETCH_DEADLINE_SECONDS = 10
+
 def get_target_exchanges() -> list:
     try:
         exchanges = [exchange["exchange"] for exchange in TARGET_EXCHANGES if exchange["is_target"]]
@@ -41,71 +55,46 @@ def get_target_exchanges() -> list:
         logger.error(f"MasterAPICallerUtils - Error retrieving target exchanges: {e}")
         return []
 
-def get_all_target_token_lists() -> list:
+def get_fetch_deadline_for_exchange(exchange: str) -> float:
     try:
-        binance_token_list = get_target_tokens_for_binance()
-        synthetix_token_list = get_target_tokens_for_synthetix()
-        bybit_token_list = get_target_tokens_for_bybit()
-        hmx_token_list = get_target_tokens_for_HMX()
-        gmx_token_list = get_target_tokens_for_GMX()
-        okx_token_list = get_target_tokens_for_OKX()
-        all_target_token_lists = [
-            synthetix_token_list,
-            binance_token_list,
-            bybit_token_list,
-            hmx_token_list,
-            gmx_token_list,
-            okx_token_list
-        ]
-        return all_target_token_lists
+        return float(EXCHANGE_FETCH_DEADLINES_SECONDS.get(exchange, DEFAULT_EXCHANGE_FETCH_DEADLINE_SECONDS))
     except Exception as e:
-        logger.error(f"MasterAPICallerUtils - Error retrieving all target token lists: {e}")
-        return []
+        logger.error(f"MasterAPICallerUtils - Error retrieving fetch deadline for {exchange}: {e}")
+        return float(DEFAULT_EXCHANGE_FETCH_DEADLINE_SECONDS)
 
-def get_target_tokens_for_binance() -> list:
+def get_target_tokens_for_exchange(exchange: str) -> list:
     try:
-        symbols = [token["token"] + "USDT" for token in TARGET_TOKENS if token["is_target"]]
+        format_symbol = ExchangeAdapterRegistry.get(exchange).format_symbol
+        symbols = [format_symbol(token["token"]) for token in TARGET_TOKENS if token["is_target"]]
         return symbols
     except Exception as e:
-        logger.error(f"MasterAPICallerUtils - Error retrieving target tokens for Binance: {e}")
+        logger.error(f"MasterAPICallerUtils - Error retrieving target tokens for {exchange}: {e}")
         return []
 
-def get_target_tokens_for_OKX() -> list:
+def get_target_token_lists_by_exchange() -> dict:
     try:
-        symbols = [token["token"] + "-USDT-SWAP" for token in TARGET_TOKENS if token["is_target"]]
-        return symbols
+        return {
+            exchange: get_target_tokens_for_exchange(exchange)
+            for exchange in ExchangeAdapterRegistry.get_registered_exchanges()
+        }
     except Exception as e:
-        logger.error(f"MasterAPICallerUtils - Error retrieving target tokens for OKX: {e}")
-        return []
+        logger.error(f"MasterAPICallerUtils - Error retrieving all target token lists: {e}")
+        return {}
+
+def get_target_tokens_for_binance() -> list:
+    return get_target_tokens_for_exchange("Binance")
+
+def get_target_tokens_for_OKX() -> list:
+    return get_target_tokens_for_exchange("OKX")
 
 def get_target_tokens_for_synthetix() -> list:
-    try:
-        symbols = [token["token"] for token in TARGET_TOKENS if token["is_target"]]
-        return symbols
-    except Exception as e:
-        logger.error(f"MasterAPICallerUtils - Error retrieving target tokens for Synthetix: {e}")
-        return []
+    return get_target_tokens_for_exchange("Synthetix")
 
 def get_target_tokens_for_bybit() -> list:
-    try:
-        symbols = [token["token"] + "USDT" for token in TARGET_TOKENS if token["is_target"]]
-        return symbols
-    except Exception as e:
-        logger.error(f"MasterAPICallerUtils - Error retrieving target tokens for ByBit: {e}")
-        return []
+    return get_target_tokens_for_exchange("ByBit")
 
 def get_target_tokens_for_HMX() -> list:
-    try:
-        symbols = [token["token"] + "USD" for token in TARGET_TOKENS if token["is_target"]]
-        return symbols
-    except Exception as e:
-        logger.error(f"MasterAPICallerUtils - Error retrieving target tokens for ByBit: {e}")
-        return []
+    return get_target_tokens_for_exchange("HMX")
 
 def get_target_tokens_for_GMX() -> list:
-    try:
-        symbols = [token["token"] for token in TARGET_TOKENS if token["is_target"]]
-        return symbols
-    except Exception as e:
-        logger.error(f"MasterAPICallerUtils - Error retrieving target tokens for GMX: {e}")
-        return []
\ No newline at end of file
+    return get_target_tokens_for_exchange("GMX")
@@ -0,0 +1,77 @@
+from GlobalUtils.logger import logger
+from GlobalUtils.ExchangeAdapters import ExchangeAdapterRegistry
+import importlib
+import threading
+import time
+
+class ClientRegistry:
+    """
+    Builds shared exchange clients on first use instead of at import time. Factories are registered
+    as (module path, function name) pairs so that neither the SDK nor its network handshake is touched
+    for venues the bot never calls.
+    """
+    _factories = {}
+    _clients = {}
+    _lock = threading.RLock()
+
+    @classmethod
+    def register(cls, name: str, module_path: str, factory_name: str):
+        with cls._lock:
+            cls._factories[name] = (module_path, factory_name)
+
+    @classmethod
+    def get(cls, name: str):
+        client = cls._clients.get(name)
+        if client is not None:
+            return client
+
+        with cls._lock:
+            client = cls._clients.get(name)
+            if client is None:
+                module_path, factory_name = cls._factories[name]
+                start_time = time.perf_counter()
+                factory = getattr(importlib.import_module(module_path), factory_name)
+                client = factory()
+                cls._clients[name] = client
+                logger.info(f'ClientRegistry - Built {name} client in {time.perf_counter() - start_time:.2f}s')
+            return client
+
+    @classmethod
+    def is_built(cls, name: str) -> bool:
+        return name in cls._clients
+
+    @classmethod
+    def get_built_clients(cls) -> list:
+        return list(cls._clients.keys())
+
+
+ClientRegistry.register('Synthetix', 'APICaller.Synthetix.SynthetixUtils', 'get_synthetix_client')
+ClientRegistry.register('Binance', 'APICaller.Binance.binanceUtils', 'get_binance_client')
+ClientRegistry.register('HMX', 'APICaller.HMX.HMXCallerUtils', 'get_HMX_client')
+ClientRegistry.register('ByBit', 'APICaller.ByBit.ByBitUtils', 'get_ByBit_client')
+ClientRegistry.register('GMX', 'APICaller.GMX.GMXCallerUtils', 'get_config_object')
+ClientRegistry.register('GMXDatastore', 'APICaller.GMX.GMXContractUtils', 'build_datastore_contract_object')
+ClientRegistry.register('GMXReader', 'APICaller.GMX.GMXContractUtils', 'build_reader_contract_object')
+ClientRegistry.register('GMXMulticall', 'APICaller.GMX.GMXContractUtils', 'build_multicall_contract_object')
+ClientRegistry.register('Pyth', 'GlobalUtils.PythPriceClient', 'build_pyth_price_client')
+ClientRegistry.register('GMXDataGetter', 'GlobalUtils.MarketDirectories.GMXMarketDirectory', 'build_gmx_data_getter')
+
+
+class LazyExchangeObjects:
+    """
+    Mixin for the master classes: self.<exchange name in lower case> builds that venue's
+    _exchange_role object from the ExchangeAdapterRegistry on first access, so only the venues
+    actually used are constructed.
+    """
+    _exchange_role = None
+    _exchange_build_lock = threading.RLock()
+
+    def __getattr__(self, name: str):
+        exchange_name = ExchangeAdapterRegistry.get_name_for_attribute(name)
+        if exchange_name is None or type(self)._exchange_role is None:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+        with type(self)._exchange_build_lock:
+            if name not in self.__dict__:
+                self.__dict__[name] = ExchangeAdapterRegistry.build(exchange_name, type(self)._exchange_role)
+            return self.__dict__[name]
@@ -0,0 +1,147 @@
+from GlobalUtils.logger import logger
+from pubsub import pub
+from typing import Callable
+import functools
+import bisect
+import threading
+import queue
+import time
+import os
+
+DEFAULT_EVENT_BUS_QUEUE_SIZE = 1000
+DEFAULT_EVENT_BUS_PUT_TIMEOUT_SECONDS = 0.5
+
+# Upper bounds (milliseconds) of the publish-to-handler delivery latency histogram buckets; the last bucket is open-ended.
+EVENT_DELIVERY_LATENCY_BUCKETS_MS = [1, 5, 10, 50, 100, 500, 1000, 5000]
+
+
+class TopicWorker:
+    """
+    One bounded queue and one daemon thread per topic, so events on a topic are handled in the order
+    they were published and a slow handler only delays its own topic.
+    """
+    def __init__(self, topic: str, queue_size: int, put_timeout_seconds: float):
+        self.topic = topic
+        self.put_timeout_seconds = put_timeout_seconds
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._lock = threading.Lock()
+        self._enqueued = 0
+        self._delivered = 0
+        self._dropped = 0
+        self._failed = 0
+        self._max_queue_depth = 0
+        self._latency_bucket_counts = [0] * (len(EVENT_DELIVERY_LATENCY_BUCKETS_MS) + 1)
+        self._latency_total_ms = 0.0
+        self._latency_max_ms = 0.0
+        self._handler_max_seconds = 0.0
+        self._thread = threading.Thread(target=self._run, name=f'EventBus-{topic}', daemon=True)
+        self._thread.start()
+
+    def put(self, handler: Callable, kwargs: dict) -> bool:
+        try:
+            # A full queue briefly blocks the publisher, then sheds the event rather than stall it further.
+            self._queue.put((handler, kwargs, time.monotonic()), timeout=self.put_timeout_seconds)
+        except queue.Full:
+            with self._lock:
+                self._dropped += 1
+            logger.error(f"EventBus - Queue for {self.topic} is full, dropped event for {getattr(handler, '__qualname__', handler)}.")
+            return False
+
+        with self._lock:
+            self._enqueued += 1
+            self._max_queue_depth = max(self._max_queue_depth, self._queue.qsize())
+        return True
+
+    def _run(self):
+        while True:
+            handler, kwargs, enqueued_at = self._queue.get()
+            started_at = time.monotonic()
+            try:
+                handler(**kwargs)
+                is_failed = False
+            except Exception as e:
+                is_failed = True
+                logger.error(f"EventBus - Handler {getattr(handler, '__qualname__', handler)} failed on {self.topic}. Error: {e}")
+
+            self._record_delivery((started_at - enqueued_at) * 1000, time.monotonic() - started_at, is_failed)
+            self._queue.task_done()
+
+    def _record_delivery(self, latency_ms: float, handler_seconds: float, is_failed: bool):
+        with self._lock:
+            self._delivered += 1
+            if is_failed:
+                self._failed += 1
+            self._latency_bucket_counts[bisect.bisect_left(EVENT_DELIVERY_LATENCY_BUCKETS_MS, latency_ms)] += 1
+            self._latency_total_ms += latency_ms
+            self._latency_max_ms = max(self._latency_max_ms, latency_ms)
+            self._handler_max_seconds = max(self._handler_max_seconds, handler_seconds)
+
+    def join(self):
+        self._queue.join()
+
+    def get_metrics(self) -> dict:
+        with self._lock:
+            bucket_labels = [f'<={bound}ms' for bound in EVENT_DELIVERY_LATENCY_BUCKETS_MS] + [f'>{EVENT_DELIVERY_LATENCY_BUCKETS_MS[-1]}ms']
+            return {
+                'enqueued': self._enqueued,
+                'delivered': self._delivered,
+                'dropped': self._dropped,
+                'failed': self._failed,
+                'queue_depth': self._queue.qsize(),
+                'max_queue_depth': self._max_queue_depth,
+                'latency_buckets': dict(zip(bucket_labels, self._latency_bucket_counts)),
+                'average_latency_ms': self._latency_total_ms / self._delivered if self._delivered else None,
+                'max_latency_ms': self._latency_max_ms,
+                'max_handler_seconds': self._handler_max_seconds
+            }
+
+
+class EventBus:
+    """
+    Asynchronous delivery on top of the pubsub topics in EventsDirectory. Publishers keep calling
+    pub.sendMessage unchanged; a handler subscribed here is registered with pubsub through a stand-in
+    listener that only enqueues the message on the topic's worker queue, so sendMessage returns
+    without waiting for it. Handlers that must complete before the publisher continues stay on
+    pub.subscribe.
+    """
+    _workers = {}
+    _listeners = []
+    _lock = threading.Lock()
+    _queue_size = int(os.getenv('EVENT_BUS_QUEUE_SIZE') or DEFAULT_EVENT_BUS_QUEUE_SIZE)
+    _put_timeout_seconds = float(os.getenv('EVENT_BUS_PUT_TIMEOUT_SECONDS') or DEFAULT_EVENT_BUS_PUT_TIMEOUT_SECONDS)
+
+    @classmethod
+    def subscribe(cls, handler: Callable, topic: str):
+        worker = cls._get_worker(topic)
+
+        # wraps() keeps the handler's signature visible to pubsub, which infers and checks topic arguments from it.
+        @functools.wraps(handler)
+        def enqueue(**kwargs):
+            worker.put(handler, kwargs)
+
+        with cls._lock:
+            # pubsub only holds weak references to listeners, so the stand-in has to be kept alive here.
+            cls._listeners.append(enqueue)
+        pub.subscribe(enqueue, topic)
+
+    @classmethod
+    def _get_worker(cls, topic: str) -> TopicWorker:
+        with cls._lock:
+            worker = cls._workers.get(topic)
+            if worker is None:
+                worker = TopicWorker(topic, cls._queue_size, cls._put_timeout_seconds)
+                cls._workers[topic] = worker
+            return worker
+
+    @classmethod
+    def wait_until_idle(cls, topic: str = None):
+        with cls._lock:
+            workers = [cls._workers[topic]] if topic is not None else list(cls._workers.values())
+        for worker in workers:
+            worker.join()
+
+    @classmethod
+    def get_metrics(cls) -> dict:
+        with cls._lock:
+            workers = dict(cls._workers)
+        return {topic: worker.get_metrics() for topic, worker in workers.items()}
@@ -0,0 +1,133 @@
+from GlobalUtils.logger import logger
+from typing import Callable, NamedTuple
+import importlib
+import threading
+
+ADAPTER_ROLES = ('caller', 'controller', 'monitor')
+
+class ExchangeAdapter(NamedTuple):
+    name: str
+    caller: tuple
+    controller: tuple
+    monitor: tuple
+    format_symbol: Callable[[str], str]
+    profit_model: str
+    neutralization_model: str = None
+
+def format_plain_symbol(token: str) -> str:
+    return token
+
+def format_usdt_symbol(token: str) -> str:
+    return token + 'USDT'
+
+def format_usd_symbol(token: str) -> str:
+    return token + 'USD'
+
+def format_okx_swap_symbol(token: str) -> str:
+    return token + '-USDT-SWAP'
+
+
+class ExchangeAdapterRegistry:
+    """
+    Single table describing every venue: where its caller, position controller and position monitor
+    live, how a base token is formatted into its symbol, and which ProfitabilityChecker methods price
+    its leg. The master classes dispatch through this table, so adding a venue means registering it here.
+    Roles are (module path, class name) pairs and are only imported when first built.
+    """
+    _adapters = {}
+    _names_by_attribute = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def register(cls, adapter: ExchangeAdapter):
+        with cls._lock:
+            cls._adapters[adapter.name] = adapter
+            cls._names_by_attribute[adapter.name.lower()] = adapter.name
+
+    @classmethod
+    def get(cls, exchange: str) -> ExchangeAdapter:
+        return cls._adapters.get(exchange)
+
+    @classmethod
+    def is_registered(cls, exchange: str) -> bool:
+        return exchange in cls._adapters
+
+    @classmethod
+    def get_registered_exchanges(cls) -> list:
+        return list(cls._adapters.keys())
+
+    @classmethod
+    def get_name_for_attribute(cls, attribute_name: str) -> str:
+        return cls._names_by_attribute.get(attribute_name)
+
+    @classmethod
+    def format_symbol(cls, exchange: str, token: str) -> str:
+        return cls._adapters[exchange].format_symbol(token)
+
+    @classmethod
+    def build(cls, exchange: str, role: str):
+        if role not in ADAPTER_ROLES:
+            raise ValueError(f'Unknown adapter role {role}')
+
+        module_path, class_name = getattr(cls._adapters[exchange], role)
+        exchange_class = getattr(importlib.import_module(module_path), class_name)
+        logger.info(f'ExchangeAdapterRegistry - Building {exchange} {role}')
+        return exchange_class()
+
+
+ExchangeAdapterRegistry.register(ExchangeAdapter(
+    name='Synthetix',
+    caller=('APICaller.Synthetix.SynthetixCaller', 'SynthetixCaller'),
+    controller=('TxExecution.Synthetix.SynthetixPositionController', 'SynthetixPositionController'),
+    monitor=('PositionMonitor.Synthetix.SynthetixPositionMonitor', 'SynthetixPositionMonitor'),
+    format_symbol=format_plain_symbol,
+    profit_model='estimate_synthetix_profit',
+    neutralization_model='estimate_time_to_neutralize_synthetix'
+))
+
+ExchangeAdapterRegistry.register(ExchangeAdapter(
+    name='Binance',
+    caller=('APICaller.Binance.binanceCaller', 'BinanceCaller'),
+    controller=('TxExecution.Binance.BinancePositionController', 'BinancePositionController'),
+    monitor=('PositionMonitor.Binance.BinancePositionMonitor', 'BinancePositionMonitor'),
+    format_symbol=format_usdt_symbol,
+    profit_model='estimate_binance_profit'
+))
+
+ExchangeAdapterRegistry.register(ExchangeAdapter(
+    name='ByBit',
+    caller=('APICaller.ByBit.ByBitCaller', 'ByBitCaller'),
+    controller=('TxExecution.ByBit.ByBitPositionController', 'ByBitPositionController'),
+    monitor=('PositionMonitor.ByBit.ByBitPositionMonitor', 'ByBitPositionMonitor'),
+    format_symbol=format_usdt_symbol,
+    profit_model='estimate_bybit_profit'
+))
+
+ExchangeAdapterRegistry.register(ExchangeAdapter(
+    name='HMX',
+    caller=('APICaller.HMX.HMXCaller', 'HMXCaller'),
+    controller=('TxExecution.HMX.HMXPositionController', 'HMXPositionController'),
+    monitor=('PositionMonitor.HMX.HMXPositionMonitor', 'HMXPositionMonitor'),
+    format_symbol=format_usd_symbol,
+    profit_model='estimate_hmx_profit',
+    neutralization_model='estimate_time_to_neutralize_hmx'
+))
+
+ExchangeAdapterRegistry.register(ExchangeAdapter(
+    name='OKX',
+    caller=('APICaller.Okx.okxCaller', 'OKXCaller'),
+    controller=('TxExecution.OKX.OKXPositionController', 'OKXPositionController'),
+    monitor=('PositionMonitor.OKX.OKXPositionMonitor', 'OKXPositionMonitor'),
+    format_symbol=format_okx_swap_symbol,
+    profit_model='estimate_okx_profit'
+))
+
+ExchangeAdapterRegistry.register(ExchangeAdapter(
+    name='GMX',
+    caller=('APICaller.GMX.GMXCaller', 'GMXCaller'),
+    controller=('TxExecution.GMX.GMXPositionController', 'GMXPositionController'),
+    monitor=('PositionMonitor.GMX.GMXPositionMonitor', 'GMXPositionMonitor'),
+    format_symbol=format_plain_symbol,
+    profit_model='estimate_GMX_profit',
+    neutralization_model='estimate_time_to_neutralize_gmx'
+))
@@ -0,0 +1,140 @@
+from GlobalUtils.logger import logger
+from web3.exceptions import TransactionNotFound
+from typing import Callable
+import bisect
+import threading
+import time
+
+# Upper bounds (seconds) of the time-to-fill histogram buckets; the last bucket is open-ended.
+FILL_LATENCY_BUCKETS_SECONDS = [0.25, 0.5, 1, 2, 4, 8, 16, 32, 64]
+
+# Total time each venue's leg is given to make a fill observable, across all of its stages, before it is treated as
+# unfilled. Keep every budget below LEG_EXECUTION_DEADLINE_SECONDS so a slow but valid fill is not taken for a late leg.
+FILL_TIMEOUT_SECONDS_BY_VENUE = {
+    "Synthetix": 45,
+    "Binance": 10,
+    "ByBit": 10,
+    "HMX": 45,
+    "OKX": 10,
+    "GMX": 45,
+}
+
+DEFAULT_FILL_TIMEOUT_SECONDS = 30
+INITIAL_POLL_INTERVAL_SECONDS = 0.25
+MAX_POLL_INTERVAL_SECONDS = 2.0
+POLL_BACKOFF_FACTOR = 2.0
+
+def get_fill_timeout_for_venue(venue: str) -> float:
+    return float(FILL_TIMEOUT_SECONDS_BY_VENUE.get(venue, DEFAULT_FILL_TIMEOUT_SECONDS))
+
+
+class FillConfirmation:
+    """
+    Replaces fixed post-submission sleeps: the caller supplies a check that returns something truthy
+    once the fill (or receipt) is observable, and it is polled with exponential back-off until then
+    or until the venue's timeout. Time-to-fill is recorded per venue and stage in a histogram.
+    """
+    _histograms = {}
+    _timeouts = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def wait_for(
+        cls,
+        venue: str,
+        check: Callable,
+        timeout_seconds: float = None,
+        stage: str = 'fill',
+        initial_interval_seconds: float = INITIAL_POLL_INTERVAL_SECONDS,
+        max_interval_seconds: float = MAX_POLL_INTERVAL_SECONDS
+    ):
+        if timeout_seconds is None:
+            timeout_seconds = get_fill_timeout_for_venue(venue)
+
+        start_time = time.monotonic()
+        deadline = start_time + timeout_seconds
+        interval_seconds = initial_interval_seconds
+
+        while True:
+            try:
+                result = check()
+                if result:
+                    cls.record(venue, stage, time.monotonic() - start_time)
+                    return result
+            except Exception as e:
+                logger.error(f"FillConfirmation - {venue} {stage} check raised, retrying. Error: {e}")
+
+            remaining_seconds = deadline - time.monotonic()
+            if remaining_seconds <= 0:
+                cls.record_timeout(venue, stage)
+                logger.error(f"FillConfirmation - {venue} {stage} not observed within {timeout_seconds}s.")
+                return None
+
+            time.sleep(min(interval_seconds, remaining_seconds))
+            interval_seconds = min(interval_seconds * POLL_BACKOFF_FACTOR, max_interval_seconds)
+
+    @classmethod
+    def wait_for_receipt(cls, venue: str, web3_object, tx_hash, timeout_seconds: float = None, stage: str = 'receipt') -> dict:
+        def get_receipt():
+            try:
+                return web3_object.eth.get_transaction_receipt(tx_hash)
+            except TransactionNotFound:
+                return None
+
+        receipt = cls.wait_for(venue, get_receipt, timeout_seconds, stage)
+        if receipt is None:
+            return None
+
+        if receipt['status'] != 1:
+            logger.error(f"FillConfirmation - {venue} transaction {tx_hash} reverted.")
+            return None
+
+        return receipt
+
+    @classmethod
+    def record(cls, venue: str, stage: str, elapsed_seconds: float):
+        with cls._lock:
+            histogram = cls._histograms.get((venue, stage))
+            if histogram is None:
+                histogram = {
+                    'bucket_counts': [0] * (len(FILL_LATENCY_BUCKETS_SECONDS) + 1),
+                    'count': 0,
+                    'total_seconds': 0.0,
+                    'max_seconds': 0.0
+                }
+                cls._histograms[(venue, stage)] = histogram
+
+            histogram['bucket_counts'][bisect.bisect_left(FILL_LATENCY_BUCKETS_SECONDS, elapsed_seconds)] += 1
+            histogram['count'] += 1
+            histogram['total_seconds'] += elapsed_seconds
+            histogram['max_seconds'] = max(histogram['max_seconds'], elapsed_seconds)
+
+        logger.info(f"FillConfirmation - {venue} {stage} observed after {elapsed_seconds:.2f}s")
+
+    @classmethod
+    def record_timeout(cls, venue: str, stage: str):
+        with cls._lock:
+            cls._timeouts[(venue, stage)] = cls._timeouts.get((venue, stage), 0) + 1
+
+    @classmethod
+    def get_histogram(cls, venue: str, stage: str = 'fill') -> dict:
+        with cls._lock:
+            histogram = cls._histograms.get((venue, stage))
+            timeouts = cls._timeouts.get((venue, stage), 0)
+            if histogram is None:
+                return {'count': 0, 'timeouts': timeouts}
+
+            bucket_labels = [f'<={bound}s' for bound in FILL_LATENCY_BUCKETS_SECONDS] + [f'>{FILL_LATENCY_BUCKETS_SECONDS[-1]}s']
+            return {
+                'buckets': dict(zip(bucket_labels, histogram['bucket_counts'])),
+                'count': histogram['count'],
+                'average_seconds': histogram['total_seconds'] / histogram['count'],
+                'max_seconds': histogram['max_seconds'],
+                'timeouts': timeouts
+            }
+
+    @classmethod
+    def get_all_histograms(cls) -> dict:
+        with cls._lock:
+            keys = set(cls._histograms.keys()) | set(cls._timeouts.keys())
+        return {f'{venue}:{stage}': cls.get_histogram(venue, stage) for venue, stage in sorted(keys)}
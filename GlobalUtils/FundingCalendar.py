@@ -0,0 +1,103 @@
+from GlobalUtils.logger import logger
+import numpy as np
+import threading
+import time
+
+class FundingCalendar:
+    """
+    Next settlement time and interval per (exchange, symbol), loaded in bulk once per cycle by the
+    exchange callers, so counting funding events inside a horizon needs no API calls.
+    """
+    _schedules = {}
+    _loaded_at = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def update_schedule(cls, exchange: str, schedule: dict):
+        """
+        schedule: {symbol: (next_funding_time_ms, funding_interval_hours)}
+        """
+        try:
+            with cls._lock:
+                cls._schedules[exchange] = dict(schedule)
+                cls._loaded_at[exchange] = time.time()
+        except Exception as e:
+            logger.error(f"FundingCalendar - Failed to update funding schedule for {exchange}. Error: {e}")
+
+    @classmethod
+    def has_schedule(cls, exchange: str, symbol: str) -> bool:
+        return symbol in cls._schedules.get(exchange, {})
+
+    @classmethod
+    def get_next_funding_time(cls, exchange: str, symbol: str, now_ms: int = None) -> int:
+        try:
+            next_funding_time_ms, interval_hours = cls._schedules[exchange][symbol]
+            if now_ms is None:
+                now_ms = int(time.time() * 1000)
+
+            # The schedule is loaded once per cycle, so roll a settlement that has already passed forward.
+            interval_ms = interval_hours * 3_600_000
+            if next_funding_time_ms <= now_ms:
+                missed_intervals = (now_ms - next_funding_time_ms) // interval_ms + 1
+                next_funding_time_ms += missed_intervals * interval_ms
+
+            return int(next_funding_time_ms)
+
+        except KeyError:
+            logger.error(f"FundingCalendar - No funding schedule for {exchange} {symbol}.")
+            return None
+
+    @classmethod
+    def count_events(cls, exchange: str, symbol: str, time_period_hours: float, now_ms: int = None) -> int:
+        try:
+            if now_ms is None:
+                now_ms = int(time.time() * 1000)
+            next_funding_time_ms = cls.get_next_funding_time(exchange, symbol, now_ms)
+            if next_funding_time_ms is None:
+                return None
+
+            interval_hours = cls._schedules[exchange][symbol][1]
+            hours_to_next_funding_event = (next_funding_time_ms - now_ms) / 3_600_000
+            remaining_hours = time_period_hours - hours_to_next_funding_event
+            if remaining_hours < 0:
+                return 0
+
+            return 1 + int(remaining_hours // interval_hours)
+
+        except Exception as e:
+            logger.error(f"FundingCalendar - Error while counting funding events for {exchange} {symbol}. Error: {e}")
+            return None
+
+    @classmethod
+    def count_events_for_horizons(cls, exchange: str, symbols: list, horizons_hours, now_ms: int = None) -> np.ndarray:
+        """
+        Returns a len(symbols) x len(horizons_hours) matrix of settlement counts. Symbols without a
+        schedule are filled with -1.
+        """
+        try:
+            if now_ms is None:
+                now_ms = int(time.time() * 1000)
+            horizons = np.asarray(horizons_hours, dtype=np.float64)
+
+            hours_to_next = np.full(len(symbols), np.nan)
+            intervals = np.full(len(symbols), np.nan)
+            for i, symbol in enumerate(symbols):
+                next_funding_time_ms = cls.get_next_funding_time(exchange, symbol, now_ms) if cls.has_schedule(exchange, symbol) else None
+                if next_funding_time_ms is not None:
+                    hours_to_next[i] = (next_funding_time_ms - now_ms) / 3_600_000
+                    intervals[i] = cls._schedules[exchange][symbol][1]
+
+            remaining_hours = horizons[np.newaxis, :] - hours_to_next[:, np.newaxis]
+            with np.errstate(invalid='ignore'):
+                counts = np.where(remaining_hours < 0, 0, 1 + np.floor(remaining_hours / intervals[:, np.newaxis]))
+
+            return np.where(np.isnan(counts), -1, counts).astype(np.int64)
+
+        except Exception as e:
+            logger.error(f"FundingCalendar - Error while counting funding events across horizons for {exchange}. Error: {e}")
+            return None
+
+    @classmethod
+    def get_schedule_age_seconds(cls, exchange: str) -> float:
+        loaded_at = cls._loaded_at.get(exchange)
+        return time.time() - loaded_at if loaded_at is not None else None
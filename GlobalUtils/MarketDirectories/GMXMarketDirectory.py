@@ -3,121 +3,181 @@ import json
 from GlobalUtils.globalUtils import *
 from gmx_python_sdk.scripts.v2.get.get import GetData
 from gmx_python_sdk.scripts.v2.gmx_utils import *
-from APICaller.GMX.GMXCallerUtils import ARBITRUM_CONFIG_OBJECT
+from APICaller.GMX.GMXCallerUtils import get_arbitrum_config
 from APICaller.GMX.GMXContractUtils import *
+from APICaller.GMX.GMXMarketSnapshot import GMXMarketSnapshot
+from APICaller.GMX.GMXPriceImpactModel import GMXPriceImpactModel
+from types import MappingProxyType
+from typing import NamedTuple
+import threading
+import os
+
+DEFAULT_GMX_MARKET_REFRESH_SECONDS = 3600
+
+MARKET_PARAMETER_KEY_FUNCTIONS = {
+    "min_collateral_factor": minCollateralFactorKey,
+    "funding_exponent": funding_exponent_factor_key,
+    "funding_factor": funding_factor_key,
+    "funding_increase_factor": funding_increase_factor_key,
+    "funding_decrease_factor": funding_decrease_factor_key,
+    "threshold_for_stable_funding": threshold_for_stable_funding_key,
+    "threshold_for_decrease_funding": threshold_for_decrease_funding_key
+}
+
+class GMXMarket(NamedTuple):
+    market: str
+    market_key: str
+    maker_fee_percent: float = 0.05
+    taker_fee_percent: float = 0.07
+    min_collateral_factor: float = None
+    funding_exponent: float = None
+    funding_factor: float = None
+    funding_increase_factor: float = None
+    funding_decrease_factor: float = None
+    threshold_for_stable_funding: float = None
+    threshold_for_decrease_funding: float = None
+
+class GMXMarketIndex(NamedTuple):
+    markets_by_symbol: MappingProxyType
+    market_key_by_symbol: MappingProxyType
+    symbol_by_market_key: MappingProxyType
+
+def build_gmx_market_index(markets_by_symbol: dict, market_key_by_symbol: dict) -> GMXMarketIndex:
+    return GMXMarketIndex(
+        markets_by_symbol=MappingProxyType(dict(markets_by_symbol)),
+        market_key_by_symbol=MappingProxyType(dict(market_key_by_symbol)),
+        symbol_by_market_key=MappingProxyType({market_key: symbol for symbol, market_key in market_key_by_symbol.items()})
+    )
+
+def build_gmx_data_getter() -> GetData:
+    return GetData(config=get_arbitrum_config())
 
 class GMXMarketDirectory:
-    _markets = {}
+    """
+    Lookups read one immutable GMXMarketIndex; refreshes build a new index and swap it in with a
+    single assignment, so the monitor thread never sees a half-updated directory.
+    """
+    _index = build_gmx_market_index({}, {})
     _file_path = 'GMXmarkets.json'
     _is_initialized = False
-    _symbol_to_market_key_mapping = {}
-    _data_getter = GetData(config=ARBITRUM_CONFIG_OBJECT)
+    _refresh_lock = threading.RLock()
+    _refresh_thread = None
+    _refresh_stop_event = threading.Event()
+    _refresh_seconds = float(os.getenv('GMX_MARKET_REFRESH_SECONDS') or DEFAULT_GMX_MARKET_REFRESH_SECONDS)
 
     @classmethod
     def initialize(cls):
         try:
             if not cls._is_initialized:
-                cls._symbol_to_market_key_mapping = cls.build_symbol_to_market_id_mapping()
-                # cls.update_all_market_parameters()
+                cls._index = build_gmx_market_index(cls._index.markets_by_symbol, cls.build_symbol_to_market_id_mapping() or {})
                 cls._is_initialized = True
+                cls.load_markets_from_file()
+                cls.update_all_market_parameters()
+                cls.start_refresh()
                 logger.info('GMXMarketDirectory - Markets Initialized')
-                with open(cls._file_path, 'r') as file:
-                    cls._markets = json.load(file)
                     
-        except FileNotFoundError:
-            logger.error("GMXMarketDirectory - No existing market file found. Starting fresh.")
         except json.JSONDecodeError:
             logger.error("GMXMarketDirectory - Error decoding JSON. Starting with an empty dictionary.")
 
+    @classmethod
+    def get_data_getter(cls) -> GetData:
+        return ClientRegistry.get('GMXDataGetter')
+
     @classmethod
     def save_market_to_file(cls):
         try:
-            with open(cls._file_path, 'w') as file:
-                json.dump(cls._markets, file)
+            write_json_atomically(
+                cls._file_path,
+                {symbol: market._asdict() for symbol, market in cls._index.markets_by_symbol.items()}
+            )
         except Exception as e:
             logger.error(f"GMXMarketDirectory - Failed to save markets to file: {e}")
     
     @classmethod
     def load_markets_from_file(cls):
         try:
-            with open('GMXmarkets.json', 'r') as f:
-                cls._markets = json.load(f)
+            with open(cls._file_path, 'r') as f:
+                markets = json.load(f)
+            cls._index = build_gmx_market_index(
+                {symbol: GMXMarket(**market) for symbol, market in markets.items()},
+                cls._index.market_key_by_symbol
+            )
         except FileNotFoundError:
             logger.error("MarketDirectory - Market file not found. Starting with an empty dictionary.")
-            cls._markets = {}
+            cls._index = build_gmx_market_index({}, cls._index.market_key_by_symbol)
     
     @classmethod
     def update_all_market_parameters(cls):
         try:
-            mapper = []
-            output_list = []
-
-            for market_key in cls._data_getter.markets.info:
-                symbol = cls._data_getter.markets.get_market_symbol(market_key)
-                index_token_address = cls._data_getter.markets.get_index_token_address(
-                    market_key
-                )
-                if index_token_address == NULL_ADDRESS:
-                    continue
-
-                cls._data_getter._get_token_addresses(market_key)
-
-                output = cls._data_getter._get_oracle_prices(
-                market_key,
-                index_token_address,
-            )
-
-                mapper.append(symbol)
-                output_list.append(output)
-
-            # Multithreaded call on contract
-            threaded_output = execute_threading(output_list)
-            for (
-                output,
-                symbol
-            ) in zip(
-                threaded_output,
-                mapper
-            ):
-
-                market_key = cls._symbol_to_market_key_mapping[symbol]
-                min_collateral_factor = get_min_collateral_factor(market_key)
-                funding_exponent = get_funding_exponent(market_key)
-                funding_factor = get_funding_factor(market_key)
-                funding_increase_factor = get_funding_increase_factor(market_key)
-                funding_decrease_factor = get_funding_decrease_factor(market_key)
-                threshold_for_stable_funding = get_threshold_for_decrease_funding(market_key)
-                threshold_for_decrease_funding = get_threshold_for_decrease_funding(market_key)
-                
-                market_info_dict = {
-                    "market": symbol,
-                    "market_key": market_key,
-                    "maker_fee_percent": 0.05,
-                    "taker_fee_percent": 0.07,
-                    "min_collateral_factor": min_collateral_factor,
-                    "funding_exponent": funding_exponent,
-                    "funding_factor": funding_factor,
-                    "funding_increase_factor": funding_increase_factor,
-                    "funding_decrease_factor": funding_decrease_factor,
-                    "threshold_for_stable_funding": threshold_for_stable_funding,
-                    "threshold_for_decrease_funding": threshold_for_decrease_funding
-                }
-
-                cls._markets[symbol] = market_info_dict
-            
-            cls.save_market_to_file()
-            return
+            with cls._refresh_lock:
+                index = cls._index
+                markets_info = cls.get_data_getter().markets
+                market_keys_by_symbol = {}
+                for market_key in markets_info.info:
+                    index_token_address = markets_info.get_index_token_address(market_key)
+                    if index_token_address == NULL_ADDRESS:
+                        continue
+                    symbol = markets_info.get_market_symbol(market_key)
+                    market_keys_by_symbol[symbol] = market_key
+
+                new_symbols = set(market_keys_by_symbol) - set(index.market_key_by_symbol)
+                if new_symbols:
+                    logger.info(f'GMXMarketDirectory - Adding newly listed markets to the index: {sorted(new_symbols)}')
+
+                keys = [
+                    key_function(market_key)
+                    for market_key in market_keys_by_symbol.values()
+                    for key_function in MARKET_PARAMETER_KEY_FUNCTIONS.values()
+                ]
+                values = get_datastore_uints(keys)
+                if values is None:
+                    logger.error('GMXMarketDirectory - Multicall returned no market parameters, keeping existing markets.')
+                    return None
+
+                markets = dict(index.markets_by_symbol)
+                parameters_per_market = len(MARKET_PARAMETER_KEY_FUNCTIONS)
+                for position, (symbol, market_key) in enumerate(market_keys_by_symbol.items()):
+                    market_values = values[position * parameters_per_market:(position + 1) * parameters_per_market]
+                    parameters = {
+                        parameter: value / 10**30 if value is not None else None
+                        for parameter, value in zip(MARKET_PARAMETER_KEY_FUNCTIONS, market_values)
+                    }
+                    markets[symbol] = GMXMarket(market=symbol, market_key=market_key, **parameters)
+
+                cls._index = build_gmx_market_index(markets, {**index.market_key_by_symbol, **market_keys_by_symbol})
+                cls.save_market_to_file()
+                logger.info(f'GMXMarketDirectory - Refreshed parameters for {len(market_keys_by_symbol)} markets ({len(keys)} datastore keys via multicall).')
+                return
             
         except Exception as e:
             logger.error(f"GMXMarketDirectory - Failed to fetch market parameters. Error: {e}", exc_info=True)
             return None
+
+    @classmethod
+    def start_refresh(cls):
+        with cls._refresh_lock:
+            if cls._refresh_thread is not None and cls._refresh_thread.is_alive():
+                return
+            cls._refresh_stop_event.clear()
+            cls._refresh_thread = threading.Thread(target=cls._run_refresh, name='GMXMarketDirectoryRefresh', daemon=True)
+            cls._refresh_thread.start()
+
+    @classmethod
+    def stop_refresh(cls):
+        cls._refresh_stop_event.set()
+
+    @classmethod
+    def _run_refresh(cls):
+        while not cls._refresh_stop_event.wait(cls._refresh_seconds):
+            cls.update_all_market_parameters()
     
     @classmethod
     def calculate_new_funding_velocity(cls, symbol: str, absolute_trade_size_usd: float, is_long: bool, open_interest: dict) -> float:
         try:
-            threshold_for_decrease_funding = cls._markets[symbol]['threshold_for_decrease_funding']
-            threshold_for_stable_funding = cls._markets[symbol]['threshold_for_stable_funding']
-            funding_increase_factor = cls._markets[symbol]['funding_increase_factor']
+            market = cls._index.markets_by_symbol[symbol]
+            threshold_for_decrease_funding = market.threshold_for_decrease_funding
+            threshold_for_stable_funding = market.threshold_for_stable_funding
+            funding_increase_factor = market.funding_increase_factor
             long_open_interest = open_interest['long'][symbol]
             short_open_interest = open_interest['short'][symbol]
 
@@ -164,7 +224,27 @@ class GMXMarketDirectory:
             return None
     
     @classmethod
-    def get_price_impact_for_trade(cls, opportunity: dict, is_long: bool, absolute_trade_size_usd: float, prices: dict) -> float:
+    def get_price_impact_for_trade(cls, opportunity: dict, is_long: bool, absolute_trade_size_usd: float, snapshot: GMXMarketSnapshot) -> float:
+        try:
+            symbol = opportunity['symbol']
+            market = cls.get_market_key_for_symbol(symbol)
+            price_impact = GMXPriceImpactModel.get_price_impact_usd(
+                symbol,
+                market,
+                is_long,
+                absolute_trade_size_usd,
+                snapshot
+            )
+            price_impact = -price_impact
+
+            return price_impact
+        
+        except Exception as e:
+            logger.error(f"GMXMarketDirectory - Failed to calculate price impact for trade. Error: {e}", exc_info=True)
+            return None
+
+    @classmethod
+    def get_onchain_price_impact_for_trade(cls, opportunity: dict, is_long: bool, absolute_trade_size_usd: float, prices: dict) -> float:
         try:
             symbol = opportunity['symbol']
             index_token_address = get_index_token_address_for_symbol(symbol)
@@ -176,7 +256,7 @@ class GMXMarketDirectory:
 
             params = {
                 'data_store_address': (
-                    contract_map[ARBITRUM_CONFIG_OBJECT.chain]["datastore"]['contract_address']
+                    contract_map[get_arbitrum_config().chain]["datastore"]['contract_address']
                 ),
                 'market_key': market,
                 'index_token_price': [
@@ -190,7 +270,7 @@ class GMXMarketDirectory:
             }
 
             execution_price_data = get_execution_price_and_price_impact(
-                ARBITRUM_CONFIG_OBJECT,
+                get_arbitrum_config(),
                 params,
                 decimals
             )
@@ -218,28 +298,17 @@ class GMXMarketDirectory:
             return None
 
     @classmethod
-    def get_market_params(cls, symbol: str) -> dict:
-        try:
-            for key, value in cls._markets.items():
-                    if key == symbol:
-                        return value
-            return None
-        
-        except KeyError as ke:
-            logger.error(f"GMXMarketDirectory - KeyError while getting market params for {symbol} Error: {ke}")
-            return None
-        except Exception as e:
-            logger.error(f"GMXMarketDirectory - Failed to get market parameters for symbol from local storage. Error: {e}", exc_info=True)
-            return None
+    def get_market_params(cls, symbol: str) -> GMXMarket:
+        return cls._index.markets_by_symbol.get(symbol)
 
-    
     @classmethod
     def build_symbol_to_market_id_mapping(cls) -> dict:
         try:
             mapping = {}
 
-            for market_key in cls._data_getter.markets.info:
-                symbol = cls._data_getter.markets.get_market_symbol(market_key)
+            markets_info = cls.get_data_getter().markets
+            for market_key in markets_info.info:
+                symbol = markets_info.get_market_symbol(market_key)
                 mapping[symbol] = market_key
             
             return mapping
@@ -250,28 +319,15 @@ class GMXMarketDirectory:
     
     @classmethod
     def get_market_key_for_symbol(cls, symbol: str) -> str:
-        try:
-            market_key = str(cls._symbol_to_market_key_mapping[symbol])
-            return market_key
-        
-        except KeyError as ke:
-            logger.error(f"GMXMarketDirectory - KeyError while calling market key for symbol {symbol}. Error: {ke}")
-            return None
-        except Exception as e:
-            logger.error(f"GMXMarketDirectory - Error while calling market key for symbol {symbol}. Error: {e}")
+        market_key = cls._index.market_key_by_symbol.get(symbol)
+        if market_key is None:
+            logger.error(f"GMXMarketDirectory - No market key found for symbol {symbol}.")
             return None
+        return str(market_key)
     
     @classmethod
     def get_symbol_for_market_key(cls, market_key: str) -> str:
-        try:
-            for key, value in cls._symbol_to_market_key_mapping.items():
-                if value == market_key:
-                    return key
-            return None
-
-        except Exception as e:
-            logger.error(f"GMXMarketDirectory - Error while getting symbol for market key {market_key}. Error: {e}")
-            return None        
+        return cls._index.symbol_by_market_key.get(market_key)
 
     @classmethod
     def get_total_opening_fee(cls, symbol: str, skew_usd: float, is_long: bool, absolute_size_usd: float) -> float:
@@ -322,9 +378,9 @@ class GMXMarketDirectory:
     def get_maker_taker_fee(cls, symbol: str, skew_usd: float, is_long: bool, absolute_size_usd: float) -> list:
         try:
             market = cls.get_market_params(symbol)
-            maker_fee_percent = market['maker_fee_percent']
+            maker_fee_percent = market.maker_fee_percent
             maker_fee = maker_fee_percent / 100
-            taker_fee_percent = market['taker_fee_percent']
+            taker_fee_percent = market.taker_fee_percent
             taker_fee = taker_fee_percent / 100
 
             if is_long:
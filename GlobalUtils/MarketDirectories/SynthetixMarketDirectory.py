@@ -2,100 +2,184 @@ from web3 import *
 from dotenv import load_dotenv
 from GlobalUtils.logger import *
 from GlobalUtils.globalUtils import *
+from types import MappingProxyType
+from typing import NamedTuple
+import threading
 import json
+import os
 
 load_dotenv()
 
+DEFAULT_SYNTHETIX_MARKET_REFRESH_SECONDS = 300
+# A refresh that would drop more than this share of the known markets is treated as a bad response and not applied.
+MAX_REMOVED_MARKETS_FRACTION = 0.5
+
+class SynthetixMarket(NamedTuple):
+    symbol: str
+    market_id: int
+    max_funding_velocity: float
+    skew_scale: float
+    maker_fee: float
+    taker_fee: float
+
+class SynthetixMarketIndex(NamedTuple):
+    markets_by_symbol: MappingProxyType
+    symbol_by_market_id: MappingProxyType
+
+def build_synthetix_market_index(markets_by_symbol: dict) -> SynthetixMarketIndex:
+    return SynthetixMarketIndex(
+        markets_by_symbol=MappingProxyType(dict(markets_by_symbol)),
+        symbol_by_market_id=MappingProxyType({market.market_id: symbol for symbol, market in markets_by_symbol.items()})
+    )
+
 class SynthetixMarketDirectory:
-    _markets = {}
+    """
+    Lookups read one immutable SynthetixMarketIndex; refreshes build a new index and swap it in
+    with a single assignment, so readers on other threads always see a complete directory.
+    A background thread refreshes the index from markets_by_name and bumps the version whenever
+    fees, skew scale or funding velocity change.
+    """
+    _index = build_synthetix_market_index({})
+    _version = 0
     _file_path = 'synthetix_markets.json'
     _is_initialized = False
+    _refresh_lock = threading.RLock()
+    _refresh_thread = None
+    _refresh_stop_event = threading.Event()
+    _refresh_seconds = float(os.getenv('SYNTHETIX_MARKET_REFRESH_SECONDS') or DEFAULT_SYNTHETIX_MARKET_REFRESH_SECONDS)
 
     @classmethod
     def initialize(cls):
         try:
             if not cls._is_initialized:
+                cls.load_markets_from_file()
                 cls.update_all_market_parameters()
+                cls.start_refresh()
                 cls._is_initialized = True
                 logger.info('SynthetixMarketDirectory - Markets Initialized')
-                with open(cls._file_path, 'r') as file:
-                    cls._markets = json.load(file)
-        except FileNotFoundError:
-            logger.error("SynthetixMarketDirectory - No existing market file found. Starting fresh.")
         except json.JSONDecodeError:
             logger.error("SynthetixMarketDirectory - Error decoding JSON. Starting with an empty dictionary.")
 
     @classmethod
     def save_market_to_file(cls):
         try:
-            with open(cls._file_path, 'w') as file:
-                json.dump(cls._markets, file)
+            write_json_atomically(
+                cls._file_path,
+                {symbol: market._asdict() for symbol, market in cls._index.markets_by_symbol.items()}
+            )
         except Exception as e:
             logger.error(f"SynthetixMarketDirectory - Failed to save markets to file: {e}")
 
     @classmethod
     def load_markets_from_file(cls):
         try:
-            with open('markets.json', 'r') as f:
-                cls._markets = json.load(f)
+            with open(cls._file_path, 'r') as f:
+                markets = json.load(f)
+            cls._index = build_synthetix_market_index({symbol: SynthetixMarket(**market) for symbol, market in markets.items()})
         except FileNotFoundError:
             logger.error("SynthetixMarketDirectory - Market file not found. Starting with an empty dictionary.")
-            cls._markets = {}
+            cls._index = build_synthetix_market_index({})
+
+    @classmethod
+    def update_all_market_parameters(cls) -> bool:
+        try:
+            with cls._refresh_lock:
+                market_data_response = cls.fetch_markets_by_name()
+                markets = {}
+                for symbol, market_data in market_data_response.items():
+                    market = cls.build_market_record(market_data)
+                    markets[market.symbol] = market
+
+                current_markets = cls._index.markets_by_symbol
+                if not markets:
+                    logger.error('SynthetixMarketDirectory - Market refresh returned no markets, keeping the current index.')
+                    return False
+
+                changed_symbols = [symbol for symbol, market in markets.items() if current_markets.get(symbol) != market]
+                removed_symbols = [symbol for symbol in current_markets if symbol not in markets]
+                if not changed_symbols and not removed_symbols:
+                    return False
+                if current_markets and len(removed_symbols) > len(current_markets) * MAX_REMOVED_MARKETS_FRACTION:
+                    logger.error(f'SynthetixMarketDirectory - Market refresh would remove {len(removed_symbols)} of {len(current_markets)} markets, keeping the current index. Removed: {removed_symbols}')
+                    return False
+
+                cls._index = build_synthetix_market_index(markets)
+                cls._version += 1
+                cls.save_market_to_file()
+                logger.info(f'SynthetixMarketDirectory - Markets updated to version {cls._version}. Changed: {changed_symbols}, removed: {removed_symbols}')
+                return True
+
+        except Exception as e:
+            logger.error(f"SynthetixMarketDirectory - Failed to refresh market parameters. Error: {e}", exc_info=True)
+            return False
 
     @classmethod
     @deco_retry
-    def update_all_market_parameters(cls):
-        client = GLOBAL_SYNTHETIX_CLIENT
-        market_data_response = client.perps.markets_by_name
-        for symbol, market_data in market_data_response.items():
-            cls.update_market_member(market_data)
-            cls.save_market_to_file()
+    def fetch_markets_by_name(cls) -> dict:
+        _, markets_by_name = ClientRegistry.get('Synthetix').perps.get_markets()
+        return markets_by_name
 
     @classmethod
-    def update_market_member(cls, market_data):
-        symbol = market_data['market_name']
+    def get_version(cls) -> int:
+        return cls._version
 
-        cls._markets[symbol] = {
-            'symbol': symbol,
-            'market_id': market_data['market_id'],
-            'max_funding_velocity': market_data['max_funding_velocity'],
-            'skew_scale': market_data['skew_scale'],
-            'maker_fee': market_data['maker_fee'],
-            'taker_fee': market_data['taker_fee']
-        }
+    @classmethod
+    def start_refresh(cls):
+        with cls._refresh_lock:
+            if cls._refresh_thread is not None and cls._refresh_thread.is_alive():
+                return
+            cls._refresh_stop_event.clear()
+            cls._refresh_thread = threading.Thread(target=cls._run_refresh, name='SynthetixMarketDirectoryRefresh', daemon=True)
+            cls._refresh_thread.start()
 
     @classmethod
-    def get_market_params(cls, symbol: str) -> dict:
-        try:
-            market: dict = cls._markets.get(symbol)
-            if market:
-                return market
-            else:
-                logger.error(f"SynthetixMarketDirectory - No data available for market {symbol}.")
-                return None
-        
-        except Exception as e:
-            logger.error(f"SynthetixMarketDirectory - Error while getting market params for {symbol}. market = {market}. Error: {e}")
-            return None
+    def stop_refresh(cls):
+        cls._refresh_stop_event.set()
+
+    @classmethod
+    def _run_refresh(cls):
+        while not cls._refresh_stop_event.wait(cls._refresh_seconds):
+            cls.update_all_market_parameters()
+
+    @classmethod
+    def build_market_record(cls, market_data) -> SynthetixMarket:
+        return SynthetixMarket(
+            symbol=market_data['market_name'],
+            market_id=market_data['market_id'],
+            max_funding_velocity=market_data['max_funding_velocity'],
+            skew_scale=market_data['skew_scale'],
+            maker_fee=market_data['maker_fee'],
+            taker_fee=market_data['taker_fee']
+        )
+
+    @classmethod
+    def get_market_params(cls, symbol: str) -> SynthetixMarket:
+        market = cls._index.markets_by_symbol.get(symbol)
+        if market is None:
+            logger.error(f"SynthetixMarketDirectory - No data available for market {symbol}.")
+        return market
 
     @classmethod
     def get_market_id(cls, symbol: str) -> int:
-        try:
-            market = cls._markets.get(symbol)
-            if market:
-                return market['market_id']
+        market = cls._index.markets_by_symbol.get(symbol)
+        if market is None:
             logger.error(f"SynthetixMarketDirectory - Market symbol '{symbol}' not found in MarketDirectory.")
-
-        except Exception as e:
-            logger.error(f'SynthetixMarketDirectory - Failed to get market id for symbol: {symbol}, market = {market}. Error: {e}')
             return None
+        return market.market_id
+
+    @classmethod
+    def get_symbol_for_market_id(cls, market_id: int) -> str:
+        symbol = cls._index.symbol_by_market_id.get(market_id)
+        if symbol is None:
+            logger.error(f"SynthetixMarketDirectory - Market id {market_id} not found in MarketDirectory.")
+        return symbol
 
 
     @classmethod
     def calculate_new_funding_velocity(cls, symbol: str, current_skew_in_asset: float, trade_size_in_asset: float) -> float:
         try:
             market_data = cls.get_market_params(symbol)
-            c = market_data['max_funding_velocity'] / market_data['skew_scale']
+            c = market_data.max_funding_velocity / market_data.skew_scale
             new_skew = current_skew_in_asset + trade_size_in_asset
             new_funding_velocity_as_daily_percent = c * new_skew
             return new_funding_velocity_as_daily_percent
@@ -146,8 +230,8 @@ class SynthetixMarketDirectory:
     def get_maker_taker_fee(cls, symbol: str, skew_usd: float, is_long: bool, absolute_size_usd: float) -> list:
         try:
             market = cls.get_market_params(symbol)
-            maker_fee = market['maker_fee']
-            taker_fee = market['taker_fee']
+            maker_fee = market.maker_fee
+            taker_fee = market.taker_fee
 
             if is_long:
                 trade_impact = absolute_size_usd
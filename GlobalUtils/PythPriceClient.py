@@ -0,0 +1,86 @@
+from GlobalUtils.logger import logger
+import threading
+import requests
+import os
+
+DEFAULT_PYTH_HERMES_ENDPOINT = 'https://hermes.pyth.network'
+PYTH_REQUEST_TIMEOUT_SECONDS = 10
+
+class PythPriceClient:
+    """
+    Reads Pyth prices straight from the Hermes price service, so pricing needs no venue SDK or account
+    setup. Responses use the same {'meta': {feed_id: {'symbol', 'price', 'publish_time'}}} shape as the
+    Synthetix SDK's Pyth helper. Feed ids for crypto/USD pairs are loaded once, on first use.
+    """
+    def __init__(self, endpoint: str = None):
+        self.endpoint = (endpoint or os.getenv('PYTH_HERMES_ENDPOINT') or DEFAULT_PYTH_HERMES_ENDPOINT).rstrip('/')
+        self._price_feed_ids = None
+        self._lock = threading.Lock()
+
+    @property
+    def price_feed_ids(self) -> dict:
+        if self._price_feed_ids is None:
+            with self._lock:
+                if self._price_feed_ids is None:
+                    self._price_feed_ids = self._load_price_feed_ids()
+        return self._price_feed_ids
+
+    def _load_price_feed_ids(self) -> dict:
+        response = requests.get(
+            f'{self.endpoint}/v2/price_feeds',
+            params={'asset_type': 'crypto'},
+            timeout=PYTH_REQUEST_TIMEOUT_SECONDS
+        )
+        response.raise_for_status()
+
+        feed_ids_by_base = {}
+        for feed in response.json():
+            attributes = feed.get('attributes', {})
+            base = attributes.get('base')
+            # Only the canonical Crypto.<BASE>/USD feed is used; other USD-quoted feeds for the same base (e.g. redemption rates) are skipped.
+            if base and attributes.get('symbol') == f'Crypto.{base}/USD':
+                feed_ids_by_base.setdefault(base, []).append(f"0x{feed['id']}")
+
+        price_feed_ids = {}
+        for base, feed_ids in feed_ids_by_base.items():
+            if len(feed_ids) > 1:
+                logger.error(f'PythPriceClient - {len(feed_ids)} canonical Crypto.{base}/USD feeds listed, using {feed_ids[0]}: {feed_ids}')
+            price_feed_ids[base] = feed_ids[0]
+
+        logger.info(f'PythPriceClient - Loaded {len(price_feed_ids)} crypto/USD price feed ids.')
+        return price_feed_ids
+
+    def get_price_from_symbols(self, symbols: list) -> dict:
+        try:
+            feed_ids = {symbol: self.price_feed_ids[symbol] for symbol in symbols if symbol in self.price_feed_ids}
+            missing_symbols = set(symbols) - set(feed_ids)
+            if missing_symbols:
+                logger.error(f'PythPriceClient - No price feed ids for symbols: {missing_symbols}')
+            if not feed_ids:
+                return None
+
+            response = requests.get(
+                f'{self.endpoint}/v2/updates/price/latest',
+                params={'ids[]': list(feed_ids.values()), 'parsed': 'true'},
+                timeout=PYTH_REQUEST_TIMEOUT_SECONDS
+            )
+            response.raise_for_status()
+
+            symbol_by_feed_id = {feed_id: symbol for symbol, feed_id in feed_ids.items()}
+            meta = {}
+            for feed_data in response.json()['parsed']:
+                feed_id = f"0x{feed_data['id']}"
+                meta[feed_id] = {
+                    'symbol': symbol_by_feed_id.get(feed_id),
+                    'price': int(feed_data['price']['price']) * 10 ** feed_data['price']['expo'],
+                    'publish_time': feed_data['price']['publish_time']
+                }
+
+            return {'meta': meta}
+
+        except Exception as e:
+            logger.error(f'PythPriceClient - Failed to fetch prices for {symbols}. Error: {e}')
+            return None
+
+def build_pyth_price_client() -> PythPriceClient:
+    return PythPriceClient()
@@ -5,17 +5,17 @@ import requests
 from decimal import Decimal, InvalidOperation
 from enum import Enum
 from GlobalUtils.logger import *
-from APICaller.Synthetix.SynthetixUtils import get_synthetix_client
-from APICaller.Binance.binanceUtils import get_binance_client
-from APICaller.HMX.HMXCallerUtils import get_HMX_client
+from GlobalUtils.ClientRegistry import ClientRegistry
 # from APICaller.OKX.okxUtils import get_okx_trading_data_client
 # from APICaller.OKX.okxUtils import get_okx_pub_client
 # from APICaller.OKX.okxUtils import get_okx_account_client
 # from APICaller.OKX.okxUtils import get_okx_trade_client
 
 import functools
+import json
 import re
 import time
+import threading
 
 load_dotenv()
 
@@ -24,9 +24,8 @@ NULL_ADDRESS = '0x0000000000000000000000000000000000000000'
 BLOCKS_PER_DAY_BASE = 43200
 BLOCKS_PER_HOUR_BASE = 1800
 
-GLOBAL_SYNTHETIX_CLIENT = get_synthetix_client()
-GLOBAL_BINANCE_CLIENT = get_binance_client()
-GLOBAL_HMX_CLIENT = get_HMX_client()
+DEFAULT_PYTH_PRICE_MAX_AGE_SECONDS = 60
+DEFAULT_BLOCK_CLOCK_REFRESH_SECONDS = 30
 
 # GLOBAL_OKX_PUBLIC_CLIENT = get_okx_pub_client()
 # GLOBAL_OKX_TRADING_DATA_CLIENT = get_okx_trading_data_client()
@@ -40,6 +39,7 @@ class EventsDirectory(Enum):
     POSITION_OPENED = "position_opened"
     POSITION_CLOSED = "position_closed"
     TRADE_LOGGED = "trade_logged"
+    POSITION_STATE_DRIFT = "position_state_drift"
 
 DECIMALS = {
     "BTC": 8,
@@ -69,13 +69,19 @@ DECIMALS = {
 def get_decimals_for_symbol(symbol):
     return DECIMALS.get(symbol, None)
 
+_BASE_WEB3_CLIENT = None
+_BASE_WEB3_CLIENT_LOCK = threading.Lock()
+
 def initialise_client() -> Web3:
+    global _BASE_WEB3_CLIENT
     try:
-        client = Web3(Web3.HTTPProvider(os.getenv('BASE_PROVIDER_RPC')))
+        with _BASE_WEB3_CLIENT_LOCK:
+            if _BASE_WEB3_CLIENT is None:
+                _BASE_WEB3_CLIENT = Web3(Web3.HTTPProvider(os.getenv('BASE_PROVIDER_RPC')))
     except Exception as e:
         logger.error(f"GlobalUtils - Error initialising Web3 client: {e}")
         return None 
-    return client
+    return _BASE_WEB3_CLIENT
 
 def get_gas_price() -> float:
     client = initialise_client()
@@ -91,7 +97,7 @@ def get_gas_price() -> float:
 
 def get_price_from_pyth(symbol: str):
     try:
-        response = GLOBAL_SYNTHETIX_CLIENT.pyth.get_price_from_symbols([symbol])
+        response = ClientRegistry.get('Pyth').get_price_from_symbols([symbol])
         
         feed_id = next(iter(response['meta']))
         meta_data = response['meta'].get(feed_id, {})
@@ -108,10 +114,103 @@ def get_price_from_pyth(symbol: str):
         return None
 
 
+class PythPriceCache:
+    """
+    Holds Pyth prices fetched in one batched request per cycle so that the conversion helpers
+    below are answered from memory. Prices older than PYTH_PRICE_MAX_AGE_SECONDS are refetched.
+    """
+    _prices = {}
+    _lock = threading.Lock()
+    _max_age_seconds = float(os.getenv('PYTH_PRICE_MAX_AGE_SECONDS') or DEFAULT_PYTH_PRICE_MAX_AGE_SECONDS)
+    hits = 0
+    misses = 0
+
+    @classmethod
+    def refresh(cls, symbols: list) -> dict:
+        try:
+            symbols = list(dict.fromkeys(symbols))
+            if not symbols:
+                return {}
+
+            pyth = ClientRegistry.get('Pyth')
+            response = pyth.get_price_from_symbols(symbols)
+            prices = parse_prices_from_pyth_response(response, symbols, pyth.price_feed_ids)
+            fetched_at = time.time()
+
+            with cls._lock:
+                for symbol, price in prices.items():
+                    cls._prices[symbol] = (price, fetched_at)
+
+            missing_symbols = set(symbols) - set(prices)
+            if missing_symbols:
+                logger.warning(f"PythPriceCache - No price returned for symbols: {missing_symbols}")
+
+            return prices
+
+        except Exception as e:
+            logger.error(f"PythPriceCache - Failed to refresh prices for {symbols}. Error: {e}")
+            return {}
+
+    @classmethod
+    def get_price(cls, symbol: str) -> float:
+        price = cls.get_fresh_cached_price(symbol)
+        if price is not None:
+            return price
+        return cls.refresh([symbol]).get(symbol)
+
+    @classmethod
+    def get_fresh_cached_price(cls, symbol: str) -> float:
+        """
+        Cache-only read: the price if it is within PYTH_PRICE_MAX_AGE_SECONDS, otherwise None. Never makes a request.
+        """
+        with cls._lock:
+            cached = cls._prices.get(symbol)
+            if cached is not None and time.time() - cached[1] <= cls._max_age_seconds:
+                cls.hits += 1
+                return cached[0]
+            cls.misses += 1
+            return None
+
+    @classmethod
+    def get_cached_price(cls, symbol: str):
+        with cls._lock:
+            cached = cls._prices.get(symbol)
+        return cached[0] if cached is not None else None
+
+    @classmethod
+    def clear(cls):
+        with cls._lock:
+            cls._prices = {}
+            cls.hits = 0
+            cls.misses = 0
+
+def parse_prices_from_pyth_response(response: dict, symbols: list, feed_ids_by_symbol: dict) -> dict:
+    """
+    Matches each requested symbol to its entry by feed id; symbols whose feed is unknown or absent
+    from the response are left out rather than guessed.
+    """
+    try:
+        prices = {}
+        meta = response['meta']
+        for symbol in symbols:
+            feed_id = feed_ids_by_symbol.get(symbol)
+            meta_data = meta.get(feed_id) if feed_id is not None else None
+            if meta_data is None:
+                continue
+            price = meta_data.get('price')
+            if price is not None:
+                prices[symbol] = price
+
+        return prices
+
+    except Exception as e:
+        logger.error(f"GlobalUtils - Failed to parse prices from Pyth response for {symbols}. Error: {e}")
+        return {}
+
 def calculate_transaction_cost_usd(total_gas: int) -> float:
     try:
         gas_price_gwei = get_gas_price()
-        eth_price_usd = get_price_from_pyth('ETH')
+        eth_price_usd = PythPriceCache.get_price('ETH')
         gas_cost_eth = (gas_price_gwei * total_gas) / Decimal('1e9')
         transaction_cost_usd = float(gas_cost_eth) * eth_price_usd
         return transaction_cost_usd
@@ -119,18 +218,30 @@ def calculate_transaction_cost_usd(total_gas: int) -> float:
         logger.error(f"GlobalUtils - Error calculating transaction cost: {e}")
     return 0.0
 
-def get_asset_amount_for_given_dollar_amount(asset: str, dollar_amount: float) -> float:
+def get_price_for_conversion(asset: str, cache_only: bool) -> float:
+    if cache_only:
+        asset_price = PythPriceCache.get_fresh_cached_price(asset)
+        if asset_price is None:
+            logger.error(f"GlobalUtils - No fresh cached price for {asset}, refusing to fetch one during a cache-only conversion.")
+        return asset_price
+    return PythPriceCache.get_price(asset)
+
+def get_asset_amount_for_given_dollar_amount(asset: str, dollar_amount: float, cache_only: bool = False) -> float:
     try:
-        asset_price = get_price_from_pyth(asset)
+        asset_price = get_price_for_conversion(asset, cache_only)
+        if asset_price is None:
+            return None
         asset_amount = dollar_amount / asset_price
         return asset_amount
     except ZeroDivisionError:
         logger.error(f"GlobalUtils - Error calculating asset amount for {asset}: Price is zero")
     return 0.0
 
-def get_dollar_amount_for_given_asset_amount(asset: str, asset_amount: float) -> float:
+def get_dollar_amount_for_given_asset_amount(asset: str, asset_amount: float, cache_only: bool = False) -> float:
     try:
-        asset_price = get_price_from_pyth(asset)
+        asset_price = get_price_for_conversion(asset, cache_only)
+        if asset_price is None:
+            return None
         dollar_amount = asset_amount * asset_price
         return dollar_amount
     except Exception as e:
@@ -170,14 +281,69 @@ def get_base_block_number_by_timestamp(timestamp: int) -> int:
         print("GlobalUtils - Basescan API HTTP Request failed:", e)
         return -1
 
+class BaseBlockClock:
+    """
+    Tracks the BASE head block from a background thread. Reads between refreshes are extrapolated
+    from the time since the last sync at BLOCKS_PER_HOUR_BASE, so callers never wait on the RPC.
+    """
+    _head_block = None
+    _synced_at = None
+    _lock = threading.Lock()
+    _thread = None
+    _stop_event = threading.Event()
+    _refresh_seconds = float(os.getenv('BLOCK_CLOCK_REFRESH_SECONDS') or DEFAULT_BLOCK_CLOCK_REFRESH_SECONDS)
+    _blocks_per_second = BLOCKS_PER_HOUR_BASE / 3600
+
+    @classmethod
+    def start(cls):
+        with cls._lock:
+            if cls._thread is not None and cls._thread.is_alive():
+                return
+            cls._stop_event.clear()
+            cls._thread = threading.Thread(target=cls._run, name='BaseBlockClock', daemon=True)
+            cls._thread.start()
+
+    @classmethod
+    def stop(cls):
+        cls._stop_event.set()
+
+    @classmethod
+    def sync(cls) -> int:
+        try:
+            client = initialise_client()
+            block_number = client.eth.block_number
+            with cls._lock:
+                cls._head_block = block_number
+                cls._synced_at = time.time()
+            return block_number
+        except Exception as e:
+            logger.error(f'BaseBlockClock - Error while syncing current block number for BASE network: {e}')
+            return None
+
+    @classmethod
+    def get_block_number(cls) -> int:
+        try:
+            if cls._head_block is None:
+                cls.sync()
+                cls.start()
+
+            with cls._lock:
+                if cls._head_block is None:
+                    return None
+                elapsed_seconds = time.time() - cls._synced_at
+                return cls._head_block + int(elapsed_seconds * cls._blocks_per_second)
+
+        except Exception as e:
+            logger.error(f'BaseBlockClock - Error while reading current block number: {e}')
+            return None
+
+    @classmethod
+    def _run(cls):
+        while not cls._stop_event.wait(cls._refresh_seconds):
+            cls.sync()
+
 def get_base_block_number() -> int:
-    try:
-        client = initialise_client()
-        block_number = client.eth.block_number
-        return block_number
-    except Exception as e:
-        logger.error(f'GlobalUtils - Error while calling current block number for BASE network: {e}')
-        return None
+    return BaseBlockClock.get_block_number()
 
 def get_binance_funding_event_schedule(current_block_number: int) -> list:
     try:
@@ -218,6 +384,14 @@ def get_milliseconds_until_given_timestamp_timezone(timestamp: int, shift_timezo
         current_time -= time.timezone * 1000
     return timestamp - current_time
 
+def write_json_atomically(file_path: str, data):
+    temp_file_path = f'{file_path}.tmp'
+    with open(temp_file_path, 'w') as file:
+        json.dump(data, file)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temp_file_path, file_path)
+
 def deco_retry(retry: int = 5, retry_sleep: int = 3):
     def deco_func(func):
         @functools.wraps(func)
@@ -10,6 +10,7 @@ from PositionMonitor.TradeDatabase.TradeDatabase import TradeLogger
 from GlobalUtils.globalUtils import *
 from GlobalUtils.MarketDirectories.SynthetixMarketDirectory import SynthetixMarketDirectory
 from GlobalUtils.MarketDirectories.GMXMarketDirectory import GMXMarketDirectory
+from APICaller.master.MasterUtils import get_target_exchanges
 import time
 
 class Main:
@@ -22,8 +23,14 @@ class Main:
         self.position_controller.subscribe_to_events()
         self.position_monitor = MasterPositionMonitor()
         self.trade_logger = TradeLogger()
-        SynthetixMarketDirectory.initialize()
-        GMXMarketDirectory.initialize()
+        self.position_controller.start_position_state_cache()
+        target_exchanges = get_target_exchanges()
+        if 'Synthetix' in target_exchanges:
+            SynthetixMarketDirectory.initialize()
+        if 'GMX' in target_exchanges:
+            GMXMarketDirectory.initialize()
+        BaseBlockClock.sync()
+        BaseBlockClock.start()
     
     def search_for_opportunities(self):
         try:
@@ -18,6 +18,8 @@ class Demo:
         self.profitability_checker = ProfitabilityChecker()
         # SynthetixMarketDirectory.initialize()
         GMXMarketDirectory.initialize()
+        BaseBlockClock.sync()
+        BaseBlockClock.start()
     
     def search_for_opportunities(self):
         try:
@@ -23,40 +23,14 @@ class matchingEngine:
                     continue
                 common_symbols = set(rates_by_exchange[ex1].keys()) & set(rates_by_exchange[ex2].keys())
                 for symbol in common_symbols:
-                    rate1 = float(rates_by_exchange[ex1][symbol]['funding_rate'])
-                    rate2 = float(rates_by_exchange[ex2][symbol]['funding_rate'])
-                    skew1 = rates_by_exchange[ex1][symbol]['skew_usd']
-                    skew2 = rates_by_exchange[ex2][symbol]['skew_usd']
+                    arbitrage_opportunity = build_opportunity_for_pair(
+                        symbol,
+                        rates_by_exchange[ex1][symbol],
+                        rates_by_exchange[ex2][symbol],
+                        block_number
+                    )
 
-                    if (rate1 > 0 and rate2 > 0) or (rate1 < 0 and rate2 < 0):
-                        if rate1 > rate2:
-                            long_exchange, short_exchange = ex2, ex1
-                            long_rate, short_rate = rate2, rate1
-                            long_exchange_skew, short_exchange_skew = skew2, skew1
-                        else:
-                            long_exchange, short_exchange = ex1, ex2
-                            long_rate, short_rate = rate1, rate2
-                            long_exchange_skew, short_exchange_skew = skew1, skew2
-                    elif rate1 > 0 and rate2 < 0:
-                        long_exchange, short_exchange = ex2, ex1
-                        long_rate, short_rate = rate2, rate1
-                        long_exchange_skew, short_exchange_skew = skew2, skew1
-                    elif rate1 < 0 and rate2 > 0:
-                        long_exchange, short_exchange = ex1, ex2
-                        long_rate, short_rate = rate1, rate2
-                        long_exchange_skew, short_exchange_skew = skew1, skew2
-                    
-                    if long_exchange is not None:
-                        arbitrage_opportunity = {
-                            'long_exchange': long_exchange,
-                            'short_exchange': short_exchange,
-                            'symbol': symbol,
-                            'long_exchange_funding_rate_8hr': long_rate,
-                            'short_exchange_funding_rate_8hr': short_rate,
-                            'long_exchange_skew_usd': long_exchange_skew,
-                            'short_exchange_skew_usd': short_exchange_skew,
-                            'block_number': block_number
-                        }
+                    if arbitrage_opportunity is not None:
                         arbitrage_opportunities.append(arbitrage_opportunity)
 
             return arbitrage_opportunities
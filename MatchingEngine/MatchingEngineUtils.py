@@ -8,4 +8,31 @@ def group_by_symbol(funding_rates):
     return rates_by_symbol
 
 def sort_funding_rates_by_value(rates):
-    return sorted(rates, key=lambda x: float(x['funding_rate']))
\ No newline at end of file
+    return sorted(rates, key=lambda x: float(x['funding_rate']))
+
+def build_opportunity_for_pair(symbol: str, first_rate: dict, second_rate: dict, block_number: int) -> dict:
+    rate1 = float(first_rate['funding_rate'])
+    rate2 = float(second_rate['funding_rate'])
+    if rate1 == 0 or rate2 == 0:
+        return None
+
+    if rate1 > rate2:
+        long_rate_data, short_rate_data = second_rate, first_rate
+        long_rate, short_rate = rate2, rate1
+    else:
+        long_rate_data, short_rate_data = first_rate, second_rate
+        long_rate, short_rate = rate1, rate2
+
+    return {
+        'long_exchange': long_rate_data['exchange'],
+        'short_exchange': short_rate_data['exchange'],
+        'symbol': symbol,
+        'long_exchange_funding_rate_8hr': long_rate,
+        'short_exchange_funding_rate_8hr': short_rate,
+        'long_exchange_skew_usd': long_rate_data['skew_usd'],
+        'short_exchange_skew_usd': short_rate_data['skew_usd'],
+        'block_number': block_number
+    }
+
+def get_spread_for_opportunity(opportunity: dict) -> float:
+    return opportunity['short_exchange_funding_rate_8hr'] - opportunity['long_exchange_funding_rate_8hr']
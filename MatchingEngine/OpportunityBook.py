@@ -0,0 +1,127 @@
+from MatchingEngine.MatchingEngineUtils import *
+from GlobalUtils.logger import *
+import heapq
+import itertools
+import threading
+
+DEFAULT_OPPORTUNITY_BOOK_SIZE = 20
+
+class OpportunityBook:
+    """
+    Stateful view of current opportunities. A rate update for one (exchange, symbol) recomputes only
+    the pairs for that symbol which involve the exchange, and the best spreads are kept in a heap.
+    The best max_size entries are cached and only rebuilt when an update touches one of them or beats
+    the worst of them; superseded heap entries are dropped while rebuilding.
+    """
+    def __init__(self, max_size: int = DEFAULT_OPPORTUNITY_BOOK_SIZE):
+        self.max_size = max_size
+        self._rates = {}
+        self._opportunities = {}
+        self._heap = []
+        self._top = []
+        self._top_keys = set()
+        self._is_top_stale = False
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+
+    def update_rate(self, rate: dict, block_number: int = None):
+        try:
+            exchange = rate['exchange']
+            symbol = normalize_symbol(rate['symbol'])
+            if block_number is None:
+                block_number = get_base_block_number()
+
+            with self._lock:
+                rates_for_symbol = self._rates.setdefault(symbol, {})
+                rates_for_symbol[exchange] = rate
+
+                for other_exchange, other_rate in rates_for_symbol.items():
+                    if other_exchange == exchange:
+                        continue
+                    opportunity = build_opportunity_for_pair(symbol, rate, other_rate, block_number)
+                    self._set_opportunity(get_pair_key(symbol, exchange, other_exchange), opportunity)
+
+                self._compact_if_needed()
+
+        except Exception as e:
+            logger.error(f'OpportunityBook - Failed to apply rate update {rate}. Error: {e}', exc_info=True)
+
+    def update_rates(self, funding_rates: list):
+        block_number = get_base_block_number()
+        for rate in funding_rates:
+            self.update_rate(rate, block_number)
+
+    def remove_rate(self, exchange: str, symbol: str):
+        try:
+            symbol = normalize_symbol(symbol)
+            with self._lock:
+                rates_for_symbol = self._rates.get(symbol, {})
+                if rates_for_symbol.pop(exchange, None) is None:
+                    return
+
+                for other_exchange in rates_for_symbol:
+                    self._set_opportunity(get_pair_key(symbol, exchange, other_exchange), None)
+
+        except Exception as e:
+            logger.error(f'OpportunityBook - Failed to remove rate for {exchange} {symbol}. Error: {e}')
+
+    def get_best(self) -> dict:
+        with self._lock:
+            top = self._get_top_entries()
+            return top[0][2] if top else None
+
+    def get_top(self, k: int = None) -> list:
+        k = self.max_size if k is None else min(k, self.max_size)
+        with self._lock:
+            return [entry[2] for entry in self._get_top_entries()[:k]]
+
+    def __len__(self) -> int:
+        return len(self._opportunities)
+
+    def _set_opportunity(self, pair_key: tuple, opportunity: dict):
+        if pair_key in self._top_keys:
+            self._is_top_stale = True
+
+        if opportunity is None:
+            self._opportunities.pop(pair_key, None)
+            return
+
+        sequence = next(self._sequence)
+        self._opportunities[pair_key] = sequence
+        entry = (-get_spread_for_opportunity(opportunity), sequence, opportunity, pair_key)
+        heapq.heappush(self._heap, entry)
+
+        # While the cache is fresh it is either the whole book (fewer than max_size entries) or bounded by its last entry.
+        if len(self._top) < self.max_size or entry < self._top[-1]:
+            self._is_top_stale = True
+
+    def _get_top_entries(self) -> list:
+        if not self._is_top_stale:
+            return self._top
+
+        # Pops at most max_size current entries plus whatever superseded entries sit above them; the
+        # superseded ones are dropped for good, so repeated rebuilds never pay for them twice.
+        top = []
+        while self._heap and len(top) < self.max_size:
+            entry = heapq.heappop(self._heap)
+            if self._is_current(entry):
+                top.append(entry)
+
+        for entry in top:
+            heapq.heappush(self._heap, entry)
+
+        self._top = top
+        self._top_keys = {entry[3] for entry in top}
+        self._is_top_stale = False
+        return self._top
+
+    def _is_current(self, entry: tuple) -> bool:
+        return self._opportunities.get(entry[3]) == entry[1]
+
+    def _compact_if_needed(self):
+        if len(self._heap) > 2 * len(self._opportunities) + 64:
+            self._heap = [entry for entry in self._heap if self._is_current(entry)]
+            heapq.heapify(self._heap)
+
+def get_pair_key(symbol: str, exchange: str, other_exchange: str) -> tuple:
+    return (symbol,) + tuple(sorted((exchange, other_exchange)))
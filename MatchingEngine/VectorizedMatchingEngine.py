@@ -0,0 +1,118 @@
+from MatchingEngine.MatchingEngineUtils import *
+from GlobalUtils.logger import *
+import numpy as np
+
+class VectorizedMatchingEngine:
+    """
+    Drop-in alternative to matchingEngine. Loads the cycle's rates into a symbol x exchange matrix
+    and resolves the long/short assignment for every exchange pair and symbol in one pass.
+    """
+    def __init__(self):
+        pass
+
+    def find_delta_neutral_arbitrage_opportunities(self, funding_rates) -> list:
+        opportunities = []
+        if not funding_rates:
+            logger.error("VectorizedMatchingEngine - Funding rates are empty or not passed correctly.")
+            return opportunities
+
+        try:
+            rate_matrix = build_rate_matrix(funding_rates)
+            if len(rate_matrix['exchanges']) < 2:
+                return opportunities
+
+            block_number = get_base_block_number()
+            opportunities = self.find_opportunities_from_matrix(rate_matrix, block_number)
+
+        except KeyError as ke:
+            logger.error(f'VectorizedMatchingEngine - KeyError - Missing key in data processing: {ke}')
+        except TypeError as te:
+            logger.error(f'VectorizedMatchingEngine - TypeError - Issue with data types during processing: {te}')
+        except Exception as e:
+            logger.error(f'VectorizedMatchingEngine - Unexpected error during processing: {e}', exc_info=True)
+
+        return opportunities
+
+    def find_opportunities_from_matrix(self, rate_matrix: dict, block_number: int) -> list:
+        try:
+            symbols = rate_matrix['symbols']
+            exchanges = rate_matrix['exchanges']
+            rates = rate_matrix['rates']
+            skews = rate_matrix['skews']
+
+            first_exchange_index, second_exchange_index = np.triu_indices(len(exchanges), k=1)
+            first_rates = rates[:, first_exchange_index]
+            second_rates = rates[:, second_exchange_index]
+
+            # Rates that are missing or exactly zero carry no directional signal, matching the scalar engine.
+            is_valid = rate_matrix['mask'][:, first_exchange_index] & rate_matrix['mask'][:, second_exchange_index]
+            is_valid &= (first_rates != 0) & (second_rates != 0)
+
+            is_second_long = first_rates > second_rates
+            long_exchange_index = np.where(is_second_long, second_exchange_index, first_exchange_index)
+            short_exchange_index = np.where(is_second_long, first_exchange_index, second_exchange_index)
+            long_rates = np.where(is_second_long, second_rates, first_rates)
+            short_rates = np.where(is_second_long, first_rates, second_rates)
+            spreads = np.where(is_valid, short_rates - long_rates, -np.inf)
+
+            symbol_index, pair_index = np.nonzero(is_valid)
+            order = np.argsort(-spreads[symbol_index, pair_index], kind='stable')
+            symbol_index, pair_index = symbol_index[order], pair_index[order]
+
+            long_indices = long_exchange_index[symbol_index, pair_index].tolist()
+            short_indices = short_exchange_index[symbol_index, pair_index].tolist()
+            long_rate_values = long_rates[symbol_index, pair_index].tolist()
+            short_rate_values = short_rates[symbol_index, pair_index].tolist()
+
+            arbitrage_opportunities = [
+                {
+                    'long_exchange': exchanges[long_index],
+                    'short_exchange': exchanges[short_index],
+                    'symbol': symbols[s],
+                    'long_exchange_funding_rate_8hr': long_rate,
+                    'short_exchange_funding_rate_8hr': short_rate,
+                    'long_exchange_skew_usd': skews[s][long_index],
+                    'short_exchange_skew_usd': skews[s][short_index],
+                    'block_number': block_number
+                }
+                for s, long_index, short_index, long_rate, short_rate in zip(
+                    symbol_index.tolist(), long_indices, short_indices, long_rate_values, short_rate_values
+                )
+            ]
+
+            return arbitrage_opportunities
+
+        except Exception as e:
+            logger.error(f'VectorizedMatchingEngine - Error while finding arbitrage opportunities from rate matrix: {e}', exc_info=True)
+            return []
+
+def build_rate_matrix(funding_rates: list) -> dict:
+    symbol_index = {}
+    exchange_index = {}
+    entries = []
+
+    for rate in funding_rates:
+        exchange = rate.get('exchange')
+        if exchange is None:
+            continue
+        symbol = normalize_symbol(rate['symbol'])
+        s = symbol_index.setdefault(symbol, len(symbol_index))
+        e = exchange_index.setdefault(exchange, len(exchange_index))
+        entries.append((s, e, float(rate['funding_rate']), rate.get('skew_usd')))
+
+    rates = np.zeros((len(symbol_index), len(exchange_index)), dtype=np.float64)
+    mask = np.zeros(rates.shape, dtype=bool)
+    skews = [[None] * len(exchange_index) for _ in range(len(symbol_index))]
+
+    for s, e, funding_rate, skew in entries:
+        rates[s, e] = funding_rate
+        mask[s, e] = True
+        skews[s][e] = skew
+
+    return {
+        'symbols': list(symbol_index),
+        'exchanges': list(exchange_index),
+        'rates': rates,
+        'mask': mask,
+        'skews': skews
+    }
@@ -10,19 +10,28 @@ from MatchingEngine.profitabilityChecks.HMX.HMXCheckProfitabilityUtils import *
 from MatchingEngine.profitabilityChecks.Synthetix.SynthetixCheckProfitabilityUtils import *
 from APICaller.ByBit.ByBitCaller import ByBitCaller
 from APICaller.OKX.okxCaller import OKXCaller
-from gmx_python_sdk.scripts.v2.get.get_oracle_prices import OraclePrices
-from APICaller.GMX.GMXCallerUtils import ARBITRUM_CONFIG_OBJECT
+from APICaller.GMX.GMXMarketSnapshot import GMXSnapshotService
 from APICaller.master.MasterUtils import get_target_exchanges
+from GlobalUtils.FundingCalendar import FundingCalendar
+from GlobalUtils.ExchangeAdapters import ExchangeAdapterRegistry
 import json
 import os
 
 class ProfitabilityChecker:
     def __init__(self):
         self.position_controller = MasterPositionController()
-        self.bybit_caller = ByBitCaller()
+        self._bybit_caller = None
         # self.okx_caller = OKXCaller()
+        self.gmx_snapshot = None
         self.gmx_prices = {}
         self.gmx_open_interest = {}
+        self.leg_estimate_cache = LegEstimateCache()
+        self.profit_models = {}
+        self.neutralization_models = {}
+        for exchange in ExchangeAdapterRegistry.get_registered_exchanges():
+            adapter = ExchangeAdapterRegistry.get(exchange)
+            self.profit_models[exchange] = getattr(self, adapter.profit_model)
+            self.neutralization_models[exchange] = getattr(self, adapter.neutralization_model) if adapter.neutralization_model else None
 
         self.default_trade_duration = float(os.getenv('DEFAULT_TRADE_DURATION_HOURS'))
         self.default_trade_size_usd = float(os.getenv('DEFAULT_TRADE_SIZE_USD'))
@@ -33,12 +42,30 @@ class ProfitabilityChecker:
             best_opportunity = None
             max_profit = 0
             opportunities_with_profit = []
+            self.leg_estimate_cache.clear()
+            PythPriceCache.refresh([opportunity['symbol'] for opportunity in opportunities] + ['ETH'])
+            is_gmx_unavailable = False
             if 'GMX' in get_target_exchanges():
-                self.gmx_prices = OraclePrices(chain=ARBITRUM_CONFIG_OBJECT.chain).get_recent_prices()
-                self.gmx_open_interest = OpenInterest(ARBITRUM_CONFIG_OBJECT)._get_data_processing(self.gmx_prices)
+                gmx_snapshot = GMXSnapshotService.get_snapshot()
+                self.gmx_snapshot = gmx_snapshot
+                if gmx_snapshot is None:
+                    # Only the GMX legs depend on the snapshot, so the rest of the book is still ranked this cycle.
+                    logger.error('CheckProfitability - No GMX market snapshot available, skipping GMX opportunities this cycle.')
+                    is_gmx_unavailable = True
+                    self.gmx_prices = {}
+                    self.gmx_open_interest = {}
+                else:
+                    self.gmx_prices = gmx_snapshot.prices
+                    self.gmx_open_interest = gmx_snapshot.open_interest
 
             for opportunity in opportunities:
                 symbol = opportunity['symbol']
+                if is_gmx_unavailable and 'GMX' in (opportunity['long_exchange'], opportunity['short_exchange']):
+                    continue
+                # Ranking does no price I/O: an opportunity whose price did not come back in the batch is skipped.
+                if PythPriceCache.get_fresh_cached_price(symbol) is None:
+                    logger.warning(f'CheckProfitability - No fresh cached price for {symbol}, skipping opportunity this cycle.')
+                    continue
                 size_per_exchange = trade_size_usd / 2
                 total_profit_usd = 0
                 hours_to_neutralize_by_exchange = {}
@@ -78,6 +105,7 @@ class ProfitabilityChecker:
                     best_opportunity = opportunity
 
             opportunities_with_profit.sort(key=lambda x: x['total_profit_usd'], reverse=True)
+            logger.info(f'CheckProfitability - Leg estimate cache: {self.leg_estimate_cache.hits} hits, {self.leg_estimate_cache.misses} misses.')
 
             if is_demo:
                 return opportunities_with_profit
@@ -90,78 +118,68 @@ class ProfitabilityChecker:
             logger.error(f'CheckProfitability - Failed to find most profitable opportunity. Error: {e}', exc_info=True)
 
     def estimate_profit_for_exchange(self, time_period_hours: float, size_usd: float, opportunity: dict, exchange: str) -> float:
+        key = build_leg_estimate_key('profit', opportunity, exchange, size_usd, time_period_hours)
+        return self.leg_estimate_cache.get_or_compute(
+            key,
+            lambda: self._estimate_profit_for_exchange(time_period_hours, size_usd, opportunity, exchange)
+        )
+
+    def _estimate_profit_for_exchange(self, time_period_hours: float, size_usd: float, opportunity: dict, exchange: str) -> float:
         try:
-            estimated_profit = None
-            if exchange == 'Binance':
-                estimated_profit = self.estimate_binance_profit(time_period_hours=time_period_hours, size_usd=size_usd, opportunity=opportunity)
-                return estimated_profit
-            elif exchange == 'Synthetix':
-                estimated_profit = self.estimate_synthetix_profit(time_period_hours=time_period_hours, absolute_size_usd=size_usd, opportunity=opportunity)
-                return estimated_profit
-            elif exchange == 'GMX':
-                estimated_profit = self.estimate_GMX_profit(time_period_hours=time_period_hours, absolute_size_usd=size_usd, opportunity=opportunity, open_interest=self.gmx_open_interest)
-                return estimated_profit
-            elif exchange == 'HMX':
-                estimated_profit = estimate_HMX_profit(time_period_hours=time_period_hours, size_usd=size_usd, opportunity=opportunity)
-                return estimated_profit
-            elif exchange == 'ByBit':
-                estimated_profit = self.estimate_bybit_profit(time_period_hours=time_period_hours, size_usd=size_usd, opportunity=opportunity)
-                return estimated_profit
-            elif exchange == 'OKX':
-                estimated_profit = self.estimate_okx_profit(time_period_hours=time_period_hours, size_usd=size_usd, opportunity=opportunity)
-                return estimated_profit
-
-            if not estimated_profit:
+            profit_model = self.profit_models.get(exchange)
+            if profit_model is None:
+                logger.error(f'CheckProfitability - No profit model registered for exchange {exchange}')
                 return None
 
+            return profit_model(time_period_hours, size_usd, opportunity)
+
         except Exception as e:
             logger.error(f'CheckProfitability - Failed to estimate profit for exchange {exchange}, Error: {e}')
             return None
 
     def estimate_time_to_neutralize_funding_rate_for_exchange(self, opportunity: dict, size_usd: float, exchange: str):
-        try:
-            if exchange == "HMX":
-                time_to_neutralize = estimate_time_to_neutralize_funding_rate_hmx(opportunity, size_usd)
-                if type(time_to_neutralize) == str:
-                    time_to_neutralize = self.default_trade_duration
-                    return time_to_neutralize
-                else:
-                    return time_to_neutralize
-
-            if exchange == "Synthetix":
-                time_to_neutralize = estimate_time_to_neutralize_funding_rate_synthetix(opportunity, absolute_size_usd=size_usd)
-                if type(time_to_neutralize) == str:
-                    time_to_neutralize = self.default_trade_duration
-                    return time_to_neutralize
-                else:
-                    return time_to_neutralize
-            
-            if exchange == "GMX":
-                time_to_neutralize = estimate_time_to_neutralize_funding_rate_gmx(
-                    opportunity, 
-                    absolute_size_usd=size_usd, 
-                    open_interest=self.gmx_open_interest
-                    )
+        key = build_leg_estimate_key('time_to_neutralize', opportunity, exchange, size_usd)
+        return self.leg_estimate_cache.get_or_compute(
+            key,
+            lambda: self._estimate_time_to_neutralize_funding_rate_for_exchange(opportunity, size_usd, exchange)
+        )
 
-                if type(time_to_neutralize) == str:
-                    time_to_neutralize = self.default_trade_duration
-                    return time_to_neutralize
-                else:
-                    return time_to_neutralize
+    def _estimate_time_to_neutralize_funding_rate_for_exchange(self, opportunity: dict, size_usd: float, exchange: str):
+        try:
+            if exchange not in self.neutralization_models:
+                logger.error(f'CheckProfitability - No adapter registered for exchange {exchange}')
+                return None
 
-            elif exchange == "ByBit":
+            neutralization_model = self.neutralization_models[exchange]
+            if neutralization_model is None:
                 return "No Neutralization"
 
-            elif exchange == "Binance":
-                return "No Neutralization"
+            time_to_neutralize = neutralization_model(opportunity, size_usd)
+            if type(time_to_neutralize) == str:
+                return self.default_trade_duration
 
-            elif exchange == "OKX":
-                return "No Neutralization"
+            return time_to_neutralize
 
         except Exception as e:
             logger.error(f'CheckProfitability - Failed to estimate profit for exchange {exchange}, Error: {e}')
             return None
 
+    def estimate_time_to_neutralize_synthetix(self, opportunity: dict, size_usd: float):
+        return estimate_time_to_neutralize_funding_rate_synthetix(opportunity, absolute_size_usd=size_usd)
+
+    def estimate_time_to_neutralize_hmx(self, opportunity: dict, size_usd: float):
+        return estimate_time_to_neutralize_funding_rate_hmx(opportunity, size_usd)
+
+    def estimate_time_to_neutralize_gmx(self, opportunity: dict, size_usd: float):
+        return estimate_time_to_neutralize_funding_rate_gmx(
+            opportunity,
+            absolute_size_usd=size_usd,
+            open_interest=self.gmx_open_interest
+        )
+
+    def estimate_hmx_profit(self, time_period_hours: float, size_usd: float, opportunity: dict) -> float:
+        return estimate_HMX_profit(time_period_hours=time_period_hours, size_usd=size_usd, opportunity=opportunity)
+
     def estimate_synthetix_profit(self, time_period_hours: float, absolute_size_usd: float, opportunity: dict) -> tuple:
         is_long: bool = opportunity['long_exchange'] == 'Synthetix'
         symbol = str(opportunity['symbol'])
@@ -223,10 +241,10 @@ class ProfitabilityChecker:
 
     def estimate_bybit_profit(self, time_period_hours: float, size_usd: float, opportunity: dict) -> float:
         try:
-            symbol = opportunity['symbol'] + 'USDT'
+            symbol = ExchangeAdapterRegistry.format_symbol('ByBit', opportunity['symbol'])
             is_long = opportunity['long_exchange'] == 'ByBit'
             funding_rate = opportunity['long_exchange_funding_rate_8hr'] if is_long else opportunity['short_exchange_funding_rate_8hr']
-            number_of_funding_events_in_time_period = self.bybit_caller.get_next_funding_events_for_time_period(symbol, time_period_hours)
+            number_of_funding_events_in_time_period = self.get_number_of_funding_events('ByBit', symbol, time_period_hours)
 
             if is_long:
                 if funding_rate > 0:
@@ -255,10 +273,10 @@ class ProfitabilityChecker:
 
     def estimate_okx_profit(self, time_period_hours: float, size_usd: float, opportunity: dict) -> float:
         try:
-            symbol = opportunity['symbol'] + '-USDT-SWAP'
+            symbol = ExchangeAdapterRegistry.format_symbol('OKX', opportunity['symbol'])
             is_long = opportunity['long_exchange'] == 'OKX'
             funding_rate = opportunity['long_exchange_funding_rate'] if is_long else opportunity['short_exchange_funding_rate']
-            number_of_funding_events_in_time_period = self.okx_caller.get_next_funding_events_for_time_period(symbol, time_period_hours)
+            number_of_funding_events_in_time_period = self.get_number_of_funding_events('OKX', symbol, time_period_hours)
 
             if is_long:
                 if funding_rate > 0:
@@ -285,7 +303,25 @@ class ProfitabilityChecker:
             logger.error(f'CheckProfitability - Error estimating OKX profit for {symbol}: {e}')
             return None
 
-    def estimate_GMX_profit(self, time_period_hours: float, absolute_size_usd: float, opportunity: dict, open_interest: dict) -> float:
+    @property
+    def bybit_caller(self) -> ByBitCaller:
+        if self._bybit_caller is None:
+            self._bybit_caller = ByBitCaller()
+        return self._bybit_caller
+
+    def get_number_of_funding_events(self, exchange: str, symbol: str, time_period_hours: float) -> int:
+        if FundingCalendar.has_schedule(exchange, symbol):
+            return FundingCalendar.count_events(exchange, symbol, time_period_hours)
+
+        logger.warning(f'CheckProfitability - No {exchange} funding schedule loaded for {symbol}, querying the API directly.')
+        if exchange == 'ByBit':
+            return self.bybit_caller.get_next_funding_events_for_time_period(symbol, time_period_hours)
+        elif exchange == 'OKX':
+            return self.okx_caller.get_next_funding_events_for_time_period(symbol, time_period_hours)
+
+    def estimate_GMX_profit(self, time_period_hours: float, absolute_size_usd: float, opportunity: dict, open_interest: dict = None) -> float:
+        if open_interest is None:
+            open_interest = self.gmx_open_interest
         is_long: bool = opportunity['long_exchange'] == 'GMX'
         symbol = str(opportunity['symbol'])
         initial_funding_rate_8h = opportunity['long_exchange_funding_rate_8hr'] if is_long else opportunity['short_exchange_funding_rate_8hr']
@@ -308,7 +344,7 @@ class ProfitabilityChecker:
                 opportunity,
                 is_long,
                 absolute_size_usd,
-                self.gmx_prices
+                self.gmx_snapshot
             )
 
             total_funding = calculate_profit_gmx(
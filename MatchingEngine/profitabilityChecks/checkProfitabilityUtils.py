@@ -12,3 +12,33 @@ def get_adjusted_size(size: float, is_long: bool) -> float:
         logger.error(f'CheckProfitabilityUtils - Error while calculating adjusted trade size for size {size}, is_long = {is_long}: {e}')
         return None
 
+class LegEstimateCache:
+    """
+    Per-cycle memo of single-leg estimates, keyed on (estimate, exchange, symbol, side, size, duration),
+    so a leg that appears in several exchange pairs is only estimated once.
+    """
+    def __init__(self):
+        self._estimates = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_compute(self, key: tuple, compute_estimate):
+        if key in self._estimates:
+            self.hits += 1
+            return self._estimates[key]
+
+        self.misses += 1
+        estimate = compute_estimate()
+        if estimate is not None:
+            self._estimates[key] = estimate
+        return estimate
+
+    def clear(self):
+        self._estimates = {}
+        self.hits = 0
+        self.misses = 0
+
+def build_leg_estimate_key(estimate_name: str, opportunity: dict, exchange: str, size_usd: float, time_period_hours: float = None) -> tuple:
+    side = 'long' if opportunity['long_exchange'] == exchange else 'short'
+    duration = round(float(time_period_hours), 6) if time_period_hours is not None else None
+    return (estimate_name, exchange, opportunity['symbol'], side, round(float(size_usd), 6), duration)
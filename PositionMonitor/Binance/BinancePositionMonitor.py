@@ -2,24 +2,24 @@ from PositionMonitor.Master.MasterPositionMonitorUtils import *
 from GlobalUtils.logger import *
 from GlobalUtils.globalUtils import *
 from binance.enums import *
-import sqlite3
+from PositionMonitor.TradeDatabase.TradeDatabase import TradeDatabase
 from dotenv import load_dotenv
 
 load_dotenv()
 
 class BinancePositionMonitor():
     def __init__(self, db_path='trades.db'):
-        self.client = GLOBAL_BINANCE_CLIENT
+        self.client = ClientRegistry.get('Binance')
         self.db_path = db_path
         try:
-            self.conn = sqlite3.connect(self.db_path)
+            TradeDatabase.get_connection(self.db_path)
         except Exception as e:
             logger.error(f"BinancePositionMonitor - Error accessing the database: {e}")
             return None
 
-    def is_near_liquidation_price(self, position: dict) -> bool:
+    def is_near_liquidation_price(self, position: dict, asset_price: float = None) -> bool:
         try:
-            percentage_from_liqiudation_price = get_percentage_away_from_liquidation_price(position)
+            percentage_from_liqiudation_price = get_percentage_away_from_liquidation_price(position, asset_price)
             if percentage_from_liqiudation_price > float(os.getenv('MAX_ALLOWABLE_PERCENTAGE_AWAY_FROM_LIQUIDATION_PRICE')):
                 return True
 
@@ -42,7 +42,7 @@ class BinancePositionMonitor():
 
     def is_open_position(self) -> bool:
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with TradeDatabase.get_connection(self.db_path) as conn:
                 cursor = conn.cursor()
                 
                 sql_query = '''
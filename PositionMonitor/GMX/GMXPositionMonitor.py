@@ -3,21 +3,23 @@ from GlobalUtils.logger import *
 from PositionMonitor.Master.MasterPositionMonitorUtils import *
 from APICaller.GMX.GMXContractUtils import *
 from APICaller.GMX.GMXCallerUtils import *
+from APICaller.GMX.GMXMarketSnapshot import GMXSnapshotService
 from GlobalUtils.MarketDirectories.GMXMarketDirectory import GMXMarketDirectory
 import sqlite3
+from PositionMonitor.TradeDatabase.TradeDatabase import TradeDatabase
 
 class GMXPositionMonitor():
     def __init__(self, db_path='trades.db'):
         self.db_path = db_path
         try:
-            self.conn = sqlite3.connect(self.db_path)
+            TradeDatabase.get_connection(self.db_path)
         except Exception as e:
             logger.error(f"GMXPositionMonitor - Error accessing the database: {e}")
             return None
 
     def get_open_position(self) -> dict:
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with TradeDatabase.get_connection(self.db_path) as conn:
                 cursor = conn.cursor()
                 cursor.execute('''SELECT * FROM trade_log WHERE open_close = 'Open' AND exchange = 'GMX';''')
                 open_position = cursor.fetchone()
@@ -37,9 +39,9 @@ class GMXPositionMonitor():
             return None
 
 
-    def is_near_liquidation_price(self, position: dict) -> bool:
+    def is_near_liquidation_price(self, position: dict, asset_price: float = None) -> bool:
         try:
-            percentage_from_liqiudation_price = get_percentage_away_from_liquidation_price(position)
+            percentage_from_liqiudation_price = get_percentage_away_from_liquidation_price(position, asset_price)
             MAX_ALLOWABLE_PERCENTAGE_AWAY_FROM_LIQUIDATION_PRICE = float(os.getenv('MAX_ALLOWABLE_PERCENTAGE_AWAY_FROM_LIQUIDATION_PRICE'))
             if percentage_from_liqiudation_price < MAX_ALLOWABLE_PERCENTAGE_AWAY_FROM_LIQUIDATION_PRICE:
                 return True
@@ -54,23 +56,9 @@ class GMXPositionMonitor():
         try:
             symbol = position['symbol']
             is_long = True if position['side'] == 'Long' else False
-            market = GMXMarketDirectory.get_market_key_for_symbol(symbol)
-            oracle_prices = OraclePrices(ARBITRUM_CONFIG_OBJECT.chain).get_recent_prices()
-            open_interest = OpenInterest(ARBITRUM_CONFIG_OBJECT)._get_data_processing(
-                oracle_prices,
-                market
-            )
-
-            funding_rate = GetFundingFee(ARBITRUM_CONFIG_OBJECT)._get_data_processing(
-                open_interest,
-                oracle_prices,
-                market
-            )
-
-            borrow_rate = GetBorrowAPR(ARBITRUM_CONFIG_OBJECT)._get_data_processing(
-                oracle_prices,
-                market
-            )
+            snapshot = GMXSnapshotService.get_snapshot()
+            funding_rate = snapshot.funding_apr
+            borrow_rate = snapshot.borrow_apr
 
             if is_long:
                 funding = funding_rate['long'][symbol]
@@ -90,7 +78,7 @@ class GMXPositionMonitor():
 
     def is_open_position(self) -> bool:
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with TradeDatabase.get_connection(self.db_path) as conn:
                 cursor = conn.cursor()
                 cursor.execute('''SELECT * FROM trade_log WHERE open_close = 'Open' AND exchange = 'GMX';''')
                 open_positions = cursor.fetchall()
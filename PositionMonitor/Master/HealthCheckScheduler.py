@@ -0,0 +1,215 @@
+from GlobalUtils.logger import logger
+from GlobalUtils.FundingCalendar import FundingCalendar
+from GlobalUtils.ExchangeAdapters import ExchangeAdapterRegistry
+from collections import deque
+from typing import NamedTuple
+import threading
+import math
+import time
+import os
+
+DEFAULT_MIN_HEALTH_CHECK_INTERVAL_SECONDS = 0.5
+DEFAULT_MAX_HEALTH_CHECK_INTERVAL_SECONDS = 300
+DEFAULT_FULL_HEALTH_CHECK_MIN_INTERVAL_SECONDS = 15
+FALLBACK_HEALTH_CHECK_INTERVAL_SECONDS = 15
+
+# How many standard deviations of price movement must fit inside the liquidation headroom before the next check.
+HEALTH_CHECK_SAFETY_SIGMAS = 3
+# Checks land at most this far before a discrete funding settlement, so the settlement is seen as it happens.
+FUNDING_SETTLEMENT_LEAD_SECONDS = 5
+VOLATILITY_WINDOW_SECONDS = 600
+MIN_VOLATILITY_SAMPLES = 5
+HEALTH_CHECK_DECISION_HISTORY_LENGTH = 500
+
+# Upper bounds (seconds) of the chosen-interval histogram buckets; the last bucket is open-ended.
+HEALTH_CHECK_INTERVAL_BUCKETS_SECONDS = [1, 5, 15, 60, 120, 300]
+
+
+class HealthCheckDecision(NamedTuple):
+    decided_at: float
+    interval_seconds: float
+    is_full_check_due: bool
+    driver: str
+    liquidation_headroom_percentage: float
+    volatility_percentage_per_sqrt_second: float
+    seconds_to_funding: float
+
+
+def get_seconds_to_next_funding(positions_by_exchange, now_ms: int = None) -> float:
+    """
+    Seconds until the soonest discrete funding settlement on any open leg, or None if every leg
+    funds continuously or has no schedule loaded.
+    """
+    if now_ms is None:
+        now_ms = int(time.time() * 1000)
+
+    seconds_to_funding = None
+    for exchange, position in positions_by_exchange.items():
+        symbol = position['symbol']
+        if not FundingCalendar.has_schedule(exchange, symbol) and ExchangeAdapterRegistry.is_registered(exchange):
+            symbol = ExchangeAdapterRegistry.format_symbol(exchange, symbol)
+        if not FundingCalendar.has_schedule(exchange, symbol):
+            continue
+
+        next_funding_time_ms = FundingCalendar.get_next_funding_time(exchange, symbol, now_ms)
+        if next_funding_time_ms is None:
+            continue
+        leg_seconds_to_funding = (next_funding_time_ms - now_ms) / 1000
+        if seconds_to_funding is None or leg_seconds_to_funding < seconds_to_funding:
+            seconds_to_funding = leg_seconds_to_funding
+
+    return seconds_to_funding
+
+
+class HealthCheckScheduler:
+    """
+    Decides when the next health check runs. The interval is the time a SAFETY_SIGMAS price move needs
+    to use up the remaining liquidation headroom at the recently observed volatility, cut short ahead of
+    the next discrete funding settlement and clamped between the min and max interval. Intervals shorter
+    than the full-check minimum are served by price-only liquidation checks between full checks, so
+    venue calls stay bounded while price checks can run sub-second.
+    """
+    def __init__(self):
+        self.min_interval_seconds = float(os.getenv('MIN_HEALTH_CHECK_INTERVAL_SECONDS') or DEFAULT_MIN_HEALTH_CHECK_INTERVAL_SECONDS)
+        self.max_interval_seconds = float(os.getenv('MAX_HEALTH_CHECK_INTERVAL_SECONDS') or DEFAULT_MAX_HEALTH_CHECK_INTERVAL_SECONDS)
+        self.full_check_min_interval_seconds = float(os.getenv('FULL_HEALTH_CHECK_MIN_INTERVAL_SECONDS') or DEFAULT_FULL_HEALTH_CHECK_MIN_INTERVAL_SECONDS)
+        self._lock = threading.Lock()
+        self._price_samples = deque()
+        self._last_full_check_at = None
+        self._decisions = deque(maxlen=HEALTH_CHECK_DECISION_HISTORY_LENGTH)
+        self._interval_bucket_counts = [0] * (len(HEALTH_CHECK_INTERVAL_BUCKETS_SECONDS) + 1)
+        self._driver_counts = {}
+        self._full_check_count = 0
+        self._price_check_count = 0
+
+    def reset(self):
+        with self._lock:
+            self._price_samples.clear()
+            self._last_full_check_at = None
+
+    def record_price(self, price: float, observed_at: float = None):
+        if price is None or price <= 0:
+            return
+        if observed_at is None:
+            observed_at = time.monotonic()
+
+        with self._lock:
+            self._price_samples.append((observed_at, price))
+            while self._price_samples and observed_at - self._price_samples[0][0] > VOLATILITY_WINDOW_SECONDS:
+                self._price_samples.popleft()
+
+    def record_check(self, is_full_check: bool, checked_at: float = None):
+        with self._lock:
+            if is_full_check:
+                self._last_full_check_at = checked_at if checked_at is not None else time.monotonic()
+                self._full_check_count += 1
+            else:
+                self._price_check_count += 1
+
+    def is_full_check_due(self, now: float = None) -> bool:
+        if now is None:
+            now = time.monotonic()
+        with self._lock:
+            return self._last_full_check_at is None or now - self._last_full_check_at >= self.full_check_min_interval_seconds
+
+    def get_volatility(self) -> float:
+        """
+        Standard deviation of log returns per sqrt(second), in percent, over the recent price samples.
+        """
+        with self._lock:
+            samples = list(self._price_samples)
+
+        if len(samples) < MIN_VOLATILITY_SAMPLES:
+            return None
+
+        variance_per_second = 0.0
+        total_seconds = 0.0
+        for (previous_time, previous_price), (sample_time, price) in zip(samples, samples[1:]):
+            elapsed_seconds = sample_time - previous_time
+            if elapsed_seconds <= 0:
+                continue
+            variance_per_second += math.log(price / previous_price) ** 2
+            total_seconds += elapsed_seconds
+
+        if total_seconds == 0:
+            return None
+
+        return math.sqrt(variance_per_second / total_seconds) * 100
+
+    def next_interval(self, liquidation_headroom_percentage: float, seconds_to_funding: float = None) -> HealthCheckDecision:
+        """
+        liquidation_headroom_percentage: how far, in percent of price, the closest leg still is from
+        breaching MAX_ALLOWABLE_PERCENTAGE_AWAY_FROM_LIQUIDATION_PRICE. None if it could not be computed.
+        """
+        volatility = self.get_volatility()
+
+        if liquidation_headroom_percentage is None:
+            interval_seconds = FALLBACK_HEALTH_CHECK_INTERVAL_SECONDS
+            driver = 'unknown_headroom'
+        elif liquidation_headroom_percentage <= 0:
+            interval_seconds = self.min_interval_seconds
+            driver = 'liquidation_breached'
+        elif volatility is None:
+            interval_seconds = FALLBACK_HEALTH_CHECK_INTERVAL_SECONDS
+            driver = 'warming_up'
+        elif volatility == 0:
+            interval_seconds = self.max_interval_seconds
+            driver = 'liquidation_distance'
+        else:
+            interval_seconds = (liquidation_headroom_percentage / (HEALTH_CHECK_SAFETY_SIGMAS * volatility)) ** 2
+            driver = 'liquidation_distance'
+
+        if seconds_to_funding is not None:
+            seconds_before_settlement = max(seconds_to_funding - FUNDING_SETTLEMENT_LEAD_SECONDS, 0)
+            if seconds_before_settlement < interval_seconds:
+                interval_seconds = seconds_before_settlement
+                driver = 'funding_settlement'
+
+        interval_seconds = min(max(interval_seconds, self.min_interval_seconds), self.max_interval_seconds)
+        now = time.monotonic()
+        decision = HealthCheckDecision(
+            decided_at=time.time(),
+            interval_seconds=interval_seconds,
+            is_full_check_due=self.is_full_check_due(now + interval_seconds),
+            driver=driver,
+            liquidation_headroom_percentage=liquidation_headroom_percentage,
+            volatility_percentage_per_sqrt_second=volatility,
+            seconds_to_funding=seconds_to_funding
+        )
+        self._record_decision(decision)
+        return decision
+
+    def _record_decision(self, decision: HealthCheckDecision):
+        with self._lock:
+            self._decisions.append(decision)
+            bucket_index = next(
+                (i for i, bound in enumerate(HEALTH_CHECK_INTERVAL_BUCKETS_SECONDS) if decision.interval_seconds <= bound),
+                len(HEALTH_CHECK_INTERVAL_BUCKETS_SECONDS)
+            )
+            self._interval_bucket_counts[bucket_index] += 1
+            self._driver_counts[decision.driver] = self._driver_counts.get(decision.driver, 0) + 1
+
+        logger.info(f"HealthCheckScheduler - Next check in {decision.interval_seconds:.2f}s ({decision.driver}): headroom = {decision.liquidation_headroom_percentage}%, volatility = {decision.volatility_percentage_per_sqrt_second}, seconds to funding = {decision.seconds_to_funding}")
+
+    def get_last_decision(self) -> HealthCheckDecision:
+        with self._lock:
+            return self._decisions[-1] if self._decisions else None
+
+    def get_metrics(self) -> dict:
+        with self._lock:
+            decisions = list(self._decisions)
+            bucket_labels = [f'<={bound}s' for bound in HEALTH_CHECK_INTERVAL_BUCKETS_SECONDS] + [f'>{HEALTH_CHECK_INTERVAL_BUCKETS_SECONDS[-1]}s']
+            metrics = {
+                'interval_buckets': dict(zip(bucket_labels, self._interval_bucket_counts)),
+                'drivers': dict(self._driver_counts),
+                'full_checks': self._full_check_count,
+                'price_checks': self._price_check_count
+            }
+
+        if decisions:
+            intervals = [decision.interval_seconds for decision in decisions]
+            metrics['average_interval_seconds'] = sum(intervals) / len(intervals)
+            metrics['min_interval_seconds'] = min(intervals)
+            metrics['last_decision'] = decisions[-1]._asdict()
+
+        return metrics
@@ -0,0 +1,131 @@
+from PositionMonitor.Master.MasterPositionMonitorUtils import *
+from PositionMonitor.Master.PriceStream import PriceStream, PriceTick
+from GlobalUtils.logger import logger
+from pubsub import pub
+from typing import NamedTuple
+import bisect
+import threading
+import time
+import os
+
+# Upper bounds (milliseconds) of the tick-to-close-event latency histogram buckets; the last bucket is open-ended.
+LIQUIDATION_GUARD_LATENCY_BUCKETS_MS = [0.1, 0.5, 1, 5, 10, 50, 100]
+
+
+class LiquidationTrigger(NamedTuple):
+    symbol: str
+    position_symbol: str
+    exchanges: tuple
+    long_trigger_price: float
+    short_trigger_price: float
+
+    def is_breached(self, price: float) -> bool:
+        return (
+            (self.long_trigger_price is not None and price <= self.long_trigger_price)
+            or (self.short_trigger_price is not None and price >= self.short_trigger_price)
+        )
+
+
+class LiquidationGuard:
+    """
+    Holds, per open pair, the prices at which a leg comes within MAX_ALLOWABLE_PERCENTAGE_AWAY_FROM_LIQUIDATION_PRICE
+    of liquidation, computed once when the pair is armed. Each price tick is then one dict lookup and
+    two comparisons; on a breach CLOSE_POSITION_PAIR is sent once and the pair is disarmed. The time
+    from the tick entering the stream to the close event being sent is recorded.
+    """
+    def __init__(self, price_stream: PriceStream = None):
+        self._lock = threading.Lock()
+        self._triggers = {}
+        self._latency_bucket_counts = [0] * (len(LIQUIDATION_GUARD_LATENCY_BUCKETS_MS) + 1)
+        self._latency_count = 0
+        self._latency_total_ms = 0.0
+        self._latency_max_ms = 0.0
+        if price_stream is not None:
+            price_stream.subscribe(self.on_price)
+
+    def arm(self, snapshot: PositionSnapshot) -> LiquidationTrigger:
+        try:
+            max_allowable_percentage = float(os.getenv('MAX_ALLOWABLE_PERCENTAGE_AWAY_FROM_LIQUIDATION_PRICE'))
+            long_trigger_prices = []
+            short_trigger_prices = []
+            for position in snapshot.positions_by_exchange.values():
+                trigger_price = get_liquidation_trigger_price(position, max_allowable_percentage)
+                if trigger_price is None:
+                    continue
+                if position['side'].lower() == 'long':
+                    long_trigger_prices.append(trigger_price)
+                else:
+                    short_trigger_prices.append(trigger_price)
+
+            # Only the leg closest to its trigger matters: the highest long trigger and the lowest short trigger.
+            trigger = LiquidationTrigger(
+                symbol=normalize_symbol(snapshot.symbol),
+                position_symbol=snapshot.symbol,
+                exchanges=tuple(snapshot.exchanges),
+                long_trigger_price=max(long_trigger_prices) if long_trigger_prices else None,
+                short_trigger_price=min(short_trigger_prices) if short_trigger_prices else None
+            )
+            with self._lock:
+                self._triggers[trigger.symbol] = trigger
+
+            return trigger
+
+        except Exception as e:
+            logger.error(f"LiquidationGuard - Failed to arm guard for {snapshot.symbol}. Error: {e}")
+            return None
+
+    def disarm(self, symbol: str = None):
+        with self._lock:
+            if symbol is None:
+                self._triggers = {}
+            else:
+                self._triggers.pop(symbol, None)
+
+    def get_trigger(self, symbol: str) -> LiquidationTrigger:
+        with self._lock:
+            return self._triggers.get(symbol)
+
+    def is_breached(self, symbol: str, price: float) -> bool:
+        trigger = self.get_trigger(symbol)
+        return trigger is not None and trigger.is_breached(price)
+
+    def on_price(self, tick: PriceTick):
+        trigger = self._triggers.get(tick.symbol)
+        if trigger is None or not trigger.is_breached(tick.price):
+            return
+
+        with self._lock:
+            # Another tick may have fired first; only the one that removes the trigger sends the close.
+            if self._triggers.get(tick.symbol) is not trigger:
+                return
+            del self._triggers[tick.symbol]
+
+        pub.sendMessage(
+            EventsDirectory.CLOSE_POSITION_PAIR.value,
+            symbol=trigger.position_symbol,
+            reason=PositionCloseReason.LIQUIDATION_RISK.value,
+            exchanges=list(trigger.exchanges)
+        )
+        latency_ms = (time.monotonic() - tick.received_at) * 1000
+        self.record_latency(latency_ms)
+        logger.warning(f"LiquidationGuard - {trigger.position_symbol} at {tick.price} breached trigger {trigger}, close requested after {latency_ms:.3f}ms")
+
+    def record_latency(self, latency_ms: float):
+        with self._lock:
+            self._latency_bucket_counts[bisect.bisect_left(LIQUIDATION_GUARD_LATENCY_BUCKETS_MS, latency_ms)] += 1
+            self._latency_count += 1
+            self._latency_total_ms += latency_ms
+            self._latency_max_ms = max(self._latency_max_ms, latency_ms)
+
+    def get_latency_metrics(self) -> dict:
+        with self._lock:
+            if self._latency_count == 0:
+                return {'count': 0}
+
+            bucket_labels = [f'<={bound}ms' for bound in LIQUIDATION_GUARD_LATENCY_BUCKETS_MS] + [f'>{LIQUIDATION_GUARD_LATENCY_BUCKETS_MS[-1]}ms']
+            return {
+                'buckets': dict(zip(bucket_labels, self._latency_bucket_counts)),
+                'count': self._latency_count,
+                'average_ms': self._latency_total_ms / self._latency_count,
+                'max_ms': self._latency_max_ms
+            }
@@ -1,82 +1,176 @@
-from PositionMonitor.Synthetix.SynthetixPositionMonitor import SynthetixPositionMonitor
-from PositionMonitor.Binance.BinancePositionMonitor import BinancePositionMonitor
-from PositionMonitor.HMX.HMXPositionMonitor import HMXPositionMonitor
-from PositionMonitor.GMX.GMXPositionMonitor import GMXPositionMonitor
-from PositionMonitor.ByBit.ByBitPositionMonitor import ByBitPositionMonitor
 from PositionMonitor.Master.MasterPositionMonitorUtils import *
 from GlobalUtils.logger import *
 from GlobalUtils.globalUtils import *
 from GlobalUtils.MarketDirectories.SynthetixMarketDirectory import SynthetixMarketDirectory
+from GlobalUtils.ClientRegistry import LazyExchangeObjects
+from GlobalUtils.EventBus import EventBus
+from PositionMonitor.Master.HealthCheckScheduler import HealthCheckScheduler, get_seconds_to_next_funding
+from PositionMonitor.Master.LiquidationGuard import LiquidationGuard
+from PositionMonitor.Master.PriceStream import PriceStream
 from pubsub import pub
+from concurrent.futures import ThreadPoolExecutor
 import threading
-import sqlite3
 import time
 
-class MasterPositionMonitor():
+class MasterPositionMonitor(LazyExchangeObjects):
+    _exchange_role = 'monitor'
+
     def __init__(self):
-        self.synthetix = SynthetixPositionMonitor()
-        self.binance = BinancePositionMonitor()
-        self.hmx = HMXPositionMonitor()
-        self.gmx = GMXPositionMonitor()
-        self.bybit = ByBitPositionMonitor()
         self.health_check_thread = None
         self.stop_health_check = threading.Event()
+        self.health_check_scheduler = HealthCheckScheduler()
+        self.price_stream = PriceStream()
+        self.liquidation_guard = LiquidationGuard(self.price_stream)
         
-        pub.subscribe(self.on_position_opened, EventsDirectory.TRADE_LOGGED.value)
-        pub.subscribe(self.on_position_closed, EventsDirectory.POSITION_CLOSED.value)
+        EventBus.subscribe(self.on_position_opened, EventsDirectory.TRADE_LOGGED.value)
+        EventBus.subscribe(self.on_position_closed, EventsDirectory.POSITION_CLOSED.value)
 
     def on_position_opened(self, position_data):
         if self.health_check_thread is None or not self.health_check_thread.is_alive():
-            time.sleep(60)
             self.stop_health_check.clear()  
+            self.health_check_scheduler.reset()
             self.health_check_thread = threading.Thread(target=self.start_health_check, daemon=True)
             self.health_check_thread.start()
 
     def on_position_closed(self, position_report):
         self.stop_health_check.set()
+        self.liquidation_guard.disarm()
 
     def start_health_check(self):
+        # Give the venues time to report the new position before the first check.
+        if self.stop_health_check.wait(HEALTH_CHECK_START_DELAY_SECONDS):
+            return
+
+        snapshot = None
         while not self.stop_health_check.is_set():
-            self.position_health_check()
-            time.sleep(15)
+            if snapshot is None or self.health_check_scheduler.is_full_check_due():
+                snapshot = self.position_health_check()
+                self.health_check_scheduler.record_check(is_full_check=True)
+            else:
+                snapshot = self.price_health_check(snapshot)
+                self.health_check_scheduler.record_check(is_full_check=False)
+
+            if snapshot is None:
+                decision = self.health_check_scheduler.next_interval(None)
+            else:
+                self.health_check_scheduler.record_price(snapshot.prices_by_symbol.get(normalize_symbol(snapshot.symbol)))
+                decision = self.health_check_scheduler.next_interval(
+                    get_liquidation_headroom_percentage(snapshot),
+                    get_seconds_to_next_funding(snapshot.positions_by_exchange)
+                )
+
+            self.stop_health_check.wait(decision.interval_seconds)
+
+    def get_health_check_metrics(self) -> dict:
+        return self.health_check_scheduler.get_metrics()
+
+    def get_liquidation_guard_metrics(self) -> dict:
+        return self.liquidation_guard.get_latency_metrics()
+
+    def price_health_check(self, snapshot: PositionSnapshot) -> PositionSnapshot:
+        """
+        Liquidation-only check between full checks: re-prices the last snapshot's legs with one Pyth
+        request and publishes the prices to the stream, where the armed LiquidationGuard acts on them.
+        Makes no venue calls.
+        """
+        try:
+            symbols = list(snapshot.prices_by_symbol.keys())
+            prices_by_symbol = PythPriceCache.refresh(symbols)
+            if not prices_by_symbol:
+                logger.error(f"MasterPositionMonitor - No prices returned for {symbols}, keeping previous snapshot.")
+                return snapshot
+
+            for symbol, price in prices_by_symbol.items():
+                self.price_stream.publish(symbol, price)
 
-    def position_health_check(self):
-        exchanges = self.get_exchanges_for_open_position()
-        symbol = self.get_symbol_for_open_position()
-        is_liquidation_risk = self.check_liquidation_risk(exchanges)
-        is_profitable = self.check_profitability_for_open_positions(exchanges)
-        is_delta_within_bounds = self.is_position_delta_within_bounds(exchanges)
+            return snapshot._replace(taken_at=time.time(), prices_by_symbol=MappingProxyType(dict(prices_by_symbol)))
 
-        is_funding_velocity_turning = False
-        if 'Synthetix' in exchanges:
-            is_funding_velocity_turning = self.is_synthetix_funding_turning_against_trade_in_given_time(15)
+        except Exception as e:
+            logger.error(f"MasterPositionMonitor - Error during price health check: {e}")
+            return snapshot
+
+    def position_health_check(self) -> PositionSnapshot:
+        snapshot = self.build_snapshot()
+        if snapshot is None:
+            return None
 
+        symbol = snapshot.symbol
+        exchanges = list(snapshot.exchanges)
+
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix='MasterPositionMonitor') as executor:
+            funding_velocity_future = None
+            if 'Synthetix' in exchanges:
+                funding_velocity_future = executor.submit(self.is_synthetix_funding_turning_against_trade_in_given_time, 15, snapshot)
+
+            is_liquidation_risk = self.check_liquidation_risk(snapshot)
+            is_profitable = self.check_profitability_for_open_positions(snapshot)
+            is_delta_within_bounds = self.is_position_delta_within_bounds(snapshot)
+            is_funding_velocity_turning = funding_velocity_future.result() if funding_velocity_future is not None else False
+
+        reason = None
         if is_liquidation_risk:
             reason = PositionCloseReason.LIQUIDATION_RISK.value
-            pub.sendMessage(EventsDirectory.CLOSE_POSITION_PAIR.value, symbol=symbol, reason=reason, exchanges=exchanges)
         elif not is_profitable:
             reason = PositionCloseReason.NO_LONGER_PROFITABLE.value
-            pub.sendMessage(EventsDirectory.CLOSE_POSITION_PAIR.value, symbol=symbol, reason=reason, exchanges=exchanges)
         elif not is_delta_within_bounds:
             reason = PositionCloseReason.DELTA_ABOVE_BOUND.value
-            pub.sendMessage(EventsDirectory.CLOSE_POSITION_PAIR.value, symbol=symbol, reason=reason, exchanges=exchanges)
         elif is_funding_velocity_turning:
             reason = PositionCloseReason.FUNDING_TURNING_AGAINST_TRADE.value
+
+        if reason is not None:
+            # The pair is being closed, so the guard must not request a second close for it.
+            self.liquidation_guard.disarm(normalize_symbol(symbol))
             pub.sendMessage(EventsDirectory.CLOSE_POSITION_PAIR.value, symbol=symbol, reason=reason, exchanges=exchanges)
         else:
+            # Liquidation prices can move with funding and margin changes, so re-derive the triggers every full check.
+            self.liquidation_guard.arm(snapshot)
             logger.info('MasterPositionMonitor - no threat detected for open position')
 
-    def check_liquidation_risk(self, exchanges: list) -> bool:
+        return snapshot
+
+    def build_snapshot(self) -> PositionSnapshot:
+        """
+        Reads the open legs once, prices every symbol they hold in one Pyth request and fetches each
+        venue's funding rate concurrently, so all checks in a tick see the same state.
+        """
+        try:
+            positions_by_exchange = get_open_positions_by_exchange()
+            if positions_by_exchange is None:
+                return None
+
+            if len(positions_by_exchange) < 2:
+                logger.error(f"MasterPositionMonitor - Expected at least 2 exchanges with open positions but found {len(positions_by_exchange)}: {list(positions_by_exchange.keys())}")
+                return None
+
+            symbols = list({normalize_symbol(position['symbol']) for position in positions_by_exchange.values()})
+            prices_by_symbol = PythPriceCache.refresh(symbols)
+
+            with ThreadPoolExecutor(max_workers=len(positions_by_exchange), thread_name_prefix='MasterPositionMonitor') as executor:
+                funding_rate_futures = {
+                    exchange: executor.submit(getattr(self, exchange.lower()).get_funding_rate, position)
+                    for exchange, position in positions_by_exchange.items()
+                }
+                funding_rates_by_exchange = {exchange: future.result() for exchange, future in funding_rate_futures.items()}
+
+            snapshot = build_position_snapshot(positions_by_exchange, prices_by_symbol, funding_rates_by_exchange)
+            logger.info(f"MasterPositionMonitor - Built snapshot for exchanges {snapshot.exchanges}: prices = {dict(snapshot.prices_by_symbol)}, funding rates = {dict(snapshot.funding_rates_by_exchange)}")
+            return snapshot
+
+        except Exception as e:
+            logger.error(f"MasterPositionMonitor - Error while building position snapshot: {e}")
+            return None
+
+    def check_liquidation_risk(self, snapshot: PositionSnapshot) -> bool:
         try:
-            first_exchange = str(exchanges[0])
-            second_exchange = str(exchanges[1])
+            first_exchange = str(snapshot.exchanges[0])
+            second_exchange = str(snapshot.exchanges[1])
             
-            position_one = get_open_position_for_exchange(first_exchange)
-            position_two = get_open_position_for_exchange(second_exchange)
+            position_one = snapshot.positions_by_exchange[first_exchange]
+            position_two = snapshot.positions_by_exchange[second_exchange]
 
         
-            is_first_exchange_risk: bool = getattr(self, first_exchange.lower()).is_near_liquidation_price(position_one)
-            is_second_exchange_risk: bool = getattr(self, second_exchange.lower()).is_near_liquidation_price(position_two)
+            is_first_exchange_risk: bool = getattr(self, first_exchange.lower()).is_near_liquidation_price(position_one, snapshot.get_asset_price(first_exchange))
+            is_second_exchange_risk: bool = getattr(self, second_exchange.lower()).is_near_liquidation_price(position_two, snapshot.get_asset_price(second_exchange))
 
             if is_first_exchange_risk == None:
                 logger.error(f'MasterPositionMonitor - is_near_liquidation_price return value for exchange {first_exchange} = None')
@@ -91,19 +185,19 @@ class MasterPositionMonitor():
             else:
                 return False
         except Exception as e:
-            logger.error(f"MasterPositionMonitor - Error while checking liquidation risk for positions on exchanges {exchanges}: {e}")
+            logger.error(f"MasterPositionMonitor - Error while checking liquidation risk for positions on exchanges {snapshot.exchanges}: {e}")
             return False
 
-    def check_profitability_for_open_positions(self, exchanges: list) -> bool:
+    def check_profitability_for_open_positions(self, snapshot: PositionSnapshot) -> bool:
         try:
-            first_exchange = str(exchanges[0])
-            second_exchange = str(exchanges[1])
+            first_exchange = str(snapshot.exchanges[0])
+            second_exchange = str(snapshot.exchanges[1])
 
-            position_one = get_open_position_for_exchange(first_exchange)
-            position_two = get_open_position_for_exchange(second_exchange)
+            position_one = snapshot.positions_by_exchange[first_exchange]
+            position_two = snapshot.positions_by_exchange[second_exchange]
 
-            first_funding_rate = getattr(self, first_exchange.lower()).get_funding_rate(position_one)
-            second_funding_rate = getattr(self, second_exchange.lower()).get_funding_rate(position_two)
+            first_funding_rate = snapshot.funding_rates_by_exchange[first_exchange]
+            second_funding_rate = snapshot.funding_rates_by_exchange[second_exchange]
 
             first_funding_rate = abs(first_funding_rate)
             second_funding_rate = abs(second_funding_rate)
@@ -124,13 +218,14 @@ class MasterPositionMonitor():
             logger.error(f"MasterPositionMonitor - Error checking overall profitability for open positions: {e}", exc_info=True)
             return None
 
-    def is_position_delta_within_bounds(self, exchanges: list) -> bool:
+    def is_position_delta_within_bounds(self, snapshot: PositionSnapshot) -> bool:
         try:
             delta_bound = float(os.getenv('DELTA_BOUND', '0.03'))
+            exchanges = snapshot.exchanges
             positions = {}
 
             for exchange in exchanges:
-                position = get_open_position_for_exchange(exchange)
+                position = snapshot.positions_by_exchange.get(exchange)
                 if not position:
                     logger.error(f"MasterPositionMonitor - Position for exchange {exchange} is missing when trying to calculate delta.")
                     return False
@@ -151,10 +246,10 @@ class MasterPositionMonitor():
 
 
 
-    def is_synthetix_funding_turning_against_trade_in_given_time(self, mins: int) -> bool:
+    def is_synthetix_funding_turning_against_trade_in_given_time(self, mins: int, snapshot: PositionSnapshot) -> bool:
         symbol = '' 
         try:
-            synthetix_position = self.synthetix.get_open_position()
+            synthetix_position = snapshot.positions_by_exchange.get('Synthetix')
             if not synthetix_position:
                 logger.error("MasterPositionMonitor - No open position found.")
                 return None
@@ -166,7 +261,7 @@ class MasterPositionMonitor():
                 logger.error(f"MasterPositionMonitor - No market data available for symbol: {symbol}")
                 return None
 
-            market_summary = self.synthetix.client.perps.get_market_summary(market_data['market_id'])
+            market_summary = self.synthetix.client.perps.get_market_summary(market_data.market_id)
             funding_rate = float(market_summary['current_funding_rate'])
             velocity = float(market_summary['current_funding_velocity'])
             is_long = synthetix_position['size_in_asset'] > 0
@@ -182,50 +277,3 @@ class MasterPositionMonitor():
         except Exception as e:
             logger.error(f"MasterPositionMonitor - Error checking if funding is turning against trade for {symbol}: {e}")
             return False
-
-
-    def get_exchanges_for_open_position(self) -> list:
-        try:
-            with sqlite3.connect('trades.db') as conn:
-                cursor = conn.cursor()
-                query = """
-                        SELECT DISTINCT exchange 
-                        FROM trade_log 
-                        WHERE open_close = 'Open';
-                        """
-                cursor.execute(query)
-                exchanges = [exchange[0] for exchange in cursor.fetchall()]
-
-                if len(exchanges) >= 2:
-                    logger.info(f"MasterPositionMonitor - Found exchanges with open positions: {exchanges[:2]}")
-                    return exchanges[:2] 
-                else:
-                    error_message = f"MasterPositionMonitor - Expected at least 2 exchanges with open positions but found {len(exchanges)}: {exchanges}"
-                    logger.error(error_message)
-                    return []
-        except Exception as e:
-            logger.error(f"MasterPositionMonitor - Error retrieving exchanges with open positions. Error: {e}")
-            return None
-
-
-    def get_symbol_for_open_position(self) -> str:
-        try:
-            with sqlite3.connect('trades.db') as conn:
-                cursor = conn.cursor()
-                query = """
-                        SELECT symbol
-                        FROM trade_log
-                        WHERE open_close = 'Open'
-                        LIMIT 1; 
-                        """
-                cursor.execute(query)
-                symbol = cursor.fetchone() 
-
-                if symbol:
-                    return symbol[0]
-                else:
-                    logger.error("MasterPositionMonitor - No open position found.")
-                    return None
-        except Exception as e:
-            logger.error(f"MasterPositionMonitor - Error retrieving symbol for open position. Error: {e}")
-            return None
\ No newline at end of file
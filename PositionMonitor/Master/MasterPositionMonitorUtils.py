@@ -1,7 +1,13 @@
 from enum import Enum
 from GlobalUtils.logger import logger
 from GlobalUtils.globalUtils import *
+from types import MappingProxyType
+from typing import NamedTuple
 import sqlite3
+from PositionMonitor.TradeDatabase.TradeDatabase import TradeDatabase
+import time
+
+HEALTH_CHECK_START_DELAY_SECONDS = 60
 
 class PositionCloseReason(Enum):
     LIQUIDATION_RISK = "LIQUIDATION_RISK"
@@ -13,6 +19,84 @@ class PositionCloseReason(Enum):
     CLOSE_ALL_POSITIONS = "CLOSE_ALL_POSITIONS"
     TEST = "TEST"
     
+class PositionSnapshot(NamedTuple):
+    """
+    Everything one health-check tick needs, read once and shared by every check: the open legs
+    (one DB read), their asset prices (one batched Pyth request) and each venue's funding rate.
+    """
+    taken_at: float
+    symbol: str
+    exchanges: tuple
+    positions_by_exchange: MappingProxyType
+    prices_by_symbol: MappingProxyType
+    funding_rates_by_exchange: MappingProxyType
+
+    def get_asset_price(self, exchange: str) -> float:
+        position = self.positions_by_exchange[exchange]
+        return self.prices_by_symbol.get(normalize_symbol(position['symbol']))
+
+def build_position_snapshot(positions_by_exchange: dict, prices_by_symbol: dict, funding_rates_by_exchange: dict) -> PositionSnapshot:
+    exchanges = tuple(positions_by_exchange.keys())
+    symbol = positions_by_exchange[exchanges[0]]['symbol'] if exchanges else None
+    return PositionSnapshot(
+        taken_at=time.time(),
+        symbol=symbol,
+        exchanges=exchanges,
+        positions_by_exchange=MappingProxyType({
+            exchange: MappingProxyType(dict(position))
+            for exchange, position in positions_by_exchange.items()
+        }),
+        prices_by_symbol=MappingProxyType(dict(prices_by_symbol)),
+        funding_rates_by_exchange=MappingProxyType(dict(funding_rates_by_exchange))
+    )
+
+def get_liquidation_headroom_percentage(snapshot: PositionSnapshot) -> float:
+    """
+    Percentage of price the closest leg can still move before MAX_ALLOWABLE_PERCENTAGE_AWAY_FROM_LIQUIDATION_PRICE is breached.
+    """
+    try:
+        max_allowable_percentage = float(os.getenv('MAX_ALLOWABLE_PERCENTAGE_AWAY_FROM_LIQUIDATION_PRICE'))
+        headrooms = []
+        for exchange, position in snapshot.positions_by_exchange.items():
+            percentage = get_percentage_away_from_liquidation_price(position, snapshot.get_asset_price(exchange))
+            if percentage is None:
+                return None
+            headrooms.append(percentage - max_allowable_percentage)
+
+        return min(headrooms) if headrooms else None
+
+    except Exception as e:
+        logger.error(f"MasterPositionMonitorUtils - Error while calculating liquidation headroom. Error: {e}")
+        return None
+
+def get_open_positions_by_exchange(db_path: str = 'trades.db', max_exchanges: int = 2) -> dict:
+    try:
+        with TradeDatabase.get_connection(db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT id, strategy_execution_id, exchange, symbol,
+                side, is_hedge, size_in_asset, liquidation_price, open_close, open_time,
+                close_time, pnl, accrued_funding, close_reason
+                FROM trade_log
+                WHERE open_close = 'Open'
+                ORDER BY id;
+            ''')
+            rows = cursor.fetchall()
+
+        positions_by_exchange = {}
+        for row in rows:
+            position = get_dict_from_database_response(row)
+            if position['exchange'] not in positions_by_exchange:
+                positions_by_exchange[position['exchange']] = position
+            if len(positions_by_exchange) == max_exchanges:
+                break
+
+        return positions_by_exchange
+
+    except Exception as e:
+        logger.error(f"MasterPositionMonitorUtils - Error while reading open positions. Error: {e}")
+        return None
+
 def get_dict_from_database_response(response):
     try:
         columns = [
@@ -34,12 +118,13 @@ def get_dict_from_database_response(response):
         return None
 
 
-def get_percentage_away_from_liquidation_price(position: dict) -> float:
+def get_percentage_away_from_liquidation_price(position: dict, asset_price: float = None) -> float:
     try:
         symbol = position.get('symbol', 'Unknown Symbol')
         liquidation_price = float(position['liquidation_price'])
-        normalized_symbol = normalize_symbol(symbol)
-        asset_price = get_price_from_pyth(normalized_symbol)
+        if asset_price is None:
+            normalized_symbol = normalize_symbol(symbol)
+            asset_price = get_price_from_pyth(normalized_symbol)
 
         is_long = position['side'].lower() == 'long'
         differential = asset_price - liquidation_price if is_long else liquidation_price - asset_price
@@ -57,9 +142,28 @@ def get_percentage_away_from_liquidation_price(position: dict) -> float:
         logger.error(f"MasterPositionMonitorUtils - Error checking for percentage away from liquidation price for {symbol}: {e}")
         return None
 
+def get_liquidation_trigger_price(position: dict, max_allowable_percentage: float) -> float:
+    """
+    The asset price at which get_percentage_away_from_liquidation_price drops below max_allowable_percentage.
+    Longs breach at or below it, shorts at or above it.
+    """
+    try:
+        liquidation_price = float(position['liquidation_price'])
+        max_allowable_fraction = max_allowable_percentage / 100
+        is_long = position['side'].lower() == 'long'
+
+        if is_long:
+            return liquidation_price / (1 - max_allowable_fraction)
+        else:
+            return liquidation_price / (1 + max_allowable_fraction)
+
+    except Exception as e:
+        logger.error(f"MasterPositionMonitorUtils - Error calculating liquidation trigger price for position {position}: {e}")
+        return None
+
 def is_open_position_for_symbol_on_exchange(symbol: str, exchange: str) -> bool:
         try:
-            with sqlite3.connect('trades.db') as conn:
+            with TradeDatabase.get_connection('trades.db') as conn:
                 cursor = conn.cursor()
                 
                 sql_query = '''
@@ -81,7 +185,7 @@ def is_open_position_for_symbol_on_exchange(symbol: str, exchange: str) -> bool:
 
 def get_open_position_for_exchange(exchange: str) -> dict:
         try:
-            with sqlite3.connect('trades.db') as conn:
+            with TradeDatabase.get_connection('trades.db') as conn:
                 cursor = conn.cursor()
                 
                 sql_query = '''
@@ -0,0 +1,106 @@
+from GlobalUtils.logger import logger
+from typing import Callable, NamedTuple
+import threading
+import time
+import csv
+
+class PriceTick(NamedTuple):
+    symbol: str
+    price: float
+    received_at: float
+
+
+class PriceStream:
+    """
+    In-process price fan-out. Whatever produces prices (the monitor's Pyth checks, or a replay source
+    offline) publishes here, and subscribers are called synchronously on the publishing thread so a
+    tick reaches them with no queueing in between.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers = []
+        self._latest_ticks = {}
+
+    def subscribe(self, callback: Callable[[PriceTick], None]):
+        with self._lock:
+            self._subscribers = self._subscribers + [callback]
+
+    def unsubscribe(self, callback: Callable[[PriceTick], None]):
+        with self._lock:
+            self._subscribers = [subscriber for subscriber in self._subscribers if subscriber != callback]
+
+    def publish(self, symbol: str, price: float, received_at: float = None) -> PriceTick:
+        tick = PriceTick(symbol, float(price), received_at if received_at is not None else time.monotonic())
+        with self._lock:
+            self._latest_ticks[symbol] = tick
+            subscribers = self._subscribers
+
+        for subscriber in subscribers:
+            try:
+                subscriber(tick)
+            except Exception as e:
+                logger.error(f"PriceStream - Subscriber {subscriber} failed on tick {tick}. Error: {e}")
+
+        return tick
+
+    def get_latest_tick(self, symbol: str) -> PriceTick:
+        with self._lock:
+            return self._latest_ticks.get(symbol)
+
+
+class PriceReplaySource:
+    """
+    Replays recorded prices into a PriceStream so anything subscribed to it can be exercised offline.
+    ticks: [(offset_seconds, symbol, price)] in time order.
+    """
+    def __init__(self, price_stream: PriceStream, ticks: list):
+        self.price_stream = price_stream
+        self.ticks = list(ticks)
+        self._thread = None
+        self._stop_event = threading.Event()
+
+    @classmethod
+    def from_csv(cls, price_stream: PriceStream, file_path: str):
+        """
+        Expects a header row with offset_seconds, symbol and price columns.
+        """
+        try:
+            with open(file_path, newline='') as file:
+                ticks = [
+                    (float(row['offset_seconds']), row['symbol'], float(row['price']))
+                    for row in csv.DictReader(file)
+                ]
+            return cls(price_stream, ticks)
+        except Exception as e:
+            logger.error(f"PriceReplaySource - Failed to load ticks from {file_path}. Error: {e}")
+            return None
+
+    def run(self, speed: float = None) -> int:
+        """
+        Publishes every tick on the calling thread. speed=None replays as fast as possible, otherwise
+        the recorded gaps are divided by speed. Returns the number of ticks published.
+        """
+        published = 0
+        start_time = time.monotonic()
+        first_offset = self.ticks[0][0] if self.ticks else 0
+
+        for offset_seconds, symbol, price in self.ticks:
+            if self._stop_event.is_set():
+                break
+            if speed is not None:
+                delay = (offset_seconds - first_offset) / speed - (time.monotonic() - start_time)
+                if delay > 0 and self._stop_event.wait(delay):
+                    break
+            self.price_stream.publish(symbol, price)
+            published += 1
+
+        logger.info(f"PriceReplaySource - Replayed {published} ticks.")
+        return published
+
+    def start(self, speed: float = 1.0):
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self.run, args=(speed,), name='PriceReplaySource', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop_event.set()
@@ -2,7 +2,7 @@ from PositionMonitor.Master.MasterPositionMonitorUtils import *
 from GlobalUtils.logger import *
 from GlobalUtils.globalUtils import *
 from APICaller.OKX.okxUtils import set_okx_symbol
-import sqlite3
+from PositionMonitor.TradeDatabase.TradeDatabase import TradeDatabase
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -12,16 +12,16 @@ class OKXPositionMonitor():
         self.client = GLOBAL_OKX_PUBLIC_CLIENT
         self.db_path = db_path
         try:
-            self.conn = sqlite3.connect(self.db_path)
+            TradeDatabase.get_connection(self.db_path)
         except Exception as e:
             logger.error(f"OKXPositionMonitor - Error accessing the database: {e}")
             return None
 
 
 
-    def is_near_liquidation_price(self, position: dict) -> bool:
+    def is_near_liquidation_price(self, position: dict, asset_price: float = None) -> bool:
         try:
-            percentage_from_liqiudation_price = get_percentage_away_from_liquidation_price(position)
+            percentage_from_liqiudation_price = get_percentage_away_from_liquidation_price(position, asset_price)
             if percentage_from_liqiudation_price > float(os.getenv('MAX_ALLOWABLE_PERCENTAGE_AWAY_FROM_LIQUIDATION_PRICE')):
                 return True
 
@@ -43,7 +43,7 @@ class OKXPositionMonitor():
 
     def is_open_position(self) -> bool:
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with TradeDatabase.get_connection(self.db_path) as conn:
                 cursor = conn.cursor()
                 
                 sql_query = '''
@@ -5,21 +5,21 @@ from GlobalUtils.logger import *
 from pubsub import pub
 from PositionMonitor.Master.MasterPositionMonitorUtils import *
 import sqlite3
-from GlobalUtils.globalUtils import GLOBAL_SYNTHETIX_CLIENT
+from PositionMonitor.TradeDatabase.TradeDatabase import TradeDatabase
 
 class SynthetixPositionMonitor():
     def __init__(self, db_path='trades.db'):
-        self.client = GLOBAL_SYNTHETIX_CLIENT
+        self.client = ClientRegistry.get('Synthetix')
         self.db_path = db_path
         try:
-            self.conn = sqlite3.connect(self.db_path)
+            TradeDatabase.get_connection(self.db_path)
         except Exception as e:
             logger.error(f"SynthetixPositionMonitor - Error accessing the database: {e}")
             return None
 
     def get_open_position(self) -> dict:
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with TradeDatabase.get_connection(self.db_path) as conn:
                 cursor = conn.cursor()
                 cursor.execute('''SELECT * FROM trade_log WHERE open_close = 'Open' AND exchange = 'Synthetix';''')
                 open_position = cursor.fetchone()
@@ -39,9 +39,9 @@ class SynthetixPositionMonitor():
             return None
 
 
-    def is_near_liquidation_price(self, position: dict) -> bool:
+    def is_near_liquidation_price(self, position: dict, asset_price: float = None) -> bool:
         try:
-            percentage_from_liqiudation_price = get_percentage_away_from_liquidation_price(position)
+            percentage_from_liqiudation_price = get_percentage_away_from_liquidation_price(position, asset_price)
             MAX_ALLOWABLE_PERCENTAGE_AWAY_FROM_LIQUIDATION_PRICE = float(os.getenv('MAX_ALLOWABLE_PERCENTAGE_AWAY_FROM_LIQUIDATION_PRICE'))
             if percentage_from_liqiudation_price < MAX_ALLOWABLE_PERCENTAGE_AWAY_FROM_LIQUIDATION_PRICE:
                 return True
@@ -70,7 +70,7 @@ class SynthetixPositionMonitor():
 
     def is_open_position(self) -> bool:
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with TradeDatabase.get_connection(self.db_path) as conn:
                 cursor = conn.cursor()
                 cursor.execute('''SELECT * FROM trade_log WHERE open_close = 'Open' AND exchange = 'Synthetix';''')
                 open_positions = cursor.fetchall()
@@ -3,8 +3,93 @@ from datetime import datetime
 from GlobalUtils.logger import *
 from GlobalUtils.globalUtils import *
 from pubsub import pub
+import threading
 import uuid
 
+PREPARED_STATEMENT_CACHE_SIZE = 256
+DATABASE_BUSY_TIMEOUT_SECONDS = 5
+
+# Applied in order to every trades.db; PRAGMA user_version records how many have run, so existing files are upgraded in place.
+TRADE_DATABASE_MIGRATIONS = [
+    [
+        '''CREATE TABLE IF NOT EXISTS trade_log (
+            id INTEGER PRIMARY KEY,
+            strategy_execution_id TEXT NOT NULL,
+            exchange TEXT NOT NULL,
+            symbol TEXT NOT NULL,
+            side TEXT NOT NULL,
+            is_hedge TEXT NOT NULL,
+            size_in_asset REAL NOT NULL,
+            liquidation_price REAL NOT NULL,
+            open_close TEXT NOT NULL,
+            open_time DATETIME,
+            close_time DATETIME,
+            pnl REAL,
+            accrued_funding REAL,
+            close_reason TEXT
+        );'''
+    ],
+    [
+        # Covers the open-position lookups (by exchange, and symbol + exchange for the execution id).
+        '''CREATE INDEX IF NOT EXISTS idx_trade_log_open_positions
+            ON trade_log (open_close, exchange, symbol, strategy_execution_id);''',
+        # Covers closing a leg by execution id.
+        '''CREATE INDEX IF NOT EXISTS idx_trade_log_strategy_execution_id
+            ON trade_log (strategy_execution_id, exchange);''',
+        'ANALYZE trade_log;'
+    ],
+]
+
+class TradeDatabase:
+    """
+    One long-lived connection to trades.db per thread and database path, in WAL mode so the monitor's
+    reads never wait on TradeLogger's writes. Statements are compiled once per connection and reused
+    from sqlite3's statement cache, so callers should pass fixed SQL with ? placeholders. The first
+    connection to a file runs any outstanding TRADE_DATABASE_MIGRATIONS.
+    """
+    _local = threading.local()
+    _migrated_paths = set()
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_connection(cls, db_path: str = 'trades.db') -> sqlite3.Connection:
+        connections = getattr(cls._local, 'connections', None)
+        if connections is None:
+            connections = {}
+            cls._local.connections = connections
+
+        conn = connections.get(db_path)
+        if conn is None:
+            conn = sqlite3.connect(db_path, timeout=DATABASE_BUSY_TIMEOUT_SECONDS, cached_statements=PREPARED_STATEMENT_CACHE_SIZE)
+            conn.execute('PRAGMA journal_mode=WAL;')
+            conn.execute('PRAGMA synchronous=NORMAL;')
+            with cls._lock:
+                if db_path not in cls._migrated_paths:
+                    cls.migrate(conn)
+                    cls._migrated_paths.add(db_path)
+            connections[db_path] = conn
+
+        return conn
+
+    @classmethod
+    def migrate(cls, conn: sqlite3.Connection):
+        version = conn.execute('PRAGMA user_version;').fetchone()[0]
+        for target_version, statements in enumerate(TRADE_DATABASE_MIGRATIONS[version:], start=version + 1):
+            with conn:
+                for statement in statements:
+                    conn.execute(statement)
+                conn.execute(f'PRAGMA user_version = {target_version};')
+            logger.info(f"TradeDatabase - Migrated trade database to version {target_version}.")
+
+    @classmethod
+    def reset(cls, db_path: str = 'trades.db'):
+        """
+        Forgets that db_path was migrated, for when its schema has been dropped.
+        """
+        with cls._lock:
+            cls._migrated_paths.discard(db_path)
+
+
 class TradeLogger:
     def __init__(self, db_path='trades.db'):
         self.db_path = db_path
@@ -22,23 +107,7 @@ class TradeLogger:
 
     def create_or_access_database(self):
         try:
-            conn = sqlite3.connect(self.db_path)
-            conn.execute('''CREATE TABLE IF NOT EXISTS trade_log (
-                        id INTEGER PRIMARY KEY,
-                        strategy_execution_id TEXT NOT NULL,
-                        exchange TEXT NOT NULL,
-                        symbol TEXT NOT NULL,
-                        side TEXT NOT NULL,
-                        is_hedge TEXT NOT NULL,
-                        size_in_asset REAL NOT NULL,
-                        liquidation_price REAL NOT NULL,
-                        open_close TEXT NOT NULL,
-                        open_time DATETIME,
-                        close_time DATETIME,
-                        pnl REAL,
-                        accrued_funding REAL,
-                        close_reason TEXT
-                    );''')
+            conn = TradeDatabase.get_connection(self.db_path)
             logger.info("TradeLogger - Database accessed successfully.")
             return conn
         except sqlite3.Error as e:
@@ -75,7 +144,7 @@ class TradeLogger:
                        symbol, side, is_hedge, size, liquidation_price, 
                        open_time=datetime.now()):
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with TradeDatabase.get_connection(self.db_path) as conn:
                 sql_query = '''
                     INSERT INTO trade_log (
                         strategy_execution_id, exchange, symbol, 
@@ -102,7 +171,7 @@ class TradeLogger:
 
     def log_close_trade(self, position_report: dict):
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with TradeDatabase.get_connection(self.db_path) as conn:
                 exchange = position_report['exchange']
                 symbol = position_report['symbol']
                 execution_id = self.get_open_execution_id(symbol, exchange)
@@ -122,7 +191,7 @@ class TradeLogger:
 
     def log_close_trade_pair(self, close_reason, strategy_execution_id, position_report: dict):
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with TradeDatabase.get_connection(self.db_path) as conn:
                 trades = self.get_trade_pair_by_execution_id(strategy_execution_id)
                 if not trades:
                     logger.error(f"TradeLogger - No trades found for strategy_execution_id: {strategy_execution_id}")
@@ -149,11 +218,11 @@ class TradeLogger:
           
     def clear_database(self):
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("DROP TABLE IF EXISTS trade_log")
-                conn.commit()
-                self.create_or_access_database()
+            with TradeDatabase.get_connection(self.db_path) as conn:
+                conn.execute("DROP TABLE IF EXISTS trade_log")
+                conn.execute("PRAGMA user_version = 0")
+            TradeDatabase.reset(self.db_path)
+            TradeDatabase.migrate(conn)
         except sqlite3.Error as e:
             logger.error(f"TradeLogger - Error clearing the database: {e}")
 
@@ -163,7 +232,7 @@ class TradeLogger:
 
     def get_trade_pair_by_execution_id(self, strategy_execution_id):
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with TradeDatabase.get_connection(self.db_path) as conn:
                 cursor = conn.cursor()
                 cursor.execute('''SELECT * FROM trade_log WHERE strategy_execution_id = ?;''', (strategy_execution_id,))
                 trades = cursor.fetchall()
@@ -175,7 +244,7 @@ class TradeLogger:
 
     def get_open_execution_id(self, symbol: str, exchange: str) -> str:
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with TradeDatabase.get_connection(self.db_path) as conn:
                 cursor = conn.cursor()
                 query = """
                         SELECT strategy_execution_id 
@@ -3,8 +3,8 @@ from GlobalUtils.globalUtils import *
 from APICaller.master.MasterUtils import get_target_tokens_for_binance
 from binance.enums import *
 from TxExecution.Binance.BinancePositionControllerUtils import *
+from GlobalUtils.FillConfirmation import FillConfirmation
 import os
-import time
 import pubsub
 from dotenv import load_dotenv
 
@@ -12,7 +12,7 @@ load_dotenv()
 
 class BinancePositionController:
     def __init__(self):
-        self.client = GLOBAL_BINANCE_CLIENT
+        self.client = ClientRegistry.get('Binance')
         self.leverage = int(os.getenv('TRADE_LEVERAGE'))
         # self.set_leverage_for_all_assets(TARGET_TOKENS)
 
@@ -37,8 +37,11 @@ class BinancePositionController:
             if not is_expected_api_response_format_for_new_order(response):
                 return None
 
-            time.sleep(2)
-            if self.is_order_filled(order_id=int(response['orderId']), symbol=response['symbol']):
+            is_filled = FillConfirmation.wait_for(
+                'Binance',
+                lambda: self.is_order_filled(order_id=int(response['orderId']), symbol=response['symbol'])
+            )
+            if is_filled:
                 logger.info(f"BinancePositionController - Trade executed: {order_with_amount['symbol']} {order_with_amount['side']}, Quantity: {order_with_amount['quantity']}, Order id: {response['orderId']}")
                 try:
                     position_object = self.get_position_object_from_response(response)
@@ -87,8 +90,7 @@ class BinancePositionController:
                 type=ORDER_TYPE_MARKET,
                 quantity=close_quantity)
 
-            time.sleep(3)
-            if self.is_order_filled(response['orderId'], symbol):
+            if FillConfirmation.wait_for('Binance', lambda: self.is_order_filled(response['orderId'], symbol), stage='close'):
                 close_position_details = self.parse_close_position_details_from_api_response(position_info, reason, symbol)
                 self.handle_position_closed(close_position_details)
                 logger.info(f"BinancePositionController - Open position for symbol {symbol} has been successfully closed: {close_position_details}")
@@ -6,6 +6,7 @@ from GlobalUtils.globalUtils import *
 from GlobalUtils.logger import logger
 from TxExecution.ByBit.ByBitPositionControllerUtils import *
 from PositionMonitor.Master.MasterPositionMonitorUtils import PositionCloseReason
+from GlobalUtils.FillConfirmation import FillConfirmation
 
 
 load_dotenv()
@@ -13,7 +14,7 @@ load_dotenv()
 class ByBitPositionController:
     
     def __init__(self):
-        self.client = GLOBAL_BYBIT_CLIENT
+        self.client = ClientRegistry.get('ByBit')
         self.api_key = os.getenv('BYBIT_API_KEY')
         self.api_secret = os.getenv('BYBIT_API_SECRET')
         self.leverage = float(os.getenv('TRADE_LEVERAGE'))
@@ -44,7 +45,6 @@ class ByBitPositionController:
 
             order_id = response['result']['orderId']
 
-            time.sleep(2)
             if self._was_trade_executed_successfully(order_id):
                 logger.info(f"ByBitPositionController - Trade executed: symbol={symbol} side={'Long' if is_long else 'Short'}, Size={truncated_value}")
                 try:
@@ -59,7 +59,7 @@ class ByBitPositionController:
                     logger.error(f"ByBitPositionController - Failed to build position object, despite trade executing successfully for symbol {symbol}. Error: {ie}")
                     return response 
             else:
-                logger.info("BinancePositionController - Order not filled after 2 seconds.")
+                logger.info("ByBitPositionController - Order not filled within the fill timeout.")
                 return None
         
         except Exception as e:
@@ -100,8 +100,7 @@ class ByBitPositionController:
                 total_pnl
             )
 
-            time.sleep(2)
-            if self._was_trade_executed_successfully(order_id):
+            if self._was_trade_executed_successfully(order_id, stage='close'):
                 logger.info(f'ByBitPositionController - Order closed successfully for symbol {symbol}, orderId: {order_id}')
                 self.handle_position_closed(close_position_details)
                 return None
@@ -181,33 +180,24 @@ class ByBitPositionController:
             logger.error(f"ByBitPositionController - Error checking if position is open. Error: {e}")
             return False
 
-    def _was_trade_executed_successfully(self, order_id: str) -> bool:
-        attempt = 0
-        retries: int = 3
-
-        while attempt < retries:
-            try:
-                response = self.client.get_order_history(
-                    category="linear",
-                    orderId=order_id
-                )
+    def _was_trade_executed_successfully(self, order_id: str, stage: str = 'fill') -> bool:
+        is_filled = FillConfirmation.wait_for('ByBit', lambda: self._is_order_filled(order_id), stage=stage)
+        if not is_filled:
+            logger.error(f"ByBitPositionController - Order {order_id} was not observed as filled.")
+            return None
+        return True
 
-                if response and response.get('retCode') == 0 and 'result' in response and 'list' in response['result']:
-                    list = response['result']['list']
-                    order_status = list[0]['orderStatus']
-                    if order_status == 'Filled':
-                        return True
-                    else:
-                        continue
+    def _is_order_filled(self, order_id: str) -> bool:
+        response = self.client.get_order_history(
+            category="linear",
+            orderId=order_id
+        )
 
-            except Exception as e:
-                logger.error(f"ByBitPositionController - Attempt {attempt + 1} failed to check if trade was executed successfully. Error: {e}")
-            
-            time.sleep(1)
-            attempt += 1
+        if response and response.get('retCode') == 0 and 'result' in response and 'list' in response['result']:
+            orders = response['result']['list']
+            return bool(orders) and orders[0]['orderStatus'] == 'Filled'
 
-        logger.error(f"ByBitPositionController - All {retries} attempts failed to check if trade was executed successfully for order_id: {order_id}")
-        return None
+        return False
 
     def get_position_object(self, opportunity: dict, response: dict, is_long: bool, truncated_value: str) -> dict:
         try:
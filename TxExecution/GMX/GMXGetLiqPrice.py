@@ -257,8 +257,8 @@ def find_position(market_address, account_position):
 
 def get_liquidation_price(config, symbol: str, is_long: bool):
     try:
-        oracle_prices = OraclePrices(ARBITRUM_CONFIG_OBJECT.chain).get_recent_prices()
-        positions = GetOpenPositions(ARBITRUM_CONFIG_OBJECT, ARBITRUM_CONFIG_OBJECT.user_wallet_address).get_data(oracle_prices)
+        oracle_prices = OraclePrices(get_arbitrum_config().chain).get_recent_prices()
+        positions = GetOpenPositions(get_arbitrum_config(), get_arbitrum_config().user_wallet_address).get_data(oracle_prices)
         side = 'long' if is_long else 'short'
         position = positions[f'{symbol}_{side}']
         referral_storage = "0xe6fab3F0c7199b0d34d7FbE83394fc0e0D06e99d"
@@ -278,7 +278,7 @@ def get_liquidation_price(config, symbol: str, is_long: bool):
                                             oracle_prices,
                                             return_tuple=True)]
 
-        hex_data = accountPositionListKey(ARBITRUM_CONFIG_OBJECT.user_wallet_address)
+        hex_data = accountPositionListKey(get_arbitrum_config().user_wallet_address)
         reader_obj = get_reader_contract(config)
         datastore_obj = get_datastore_contract(config)
         position_keys = datastore_obj.functions.getBytes32ValuesAt(hex_data, 0, 1000).call()
@@ -287,7 +287,7 @@ def get_liquidation_price(config, symbol: str, is_long: bool):
         for i in position_keys:
 
             account_positions_list_raw = reader_obj.functions.getAccountPositionInfoList(
-                datastore, referral_storage, [i], output, ARBITRUM_CONFIG_OBJECT.user_wallet_address).call()
+                datastore, referral_storage, [i], output, get_arbitrum_config().user_wallet_address).call()
             account_positions_list = transform_to_dict(account_positions_list_raw)
 
             account_positions_list += account_positions_list
@@ -11,12 +11,13 @@ from gmx_python_sdk.scripts.v2.gmx_utils import *
 from GlobalUtils.MarketDirectories.GMXMarketDirectory import GMXMarketDirectory
 from APICaller.GMX.GMXContractUtils import *
 from TxExecution.GMX.GMXGetLiqPrice import get_liquidation_price
+from GlobalUtils.FillConfirmation import FillConfirmation
 set_paths()
 
 
 class GMXPositionController:
     def __init__(self):
-        self.config = ARBITRUM_CONFIG_OBJECT
+        self.config = get_arbitrum_config()
         self.config.set_config(PATH_TO_GMX_CONFIG_FILE)
         self.leverage = int(os.getenv('TRADE_LEVERAGE'))
 
@@ -52,11 +53,7 @@ class GMXPositionController:
                 debug_mode=False
             )
 
-            time.sleep(10)
-            if self.was_position_opened_successfully(
-                symbol,
-                is_long
-            ):
+            if FillConfirmation.wait_for('GMX', lambda: self.was_position_opened_successfully(symbol, is_long)):
                 logger.info(f"GMXPositionController - Trade executed: symbol={symbol} side={'Long' if is_long else 'Short'}, Size USD={trade_size_with_leverage}")
                 try:
                     position_object = self.get_position_object(
@@ -69,7 +66,7 @@ class GMXPositionController:
                     logger.error(f"GMXPositionController - Failed to build position object, despite trade executing successfully for symbol {symbol}. Error: {ie}")
                     return None 
             else:
-                logger.info("GMXPositionController - Order not filled after 10 seconds.")
+                logger.info("GMXPositionController - Order not executed by a keeper within the fill timeout.")
                 return None
 
         except Exception as e:
@@ -118,9 +115,8 @@ class GMXPositionController:
                 debug_mode=False
             )
 
-            time.sleep(10)
-            if not self.was_position_closed_successfully(symbol, is_long):
-                logger.error(f'GMXPositionController - Position not closed after 10 second delay.')
+            if not FillConfirmation.wait_for('GMX', lambda: self.was_position_closed_successfully(symbol, is_long), stage='close'):
+                logger.error(f'GMXPositionController - Position not closed within the fill timeout.')
                 return None
 
             position_close_object = self.build_position_closed_object(symbol, reason, pnl)
@@ -3,7 +3,7 @@ from GlobalUtils.globalUtils import *
 from gmx_python_sdk.scripts.v2.gmx_utils import *
 from gmx_python_sdk.scripts.v2.get.get_markets import Markets
 from decimal import Decimal, getcontext
-from APICaller.GMX.GMXCallerUtils import ARBITRUM_CONFIG_OBJECT
+from APICaller.GMX.GMXCallerUtils import get_arbitrum_config
 from APICaller.GMX.GMXContractUtils import *
 from GlobalUtils.MarketDirectories.GMXMarketDirectory import GMXMarketDirectory
 from APICaller.GMX.GMXContractUtils import get_claimable_funding_amount, get_index_token_address_for_symbol
@@ -130,14 +130,14 @@ def get_arbitrum_usdc_balance():
             token_abi = json.load(abi_file)
         
         contract = web3_obj.eth.contract(address=usdc_address, abi=token_abi)
-        balance = contract.functions.balanceOf(ARBITRUM_CONFIG_OBJECT.user_wallet_address).call()
+        balance = contract.functions.balanceOf(get_arbitrum_config().user_wallet_address).call()
         decimals = 6
         human_readable_balance = balance / (10 ** decimals)
 
         return human_readable_balance
     
     except Exception as e:
-        logger.error(f'GMXPositionControllerUtils - Failed to fetch USDC balance for address {ARBITRUM_CONFIG_OBJECT.user_wallet_address}. Error: {e}')
+        logger.error(f'GMXPositionControllerUtils - Failed to fetch USDC balance for address {get_arbitrum_config().user_wallet_address}. Error: {e}')
         return None
 
 def get_claimable_funding_for_symbol(symbol: str) -> dict:
@@ -145,7 +145,7 @@ def get_claimable_funding_for_symbol(symbol: str) -> dict:
         market = GMXMarketDirectory.get_market_key_for_symbol(symbol)
         index_token_address = get_index_token_address_for_symbol(symbol)
         token_decimals = get_decimals_for_symbol(symbol)
-        account = ARBITRUM_CONFIG_OBJECT.user_wallet_address
+        account = get_arbitrum_config().user_wallet_address
         usdc_token_address = '0xaf88d065e77c8cC2239327C5EDb3A432268e5831'
 
         claimable_usdc = get_claimable_funding_amount(
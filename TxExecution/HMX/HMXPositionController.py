@@ -10,7 +10,7 @@ from hexbytes import HexBytes
 
 class HMXPositionController:
     def __init__(self):
-        self.client = GLOBAL_HMX_CLIENT
+        self.client = ClientRegistry.get('HMX')
         self.account = str(os.getenv('ADDRESS'))
         self.leverage_factor = float(os.getenv('TRADE_LEVERAGE'))
 
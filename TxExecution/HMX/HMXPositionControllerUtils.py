@@ -1,7 +1,7 @@
 from hmx2.constants.markets import *
 from GlobalUtils.logger import *
 from GlobalUtils.globalUtils import *
-import sqlite3
+from PositionMonitor.TradeDatabase.TradeDatabase import TradeDatabase
 
 def get_market_for_symbol(symbol: str):
     asset_mapping = {
@@ -98,7 +98,7 @@ def calculate_liquidation_price(params: dict) -> float:
 
 def get_side_for_open_trade_from_database(symbol: str) -> bool:
     try:
-        with sqlite3.connect('trades.db') as conn:
+        with TradeDatabase.get_connection('trades.db') as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT side FROM trade_log WHERE open_close = 'Open' AND exchange = 'HMX' AND symbol = ? LIMIT 1;", (symbol,))
             open_position = cursor.fetchone()
@@ -1,10 +1,3 @@
-from TxExecution.Binance.BinancePositionController import BinancePositionController
-from TxExecution.Synthetix.SynthetixPositionController import SynthetixPositionController
-from TxExecution.HMX.HMXPositionController import HMXPositionController
-from TxExecution.ByBit.ByBitPositionController import ByBitPositionController
-from TxExecution.OKX.OKXPositionController import OKXPositionController
-from TxExecution.GMX.GMXPositionController import GMXPositionController
-
 from TxExecution.Master.MasterPositionControllerUtils import *
 
 from PositionMonitor.Master.MasterPositionMonitorUtils import *
@@ -12,15 +5,28 @@ from APICaller.master.MasterUtils import get_target_exchanges
 from pubsub import pub
 from GlobalUtils.logger import *
 from GlobalUtils.globalUtils import *
-
-class MasterPositionController:
-    def __init__(self):
-        self.synthetix = SynthetixPositionController()
-        self.binance = BinancePositionController()
-        self.hmx = HMXPositionController()
-        self.bybit = ByBitPositionController()
-        # self.okx = OKXPositionController()
-        self.gmx = GMXPositionController()
+from GlobalUtils.ClientRegistry import LazyExchangeObjects
+from GlobalUtils.ExchangeAdapters import ExchangeAdapterRegistry
+from TxExecution.Master.PositionStateCache import PositionStateCache
+from GlobalUtils.FillConfirmation import FILL_TIMEOUT_SECONDS_BY_VENUE
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+from collections import deque
+import functools
+import time
+import os
+
+class MasterPositionController(LazyExchangeObjects):
+    _exchange_role = 'controller'
+
+    def __init__(self, concurrent_execution: bool = True):
+        self.concurrent_execution = concurrent_execution
+        self.leg_execution_deadline_seconds = float(os.getenv('LEG_EXECUTION_DEADLINE_SECONDS', DEFAULT_LEG_EXECUTION_DEADLINE_SECONDS))
+        longest_fill_timeout_seconds = max(FILL_TIMEOUT_SECONDS_BY_VENUE.values())
+        if self.leg_execution_deadline_seconds <= longest_fill_timeout_seconds:
+            logger.warning(f"MasterPositionController - Leg execution deadline of {self.leg_execution_deadline_seconds}s does not exceed the longest venue fill budget of {longest_fill_timeout_seconds}s; slow valid fills will be unwound as late legs.")
+        self.leg_skew_history = deque(maxlen=LEG_SKEW_HISTORY_LENGTH)
+        # Exchanges whose leg missed the deadline and is still owned by _unwind_late_leg.
+        self.late_leg_exchanges = set()
 
     #######################
     ### WRITE FUNCTIONS ###
@@ -28,54 +34,169 @@ class MasterPositionController:
 
     def execute_trades(self, opportunity: dict):
         symbol: str = opportunity['symbol']
+        exchanges = {
+            'long_exchange': opportunity['long_exchange'],
+            'short_exchange': opportunity['short_exchange']
+        }
 
+        position_data_dict = {}
         try:
             if self.is_already_position_open():
                 logger.info("MasterPositionController - Position already open, skipping opportunity.")
                 return
 
             trade_size = self.get_trade_size(opportunity)
-            exchanges = {
-                'long_exchange': opportunity['long_exchange'],
-                'short_exchange': opportunity['short_exchange']
-            }
-
             is_hedge = get_is_hedge(opportunity)
 
-            position_data_dict = {}
-
-            for role, exchange_name in exchanges.items():
-                is_long=(role == 'long_exchange')
-                execute_trade_method = getattr(self, exchange_name.lower()).execute_trade
-                position_data = execute_trade_method(
-                    opportunity, 
-                    is_long, 
-                    trade_size=trade_size
-                )
-
-                is_hedge = True if is_long and is_hedge['long'] == True else False
-
-                logger.info(f"MasterPositionController - {exchange_name} trade execution response: {position_data}")
+            if self.concurrent_execution:
+                position_data_dict = self._execute_legs_concurrently(opportunity, exchanges, trade_size)
+            else:
+                position_data_dict = self._execute_legs_sequentially(opportunity, exchanges, trade_size)
 
-                if position_data:
-                    position_data_dict[role] = position_data
-                    position_data_dict[role]['exchange'] = exchanges['long_exchange'] if role == 'long_exchange' else exchanges['short_exchange']
-                    if is_hedge == True:
-                        position_data_dict[role]['is_hedge'] = 'True'
-                    elif is_hedge == False:
-                        position_data_dict[role]['is_hedge'] = 'False'
+            for role, position_data in position_data_dict.items():
+                position_data['exchange'] = exchanges[role]
+                if role == 'long_exchange' and is_hedge['long'] == True:
+                    position_data['is_hedge'] = 'True'
+                else:
+                    position_data['is_hedge'] = 'False'
 
             if len(position_data_dict) == 2:
                 pub.sendMessage(EventsDirectory.POSITION_OPENED.value, position_data=position_data_dict)
                 logger.info("MasterPositionController:execute_trades - Trades executed successfully for opportunity.")
             else:
-                self.close_position_pair(symbol=symbol, reason=PositionCloseReason.POSITION_OPEN_ERROR.value, exchanges=list(exchanges.values()))
-                missing_exchanges = set(exchanges.values()) - set(position_data_dict.keys())
+                missing_exchanges = [exchanges[role] for role in exchanges if role not in position_data_dict]
                 logger.error(f"MasterPositionController:execute_trades - Failed to execute trades on all required exchanges. Missing: {missing_exchanges}. Cancelling trades.")
+                # Only the legs that filled are closed here; a leg that missed the deadline is unwound by _unwind_late_leg.
+                filled_exchanges = [exchanges[role] for role in position_data_dict]
+                self._mark_legs_open(symbol, filled_exchanges)
+                self.close_position_pair(symbol=symbol, reason=PositionCloseReason.POSITION_OPEN_ERROR.value, exchanges=filled_exchanges)
 
         except Exception as e:
             logger.error(f"MasterPositionController:execute_trades - Failed to process trades for {symbol}. Error: {e}")
-            self.close_position_pair(symbol=symbol, reason=PositionCloseReason.POSITION_OPEN_ERROR.value, exchanges=list(exchanges.values()))
+            if position_data_dict:
+                filled_exchanges = [exchanges[role] for role in position_data_dict]
+            else:
+                filled_exchanges = [exchange_name for exchange_name in exchanges.values() if exchange_name not in self.late_leg_exchanges]
+            self.close_position_pair(symbol=symbol, reason=PositionCloseReason.POSITION_OPEN_ERROR.value, exchanges=filled_exchanges)
+            # Which legs actually filled is unknown here, so have the cache check the venues now.
+            PositionStateCache.request_reconciliation()
+
+    def _execute_leg(self, exchange_name: str, opportunity: dict, is_long: bool, trade_size: float) -> tuple:
+        position_data = getattr(self, exchange_name.lower()).execute_trade(
+            opportunity,
+            is_long,
+            trade_size=trade_size
+        )
+        logger.info(f"MasterPositionController - {exchange_name} trade execution response: {position_data}")
+        return position_data, time.monotonic()
+
+    def _execute_legs_concurrently(self, opportunity: dict, exchanges: dict, trade_size: float) -> dict:
+        """
+        Submits both legs at once and gathers them against one deadline measured from submission,
+        so the pair is unhedged for the gap between the two fills rather than for the first leg's
+        whole confirmation time. A leg that misses the deadline is abandoned, and closed if it fills later.
+        """
+        position_data_dict = {}
+        completion_times = {}
+        executor = ThreadPoolExecutor(max_workers=len(exchanges), thread_name_prefix='MasterPositionController')
+        start_time = time.monotonic()
+        deadline = start_time + self.leg_execution_deadline_seconds
+        try:
+            futures = {
+                role: executor.submit(self._execute_leg, exchange_name, opportunity, role == 'long_exchange', trade_size)
+                for role, exchange_name in exchanges.items()
+            }
+
+            for role, future in futures.items():
+                exchange_name = exchanges[role]
+                try:
+                    position_data, completed_at = future.result(timeout=max(0.0, deadline - time.monotonic()))
+                except FuturesTimeoutError:
+                    logger.error(f"MasterPositionController - {exchange_name} leg missed the {self.leg_execution_deadline_seconds}s execution deadline.")
+                    self.late_leg_exchanges.add(exchange_name)
+                    self._mark_legs_open(opportunity['symbol'], [exchange_name])
+                    future.add_done_callback(functools.partial(self._unwind_late_leg, opportunity['symbol'], exchange_name))
+                    continue
+                except Exception as e:
+                    logger.error(f"MasterPositionController - {exchange_name} leg raised during execution. Error: {e}")
+                    continue
+
+                if position_data:
+                    position_data_dict[role] = position_data
+                    completion_times[role] = completed_at
+
+        finally:
+            executor.shutdown(wait=False)
+
+        if len(completion_times) == 2:
+            self.record_leg_skew(opportunity['symbol'], exchanges, position_data_dict, completion_times, start_time)
+
+        return position_data_dict
+
+    def _execute_legs_sequentially(self, opportunity: dict, exchanges: dict, trade_size: float) -> dict:
+        position_data_dict = {}
+        completion_times = {}
+        start_time = time.monotonic()
+        for role, exchange_name in exchanges.items():
+            position_data, completed_at = self._execute_leg(exchange_name, opportunity, role == 'long_exchange', trade_size)
+            if position_data:
+                position_data_dict[role] = position_data
+                completion_times[role] = completed_at
+
+        if len(completion_times) == 2:
+            self.record_leg_skew(opportunity['symbol'], exchanges, position_data_dict, completion_times, start_time)
+
+        return position_data_dict
+
+    def _unwind_late_leg(self, symbol: str, exchange_name: str, future):
+        """
+        Sole owner of a leg that missed the deadline: once its execute_trade call has returned, the
+        venue is asked whether a position is actually open and it is closed only if so.
+        """
+        try:
+            try:
+                position_data, _ = future.result()
+            except Exception as e:
+                position_data = None
+                logger.error(f"MasterPositionController - Late {exchange_name} leg for {symbol} raised during execution. Error: {e}")
+
+            if not getattr(self, exchange_name.lower()).is_already_position_open():
+                logger.info(f"MasterPositionController - Late {exchange_name} leg for {symbol} left no open position, nothing to unwind.")
+                PositionStateCache.mark_closed(exchange_name)
+                return
+
+            logger.warning(f"MasterPositionController - {exchange_name} leg for {symbol} filled after the execution deadline (response: {position_data}), closing it.")
+            self.close_position_pair(symbol=symbol, reason=PositionCloseReason.POSITION_OPEN_ERROR.value, exchanges=[exchange_name])
+        except Exception as e:
+            logger.error(f"MasterPositionController - Failed to unwind late {exchange_name} leg for {symbol}. Error: {e}")
+            PositionStateCache.request_reconciliation()
+        finally:
+            self.late_leg_exchanges.discard(exchange_name)
+
+    def _mark_legs_open(self, symbol: str, exchange_names: list):
+        """
+        Legs left behind by a failed pair are recorded as open until their POSITION_CLOSED arrives, so a
+        failed unwind keeps is_already_position_open() True instead of waiting for reconciliation.
+        """
+        for exchange_name in exchange_names:
+            PositionStateCache.mark_open(exchange_name, symbol)
+
+    def record_leg_skew(self, symbol: str, exchanges: dict, position_data_dict: dict, completion_times: dict, start_time: float):
+        leg_skew_seconds = abs(completion_times['long_exchange'] - completion_times['short_exchange'])
+        total_execution_seconds = max(completion_times.values()) - start_time
+        self.leg_skew_history.append({
+            'symbol': symbol,
+            'long_exchange': exchanges['long_exchange'],
+            'short_exchange': exchanges['short_exchange'],
+            'leg_skew_seconds': leg_skew_seconds,
+            'total_execution_seconds': total_execution_seconds,
+            'is_concurrent': self.concurrent_execution
+        })
+
+        for position_data in position_data_dict.values():
+            position_data['leg_skew_seconds'] = leg_skew_seconds
+
+        logger.info(f"MasterPositionController - {symbol} legs on {exchanges['long_exchange']}/{exchanges['short_exchange']} filled {leg_skew_seconds:.2f}s apart, {total_execution_seconds:.2f}s after submission.")
 
     def close_position_pair(self, symbol: str, reason: str, exchanges: list):
         for exchange_name in exchanges:
@@ -85,6 +206,7 @@ class MasterPositionController:
 
             except Exception as e:
                 logger.error(f"MasterPositionController - Failed to close position for {symbol} on {exchange_name}. Error: {e}")
+                PositionStateCache.request_reconciliation()
                 return None
 
         return True
@@ -161,69 +283,30 @@ class MasterPositionController:
             return None
 
 
-    def is_already_position_open(self) -> bool:
+    def get_leg_skew_summary(self) -> dict:
         try:
-            is_synthetix_position = False
-            is_hmx_position = False
-            is_binance_position = False
-            is_bybit_position = False
-
-            target_exchange_list = get_target_exchanges()
-            is_synthetix_target = 'Synthetix' in target_exchange_list
-            is_hmx_target = 'HMX' in target_exchange_list
-            is_binance_target = 'Binance' in target_exchange_list
-            is_bybit_target = 'ByBit' in target_exchange_list
-            is_okx_target = 'OKX' in target_exchange_list
-            is_gmx_target = 'GMX' in target_exchange_list
-
-            try:
-                if is_synthetix_target:
-                    is_synthetix_position = self.synthetix.is_already_position_open()
-            except Exception as e:
-                logger.error(f'MasterPositionController:is_already_position_open - Error checking Synthetix position: {e}')
-
-            try:
-                if is_hmx_target:
-                    is_hmx_position = self.hmx.is_already_position_open()
-            except Exception as e:
-                logger.error(f'MasterPositionController:is_already_position_open - Error checking HMX position: {e}')
-
-            try:
-                if is_binance_target:
-                    is_binance_position = self.binance.is_already_position_open()
-            except Exception as e:
-                logger.error(f'MasterPositionController:is_already_position_open - Error checking Binance position: {e}')
-
-            try:
-                if is_bybit_target:
-                    is_bybit_position = self.bybit.is_already_position_open()
-            except Exception as e:
-                logger.error(f'MasterPositionController:is_already_position_open - Error checking HMX position: {e}')
+            skews = [record['leg_skew_seconds'] for record in self.leg_skew_history]
+            if not skews:
+                return {'count': 0}
+
+            return {
+                'count': len(skews),
+                'average_seconds': sum(skews) / len(skews),
+                'max_seconds': max(skews),
+                'last_seconds': skews[-1]
+            }
+        except Exception as e:
+            logger.error(f"MasterPositionController - Failed to summarise leg skew. Error: {e}")
+            return None
 
-            try:
-                if is_okx_target:
-                    # is_okx_position = self.okx.is_already_position_open()
-                    pass
-            except Exception as e:
-                logger.error(f'MasterPositionController:is_already_position_open - Error checking OKX position: {e}')
+    def is_already_position_open(self) -> bool:
+        try:
+            if PositionStateCache.is_initialized():
+                return PositionStateCache.is_position_open()
 
-            try:    
-                if is_gmx_target:
-                    is_gmx_position = self.gmx.is_already_position_open()
-            except Exception as e:
-                logger.error(f'MasterPositionController:is_already_position_open - Error checking GMX position: {e}')
-
-            positions_open = [
-                is_synthetix_position,
-                is_hmx_position,
-                is_binance_position,
-                is_bybit_position,
-                # is_okx_position
-                is_gmx_position
-            ]
-
-            if any(positions_open):
-                logger.info(f"MasterPositionController - Position already open: SNX: {is_synthetix_position}, HMX: {is_hmx_position}, Binance: {is_binance_position}, ByBit: {is_bybit_position}, GMX: {is_gmx_position}")
+            open_positions_by_exchange = self.get_open_positions_by_exchange()
+            if any(open_positions_by_exchange.values()):
+                logger.info(f"MasterPositionController - Position already open: {open_positions_by_exchange}")
                 return True
             else:
                 logger.info(f"MasterPositionController - No positions open.")
@@ -232,3 +315,19 @@ class MasterPositionController:
         except Exception as e:
             logger.error(f'MasterPositionController - Unexpected error when checking positions: {e}')
             return False
+
+    def get_open_positions_by_exchange(self) -> dict:
+        open_positions_by_exchange = {}
+        for exchange_name in get_target_exchanges():
+            if not ExchangeAdapterRegistry.is_registered(exchange_name):
+                continue
+            try:
+                open_positions_by_exchange[exchange_name] = bool(getattr(self, exchange_name.lower()).is_already_position_open())
+            except Exception as e:
+                logger.error(f'MasterPositionController:get_open_positions_by_exchange - Error checking {exchange_name} position: {e}')
+                open_positions_by_exchange[exchange_name] = None
+
+        return open_positions_by_exchange
+
+    def start_position_state_cache(self):
+        PositionStateCache.initialize(self.get_open_positions_by_exchange)
@@ -5,6 +5,10 @@ from GlobalUtils.globalUtils import *
 
 load_dotenv()
 
+# Both legs of a pair must be confirmed within this many seconds of submission when executed concurrently.
+DEFAULT_LEG_EXECUTION_DEADLINE_SECONDS = 60
+LEG_SKEW_HISTORY_LENGTH = 500
+
 def adjust_collateral_allocation(collateral_amounts: dict, long_exchange: str, short_exchange: str) -> float:
     try:
         initial_percentage = float(os.getenv('PERCENTAGE_CAPITAL_PER_TRADE'))
@@ -0,0 +1,182 @@
+from GlobalUtils.logger import logger
+from GlobalUtils.globalUtils import *
+from PositionMonitor.TradeDatabase.TradeDatabase import TradeDatabase
+from pubsub import pub
+from typing import Callable
+import threading
+import sqlite3
+import os
+
+DEFAULT_POSITION_RECONCILIATION_SECONDS = 300
+
+class PositionStateCache:
+    """
+    Which exchanges currently hold an open leg, kept locally from POSITION_OPENED / POSITION_CLOSED
+    and seeded from trades.db, so the search loop never has to query the venues to know whether a
+    position is open. A slower background loop compares it against the venues and alerts drift on
+    POSITION_STATE_DRIFT. A leg open on a venue but not in the cache is adopted at once, since missing
+    it lets a new pair be opened beside an unmonitored leg; a leg only the cache holds must survive two
+    consecutive reconciliations before it is dropped. The execution path marks legs it leaves behind
+    and can request an immediate reconciliation.
+    """
+    _open_positions = {}
+    _lock = threading.Lock()
+    _is_initialized = False
+    _venue_check = None
+    _pending_drift = None
+    _thread = None
+    _stop_event = threading.Event()
+    _reconcile_now_event = threading.Event()
+    _reconciliation_seconds = float(os.getenv('POSITION_RECONCILIATION_SECONDS') or DEFAULT_POSITION_RECONCILIATION_SECONDS)
+
+    @classmethod
+    def initialize(cls, venue_check: Callable[[], dict], db_path: str = 'trades.db'):
+        """
+        venue_check: returns {exchange: bool} from a live query of each target exchange, None where the query failed.
+        """
+        with cls._lock:
+            if cls._is_initialized:
+                return
+            cls._venue_check = venue_check
+            cls._open_positions = cls._load_open_positions_from_database(db_path)
+            cls._is_initialized = True
+
+        pub.subscribe(cls.on_position_opened, EventsDirectory.POSITION_OPENED.value)
+        pub.subscribe(cls.on_position_closed, EventsDirectory.POSITION_CLOSED.value)
+        logger.info(f'PositionStateCache - Initialized with open positions: {cls._open_positions}')
+        cls.start_reconciliation()
+
+    @classmethod
+    def is_initialized(cls) -> bool:
+        return cls._is_initialized
+
+    @classmethod
+    def on_position_opened(cls, position_data: dict):
+        try:
+            with cls._lock:
+                for leg in position_data.values():
+                    cls._open_positions[leg['exchange']] = leg['symbol']
+        except Exception as e:
+            logger.error(f'PositionStateCache - Failed to record opened position {position_data}. Error: {e}')
+
+    @classmethod
+    def on_position_closed(cls, position_report: dict):
+        try:
+            with cls._lock:
+                cls._open_positions.pop(position_report['exchange'], None)
+        except Exception as e:
+            logger.error(f'PositionStateCache - Failed to record closed position {position_report}. Error: {e}')
+
+    @classmethod
+    def mark_open(cls, exchange: str, symbol: str = None):
+        with cls._lock:
+            cls._open_positions[exchange] = symbol
+        logger.info(f'PositionStateCache - Marked {exchange} as holding an open leg for {symbol}.')
+
+    @classmethod
+    def mark_closed(cls, exchange: str):
+        with cls._lock:
+            cls._open_positions.pop(exchange, None)
+
+    @classmethod
+    def request_reconciliation(cls):
+        cls._reconcile_now_event.set()
+
+    @classmethod
+    def is_position_open(cls) -> bool:
+        with cls._lock:
+            return len(cls._open_positions) > 0
+
+    @classmethod
+    def get_open_positions(cls) -> dict:
+        with cls._lock:
+            return dict(cls._open_positions)
+
+    @classmethod
+    def start_reconciliation(cls):
+        with cls._lock:
+            if cls._thread is not None and cls._thread.is_alive():
+                return
+            cls._stop_event.clear()
+            cls._thread = threading.Thread(target=cls._run_reconciliation, name='PositionStateCache', daemon=True)
+            cls._thread.start()
+
+    @classmethod
+    def stop_reconciliation(cls):
+        cls._stop_event.set()
+        cls._reconcile_now_event.set()
+
+    @classmethod
+    def reconcile(cls) -> bool:
+        """
+        Returns True if the cache agrees with the venues.
+        """
+        try:
+            venue_positions = cls._venue_check()
+            if venue_positions is None:
+                logger.error('PositionStateCache - Venue check returned None, skipping reconciliation.')
+                return None
+
+            # Exchanges whose live query failed are left out rather than read as closed.
+            venue_positions = {exchange: is_open for exchange, is_open in venue_positions.items() if is_open is not None}
+            venue_open_exchanges = {exchange for exchange, is_open in venue_positions.items() if is_open}
+            with cls._lock:
+                cached_open_exchanges = {exchange for exchange in cls._open_positions if exchange in venue_positions}
+
+            if venue_open_exchanges == cached_open_exchanges:
+                cls._pending_drift = None
+                return True
+
+            open_on_venue_only = sorted(venue_open_exchanges - cached_open_exchanges)
+            open_in_cache_only = sorted(cached_open_exchanges - venue_open_exchanges)
+
+            # An unknown open leg would let a new pair be opened next to it, so it is adopted on the first pass.
+            if open_on_venue_only:
+                logger.error(f'PositionStateCache - Open legs on venues missing from cache, adopting them: {open_on_venue_only}')
+                with cls._lock:
+                    for exchange in open_on_venue_only:
+                        cls._open_positions.setdefault(exchange, None)
+                pub.sendMessage(EventsDirectory.POSITION_STATE_DRIFT.value, drift={'open_on_venue_only': open_on_venue_only, 'open_in_cache_only': []})
+
+            if not open_in_cache_only:
+                cls._pending_drift = None
+                return False
+
+            # A trade being closed right now shows up as drift for one pass, so only drop the leg if it persists.
+            if open_in_cache_only != cls._pending_drift:
+                cls._pending_drift = open_in_cache_only
+                logger.warning(f'PositionStateCache - Cached legs not open on venues, rechecking next pass: {open_in_cache_only}')
+                return False
+
+            cls._pending_drift = None
+            logger.error(f'PositionStateCache - Cached legs closed on venues, dropping them: {open_in_cache_only}')
+            with cls._lock:
+                for exchange in open_in_cache_only:
+                    cls._open_positions.pop(exchange, None)
+
+            pub.sendMessage(EventsDirectory.POSITION_STATE_DRIFT.value, drift={'open_on_venue_only': [], 'open_in_cache_only': open_in_cache_only})
+            return False
+
+        except Exception as e:
+            logger.error(f'PositionStateCache - Error while reconciling position state with venues: {e}')
+            return None
+
+    @classmethod
+    def _run_reconciliation(cls):
+        while True:
+            cls._reconcile_now_event.wait(cls._reconciliation_seconds)
+            cls._reconcile_now_event.clear()
+            if cls._stop_event.is_set():
+                return
+            cls.reconcile()
+
+    @classmethod
+    def _load_open_positions_from_database(cls, db_path: str) -> dict:
+        try:
+            with TradeDatabase.get_connection(db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT exchange, symbol FROM trade_log WHERE open_close = 'Open';")
+                return {exchange: symbol for exchange, symbol in cursor.fetchall()}
+        except sqlite3.Error as e:
+            logger.error(f'PositionStateCache - Could not seed open positions from {db_path}, starting empty. Error: {e}')
+            return {}
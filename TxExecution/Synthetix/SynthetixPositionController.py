@@ -5,14 +5,16 @@ from TxExecution.Synthetix.SynthetixPositionControllerUtils import *
 from GlobalUtils.globalUtils import *
 from GlobalUtils.logger import *
 from GlobalUtils.MarketDirectories.SynthetixMarketDirectory import SynthetixMarketDirectory
+from GlobalUtils.FillConfirmation import FillConfirmation, get_fill_timeout_for_venue
+from TxExecution.Synthetix.SynthetixTransactionPipeline import SynthetixTransactionPipeline
 import time
 import math
-from GlobalUtils.globalUtils import GLOBAL_SYNTHETIX_CLIENT
 
 class SynthetixPositionController:
     def __init__(self):
-        self.client = GLOBAL_SYNTHETIX_CLIENT
+        self.client = ClientRegistry.get('Synthetix')
         self.leverage_factor = float(os.getenv('TRADE_LEVERAGE'))
+        self.transaction_pipeline = SynthetixTransactionPipeline(self.client)
 
     #######################
     ### WRITE FUNCTIONS ###
@@ -24,6 +26,8 @@ class SynthetixPositionController:
                 account_id: int = self.get_default_account()
                 adjusted_trade_size: float = self.calculate_adjusted_trade_size(opportunity, is_long, trade_size)
                 market_name = str(opportunity['symbol'])
+                # Commit receipt and settlement share one fill budget, so the leg stays inside the pair's execution deadline.
+                fill_deadline = time.monotonic() + get_fill_timeout_for_venue('Synthetix')
 
                 response = self.client.perps.commit_order(
                     size=adjusted_trade_size, 
@@ -33,7 +37,14 @@ class SynthetixPositionController:
                 )
                 
                 if is_transaction_hash(response):
-                    time.sleep(15)
+                    if not self._wait_for_receipt(response, stage='commit', timeout_seconds=max(fill_deadline - time.monotonic(), 0)):
+                        logger.error(f"SynthetixPositionController - Order commitment for {market_name} was not mined successfully.")
+                        return None
+
+                    if not FillConfirmation.wait_for('Synthetix', lambda: self.is_position_settled(market_name), timeout_seconds=max(fill_deadline - time.monotonic(), 0)):
+                        logger.error(f"SynthetixPositionController - Order for {market_name} was not settled in time.")
+                        return None
+
                     position_data = self.handle_position_opened(market_name)
                     return position_data
                 else:
@@ -107,7 +118,7 @@ class SynthetixPositionController:
         """
             Checks if Synthetix client's SUSD balance is greater than or equal to amount.
 
-            Directly call `_add_collateral` if there is existing sUSD balance.
+            Directly approve (if needed) and add collateral if there is existing sUSD balance.
 
             If not:
             - approve spot market to spend collateral
@@ -117,37 +128,89 @@ class SynthetixPositionController:
             - approve collateral for perps market proxy
             - add collateral
 
-            :param str token_address: An instance of the Synthetix class.
+            Approvals already covered by the current allowance are skipped. The remaining transactions
+            are pre-signed with consecutive nonces, broadcast back-to-back and confirmed together.
+
+            :param str token_address: Address of the collateral token to deposit.
             :param int amount: Collateral to deposit to Perps account 
 
-            :return: void
+            :return: True once every transaction is confirmed, None otherwise
         """
         try:
+            steps = self.build_collateral_deposit_steps(token_address, amount)
+            if steps is None:
+                return None
+
+            if not self.transaction_pipeline.execute(steps):
+                logger.error(f"SynthetixPositionController - Collateral deposit of {amount} failed, see pipeline errors above.")
+                return None
+
+            logger.info(f"SynthetixPositionController - Successfully added {amount} to collateral in {len(steps)} transactions.")
+            return True
+
+        except Exception as e:
+            logger.error(f"SynthetixPositionController - An error occurred while attempting to add collateral: {e}")
+            return None
+
+    def build_collateral_deposit_steps(self, token_address: str, amount: int) -> list:
+        try:
+            pipeline = self.transaction_pipeline
+            account_id = self.get_default_account()
+            amount_wei = Web3.to_wei(amount, 'ether')
+            spot_market_proxy = self.client.spot.market_proxy
+            perps_market_proxy = self.client.perps.market_proxy
+            susd_market = self.client.spot.markets_by_name["sUSD"]
             susd_balance = self.client.get_susd_balance()
 
-            if susd_balance['balance'] >= amount:
-                self._add_collateral(amount)
-                time.sleep(1)
-            else:
+            steps = []
+            if susd_balance['balance'] < amount:
                 market_id = self.client.spot.markets_by_name[f"sUSDC"]["market_id"]
                 wrapped_token = self.client.spot.markets_by_id[market_id]["contract"]
-                self._approve_spot_market_to_spend_collateral(token_address, amount)
-                time.sleep(1)
-                self._wrap_collateral(amount)
-                time.sleep(1)
-                self._approve_spot_market_to_spend_collateral(wrapped_token.address, amount)
-                time.sleep(1)
-                self._execute_atomic_order(amount, 'sell')
-                time.sleep(1)
-                self._approve_collateral_for_perps_market_proxy(amount)
-                time.sleep(1)
-                self._add_collateral(amount)
-                time.sleep(1)
+                token_contract = self.client.web3.eth.contract(
+                    address=token_address,
+                    abi=self.client.contracts["common"]["ERC20"]["abi"]
+                )
+                token_amount = self.client.spot._format_size(amount, market_id=market_id)
+
+                steps += self._build_approval_steps(token_contract, spot_market_proxy.address, token_amount)
+                steps.append((
+                    'wrap',
+                    pipeline.build(spot_market_proxy.functions.wrap(market_id, token_amount, amount_wei), 'wrap'),
+                    lambda: pipeline.allowance_cache.consume(token_contract.address, spot_market_proxy.address, token_amount)
+                ))
+                steps += self._build_approval_steps(wrapped_token, spot_market_proxy.address, amount_wei)
+                steps.append((
+                    'sell',
+                    pipeline.build(spot_market_proxy.functions.sell(market_id, amount_wei, amount_wei, self.client.referrer), 'sell'),
+                    lambda: pipeline.allowance_cache.consume(wrapped_token.address, spot_market_proxy.address, amount_wei)
+                ))
+
+            steps += self._build_approval_steps(susd_market["contract"], perps_market_proxy.address, amount_wei)
+            steps.append((
+                'modifyCollateral',
+                pipeline.build(perps_market_proxy.functions.modifyCollateral(account_id, susd_market["market_id"], amount_wei), 'modifyCollateral'),
+                lambda: pipeline.allowance_cache.consume(susd_market["contract"].address, perps_market_proxy.address, amount_wei)
+            ))
+
+            return steps
 
         except Exception as e:
-            logger.error(f"SynthetixPositionController - An error occurred while attempting to add collateral: {e}")
+            logger.error(f"SynthetixPositionController - Failed to build collateral deposit transactions for amount {amount}. Error: {e}")
             return None
 
+    def _build_approval_steps(self, token_contract, spender: str, amount_wei: int) -> list:
+        allowance_cache = self.transaction_pipeline.allowance_cache
+        if allowance_cache.is_sufficient(token_contract, spender, amount_wei):
+            logger.info(f"SynthetixPositionController - Allowance for {spender} on {token_contract.address} already sufficient, skipping approval.")
+            return []
+
+        approve_tx = self.transaction_pipeline.build(token_contract.functions.approve(spender, amount_wei), 'approve')
+        return [(
+            'approve',
+            approve_tx,
+            lambda: allowance_cache.set(token_contract.address, spender, amount_wei)
+        )]
+
     def _add_collateral(self, amount: int):
         try:
             account_id = self.get_default_account()
@@ -159,6 +222,7 @@ class SynthetixPositionController:
             )
             if is_transaction_hash(tx):
                 logger.info(f"SynthetixPositionController - Successfully added {amount} to collateral, market_name = sUSD.")
+            return tx
         except Exception as e:
             logger.error(f"SynthetixPositionController - An error occurred while attempting to add collateral: {e}")
 
@@ -196,6 +260,7 @@ class SynthetixPositionController:
             )
             if is_transaction_hash(approve_tx):
                 logger.info(f"SynthetixPositionController - Approved spot market collateral to spend collateral transaction successful. Transaction ID: {approve_tx}")
+            return approve_tx
         except Exception as e:
             logger.error(f"SynthetixPositionController - Spot market spending collateral approval for token: {token_address}, amount: {amount} failed. Error: {e}")
             return None
@@ -213,6 +278,7 @@ class SynthetixPositionController:
             )
             if is_transaction_hash(approve_tx):
                 logger.info(f"SynthetixPositionController - Perps market collateral approval transaction successful. Transaction ID: {approve_tx}")
+            return approve_tx
         except Exception as e:
             logger.error(f"SynthetixPositionController - Collateral approval for perps market failed. Error: {e}")
 
@@ -222,6 +288,7 @@ class SynthetixPositionController:
             wrap_tx = self.client.spot.wrap(amount, market_id, submit=True)
             if is_transaction_hash(wrap_tx):
                 logger.info(f"SynthetixPositionController - Wrap tx executed successfully: {wrap_tx}")
+            return wrap_tx
 
         except Exception as e:
             logger.error(f"SynthetixPositionController - Failed to wrap USDC <> sUSDC. amount = {amount}. Error: {e}")
@@ -230,6 +297,13 @@ class SynthetixPositionController:
         order_tx = self.client.spot.atomic_order(side, amount, market_name="sUSDC", submit=True)
         if is_transaction_hash(order_tx):
             logger.info(f"SynthetixPositionController - Atomic order transaction successful. Side: {side}, Transaction ID: {order_tx}")
+        return order_tx
+
+    def _wait_for_receipt(self, tx_hash, stage: str, timeout_seconds: float = None) -> bool:
+        if not isinstance(tx_hash, str) or not is_transaction_hash(tx_hash):
+            return False
+        receipt = FillConfirmation.wait_for_receipt('Synthetix', self.client.web3, tx_hash, timeout_seconds, stage=stage)
+        return receipt is not None
 
 
 
@@ -237,6 +311,10 @@ class SynthetixPositionController:
     ### READ FUNCTIONS ###
     ######################
 
+    def is_position_settled(self, market_name: str) -> bool:
+        position = self.client.perps.get_open_position(market_name=market_name)
+        return bool(position) and float(position['position_size']) != 0
+
     def handle_position_opened(self, market_name: str):
         try:
             position = self.client.perps.get_open_position(market_name=market_name)
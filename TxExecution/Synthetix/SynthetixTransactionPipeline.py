@@ -0,0 +1,145 @@
+from GlobalUtils.logger import logger
+from GlobalUtils.FillConfirmation import FillConfirmation
+from concurrent.futures import ThreadPoolExecutor
+import threading
+
+# Explicit gas limits let dependent transactions be built and signed before the ones they
+# depend on are mined, since nothing has to be simulated against not-yet-existing state.
+PIPELINE_GAS_LIMITS = {
+    'approve': 100_000,
+    'wrap': 600_000,
+    'sell': 600_000,
+    'modifyCollateral': 1_000_000,
+}
+
+MAX_UINT256 = 2**256 - 1
+
+
+class NonceManager:
+    """
+    Hands out consecutive nonces locally so several transactions can be signed and broadcast
+    back-to-back, and keeps the Synthetix client's own nonce counter in step with them.
+    """
+    def __init__(self, client):
+        self.client = client
+        self._lock = threading.Lock()
+        self._next_nonce = None
+
+    def reserve(self, count: int) -> list:
+        with self._lock:
+            # Transactions sent through the client itself also consume nonces, so never start below the chain's view.
+            pending_nonce = self.client.web3.eth.get_transaction_count(self.client.address, 'pending')
+            self._next_nonce = pending_nonce if self._next_nonce is None else max(pending_nonce, self._next_nonce)
+            nonces = list(range(self._next_nonce, self._next_nonce + count))
+            self._next_nonce += count
+            self.client.nonce = self._next_nonce
+            return nonces
+
+    def reset(self):
+        with self._lock:
+            self._next_nonce = None
+
+
+class AllowanceCache:
+    """
+    On-chain ERC20 allowances in wei, read once per (token, spender) and kept up to date as the
+    pipeline approves and spends, so approvals that are already in place are not sent again.
+    """
+    def __init__(self, client):
+        self.client = client
+        self._lock = threading.Lock()
+        self._allowances = {}
+
+    def get(self, token_contract, spender: str) -> int:
+        key = (token_contract.address, spender)
+        with self._lock:
+            allowance = self._allowances.get(key)
+        if allowance is None:
+            allowance = token_contract.functions.allowance(self.client.address, spender).call()
+            with self._lock:
+                self._allowances[key] = allowance
+        return allowance
+
+    def is_sufficient(self, token_contract, spender: str, amount_wei: int) -> bool:
+        return self.get(token_contract, spender) >= amount_wei
+
+    def set(self, token_address: str, spender: str, amount_wei: int):
+        with self._lock:
+            self._allowances[(token_address, spender)] = amount_wei
+
+    def consume(self, token_address: str, spender: str, amount_wei: int):
+        with self._lock:
+            allowance = self._allowances.get((token_address, spender))
+            if allowance is not None and allowance != MAX_UINT256:
+                self._allowances[(token_address, spender)] = max(0, allowance - amount_wei)
+
+    def invalidate(self):
+        with self._lock:
+            self._allowances = {}
+
+
+class SynthetixTransactionPipeline:
+    """
+    Builds a chain of dependent transactions with explicit gas limits, signs them all up front
+    with consecutive nonces, broadcasts them back-to-back and then waits for every receipt
+    concurrently, so the chain lands in as few blocks as the sequencer allows.
+    """
+    def __init__(self, client):
+        self.client = client
+        self.nonce_manager = NonceManager(client)
+        self.allowance_cache = AllowanceCache(client)
+
+    def build(self, contract_function, step_name: str) -> dict:
+        return contract_function.build_transaction({
+            'from': self.client.address,
+            'chainId': self.client.network_id,
+            'value': 0,
+            'gas': PIPELINE_GAS_LIMITS[step_name]
+        })
+
+    def execute(self, steps: list) -> bool:
+        """
+        steps: [(step_name, unsigned_tx, on_success)], on_success is called once the receipt is
+        confirmed, or None. Returns True only if every receipt came back successful.
+        """
+        if not steps:
+            return True
+
+        try:
+            nonces = self.nonce_manager.reserve(len(steps))
+            signed_transactions = []
+            for (step_name, tx, _), nonce in zip(steps, nonces):
+                tx['nonce'] = nonce
+                signed_transactions.append(self.client.web3.eth.account.sign_transaction(tx, private_key=self.client.private_key))
+
+            tx_hashes = [
+                self.client.web3.to_hex(self.client.web3.eth.send_raw_transaction(signed_transaction.rawTransaction))
+                for signed_transaction in signed_transactions
+            ]
+            logger.info(f"SynthetixTransactionPipeline - Broadcast {len(tx_hashes)} transactions: {[step[0] for step in steps]}")
+
+        except Exception as e:
+            logger.error(f"SynthetixTransactionPipeline - Failed to sign or broadcast transactions. Error: {e}")
+            self.nonce_manager.reset()
+            self.allowance_cache.invalidate()
+            return False
+
+        with ThreadPoolExecutor(max_workers=len(tx_hashes), thread_name_prefix='SynthetixTransactionPipeline') as executor:
+            receipts = list(executor.map(
+                lambda tx_hash: FillConfirmation.wait_for_receipt('Synthetix', self.client.web3, tx_hash, stage='collateral'),
+                tx_hashes
+            ))
+
+        is_successful = True
+        for (step_name, _, on_success), tx_hash, receipt in zip(steps, tx_hashes, receipts):
+            if receipt is None:
+                logger.error(f"SynthetixTransactionPipeline - {step_name} transaction {tx_hash} failed or was not mined.")
+                is_successful = False
+            elif on_success is not None:
+                on_success()
+
+        if not is_successful:
+            self.nonce_manager.reset()
+            self.allowance_cache.invalidate()
+
+        return is_successful
@@ -0,0 +1,61 @@
+import sys
+
+from APICaller.GMX.GMXPriceImpactModel import build_impact_params, calculate_position_price_impact_usd
+
+RELATIVE_TOLERANCE = 0.01
+ABSOLUTE_TOLERANCE_USD = 0.01
+
+FLOAT_PRECISION = 10**30
+ETH_MIN_PRICE_FULL = 3000 * 10**12
+
+# Raw datastore values: positive factor, negative factor, exponent, max positive factor (all 10^30-scaled), impact pool amount (token units).
+BASE_PARAMS = (5 * 10**19, 10**20, 2 * FLOAT_PRECISION, 5 * 10**27, 10 * 10**18)
+SMALL_POOL_PARAMS = (5 * 10**19, 10**20, 2 * FLOAT_PRECISION, 5 * 10**27, 5 * 10**16)
+LOW_MAX_FACTOR_PARAMS = (5 * 10**19, 10**20, 2 * FLOAT_PRECISION, 10**26, 10 * 10**18)
+LINEAR_PARAMS = (5 * 10**19, 10**26, FLOAT_PRECISION, 5 * 10**27, 10 * 10**18)
+
+# (name, raw params, long OI usd, short OI usd, size usd, is_long, expected impact usd). Expected values are
+# PositionPricingUtils.getPriceImpactUsd for a position increase with the same inputs, in the contract's 30-decimal fixed point.
+KNOWN_CASES = [
+    ('long widens imbalance', BASE_PARAMS, 20_000_000, 15_000_000, 100_000, True, -101.0),
+    ('short narrows imbalance', BASE_PARAMS, 20_000_000, 15_000_000, 1_000_000, False, 450.0),
+    ('short crosses imbalance', BASE_PARAMS, 20_000_000, 15_000_000, 8_000_000, False, 350.0),
+    ('positive impact capped by impact pool', SMALL_POOL_PARAMS, 20_000_000, 15_000_000, 1_000_000, False, 150.0),
+    ('positive impact capped by max factor', LOW_MAX_FACTOR_PARAMS, 20_000_000, 15_000_000, 100_000, False, 10.0),
+    ('balanced market', BASE_PARAMS, 15_000_000, 15_000_000, 250_000, True, -6.25),
+    ('linear exponent', LINEAR_PARAMS, 20_000_000, 15_000_000, 100_000, True, -10.0),
+]
+
+def is_within_tolerance(local_impact: float, onchain_impact: float) -> bool:
+    difference = abs(local_impact - onchain_impact)
+    return difference <= ABSOLUTE_TOLERANCE_USD or difference <= abs(onchain_impact) * RELATIVE_TOLERANCE
+
+def check_known_cases() -> list:
+    """
+    Price every known case with the local model, without any RPC access.
+
+    Returns:
+        list: (name, local impact, expected impact) for every case outside tolerance.
+    """
+    failures = []
+    for name, raw_params, long_open_interest_usd, short_open_interest_usd, size_usd, is_long, expected_impact in KNOWN_CASES:
+        local_impact = calculate_position_price_impact_usd(
+            build_impact_params(*raw_params),
+            long_open_interest_usd,
+            short_open_interest_usd,
+            size_usd,
+            is_long,
+            ETH_MIN_PRICE_FULL
+        )
+        if not is_within_tolerance(local_impact, expected_impact):
+            failures.append((name, local_impact, expected_impact))
+
+    return failures
+
+if __name__ == "__main__":
+    failures = check_known_cases()
+    print(f"Known cases checked: {len(KNOWN_CASES)}, outside tolerance: {len(failures)}")
+    for name, local_impact, expected_impact in failures:
+        print(f"  {name}: local={local_impact} expected={expected_impact}")
+
+    sys.exit(1 if failures else 0)
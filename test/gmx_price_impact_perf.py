@@ -0,0 +1,71 @@
+import time
+import statistics
+import sys
+
+from APICaller.GMX.GMXMarketSnapshot import GMXSnapshotService
+from APICaller.GMX.GMXPriceImpactModel import GMXPriceImpactModel
+from GlobalUtils.MarketDirectories.GMXMarketDirectory import GMXMarketDirectory
+
+SYMBOLS = ['ETH', 'BTC', 'SOL', 'ARB']
+TRADE_SIZES_USD = [1_000, 10_000, 50_000, 250_000]
+RELATIVE_TOLERANCE = 0.01
+ABSOLUTE_TOLERANCE_USD = 0.01
+
+def is_within_tolerance(local_impact: float, onchain_impact: float) -> bool:
+    difference = abs(local_impact - onchain_impact)
+    return difference <= ABSOLUTE_TOLERANCE_USD or difference <= abs(onchain_impact) * RELATIVE_TOLERANCE
+
+def compare_against_onchain(snapshot) -> dict:
+    """
+    Price every symbol, side and size with the local model and the Reader contract.
+
+    Args:
+        snapshot (GMXMarketSnapshot): Snapshot shared by both paths.
+
+    Returns:
+        dict: Timings per path and the cases that fell outside tolerance.
+    """
+    local_times = []
+    onchain_times = []
+    mismatches = []
+
+    for symbol in SYMBOLS:
+        opportunity = {'symbol': symbol}
+        for is_long in [True, False]:
+            for size_usd in TRADE_SIZES_USD:
+                start_time = time.perf_counter()
+                local_impact = GMXMarketDirectory.get_price_impact_for_trade(opportunity, is_long, size_usd, snapshot)
+                local_times.append(time.perf_counter() - start_time)
+
+                start_time = time.perf_counter()
+                onchain_impact = GMXMarketDirectory.get_onchain_price_impact_for_trade(opportunity, is_long, size_usd, snapshot.prices)
+                onchain_times.append(time.perf_counter() - start_time)
+
+                if local_impact is None or onchain_impact is None or not is_within_tolerance(local_impact, onchain_impact):
+                    mismatches.append((symbol, is_long, size_usd, local_impact, onchain_impact))
+
+    return {
+        'local_average_time': statistics.mean(local_times),
+        'onchain_average_time': statistics.mean(onchain_times),
+        'mismatches': mismatches
+    }
+
+if __name__ == "__main__":
+    GMXMarketDirectory.initialize()
+    snapshot = GMXSnapshotService.get_snapshot(force_refresh=True)
+    results = compare_against_onchain(snapshot)
+
+    print(f"Local model average:  {results['local_average_time']:.6f} seconds")
+    print(f"Reader call average:  {results['onchain_average_time']:.6f} seconds")
+    print(f"Cases outside tolerance: {len(results['mismatches'])}")
+    for symbol, is_long, size_usd, local_impact, onchain_impact in results['mismatches']:
+        print(f"  {symbol} is_long={is_long} size={size_usd}: local={local_impact} onchain={onchain_impact}")
+
+    # Sweeping sizes only touches the datastore on the first call per market per snapshot.
+    market_key = GMXMarketDirectory.get_market_key_for_symbol('ETH')
+    sweep_sizes = [size * 1_000 for size in range(1, 1001)]
+    start_time = time.perf_counter()
+    GMXPriceImpactModel.get_price_impact_usd_for_sizes('ETH', market_key, True, sweep_sizes, snapshot)
+    print(f"Swept {len(sweep_sizes)} ETH sizes in {time.perf_counter() - start_time:.6f} seconds")
+
+    sys.exit(1 if results['mismatches'] else 0)
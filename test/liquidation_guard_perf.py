@@ -0,0 +1,61 @@
+import os
+import random
+import time
+
+os.environ.setdefault('MAX_ALLOWABLE_PERCENTAGE_AWAY_FROM_LIQUIDATION_PRICE', '10')
+
+from pubsub import pub
+from GlobalUtils.globalUtils import EventsDirectory
+from PositionMonitor.Master.MasterPositionMonitorUtils import build_position_snapshot
+from PositionMonitor.Master.LiquidationGuard import LiquidationGuard
+from PositionMonitor.Master.PriceStream import PriceStream, PriceReplaySource
+
+NUM_TICKS = 100_000
+START_PRICE = 3000.0
+
+def build_synthetic_ticks(num_ticks: int, start_price: float, seed: int = 42) -> list:
+    """
+    Build a random-walk price path that drifts down far enough to breach the long leg's trigger.
+
+    Args:
+        num_ticks (int): Number of ticks to generate.
+        start_price (float): Price of the first tick.
+        seed (int): Random seed so every run replays the same path.
+
+    Returns:
+        list: (offset_seconds, symbol, price) tuples in time order.
+    """
+    rng = random.Random(seed)
+    price = start_price
+    ticks = []
+    for i in range(num_ticks):
+        price *= 1 + rng.gauss(-0.00002, 0.0005)
+        ticks.append((i * 0.1, 'ETH', price))
+    return ticks
+
+def build_synthetic_snapshot(start_price: float):
+    positions_by_exchange = {
+        'Synthetix': {'symbol': 'ETH', 'side': 'Long', 'is_hedge': 'False', 'size_in_asset': 1.0, 'liquidation_price': start_price * 0.75},
+        'ByBit': {'symbol': 'ETH', 'side': 'Short', 'is_hedge': 'True', 'size_in_asset': 1.0, 'liquidation_price': start_price * 1.25},
+    }
+    return build_position_snapshot(positions_by_exchange, {'ETH': start_price}, {'Synthetix': 0.0, 'ByBit': 0.0})
+
+if __name__ == "__main__":
+    close_events = []
+    def on_close_position_pair(symbol, reason, exchanges):
+        close_events.append((symbol, reason, exchanges))
+    pub.subscribe(on_close_position_pair, EventsDirectory.CLOSE_POSITION_PAIR.value)
+
+    price_stream = PriceStream()
+    guard = LiquidationGuard(price_stream)
+    trigger = guard.arm(build_synthetic_snapshot(START_PRICE))
+    print(f"Armed trigger: {trigger}")
+
+    replay = PriceReplaySource(price_stream, build_synthetic_ticks(NUM_TICKS, START_PRICE))
+    start_time = time.perf_counter()
+    published = replay.run()
+    elapsed_time = time.perf_counter() - start_time
+
+    print(f"Replayed {published} ticks in {elapsed_time:.4f} seconds ({elapsed_time / published * 1e6:.2f} us per tick)")
+    print(f"Close events: {close_events}")
+    print(f"Tick-to-close latency: {guard.get_latency_metrics()}")
@@ -0,0 +1,92 @@
+import time
+import statistics
+import random
+from typing import Callable, Any
+
+from MatchingEngine.MatchingEngine import matchingEngine
+from MatchingEngine.VectorizedMatchingEngine import VectorizedMatchingEngine
+from GlobalUtils.globalUtils import BaseBlockClock
+
+NUM_RUNS = 5
+EXCHANGES = ['Synthetix', 'Binance', 'ByBit', 'HMX', 'GMX', 'OKX', 'VenueA', 'VenueB']
+
+def build_synthetic_funding_rates(num_symbols: int, exchanges: list, seed: int = 42) -> list:
+    """
+    Build a funding rate list shaped like MasterCaller.get_funding_rates output.
+
+    Args:
+        num_symbols (int): Number of distinct symbols.
+        exchanges (list): Exchange names to quote each symbol on.
+        seed (int): Random seed so both engines see identical input.
+
+    Returns:
+        list: Funding rate dicts with exchange, symbol, funding_rate and skew_usd.
+    """
+    rng = random.Random(seed)
+    funding_rates = []
+    for i in range(num_symbols):
+        symbol = f'TKN{i}'
+        for exchange in exchanges:
+            if rng.random() < 0.1:
+                continue
+            funding_rates.append({
+                'exchange': exchange,
+                'symbol': symbol,
+                'funding_rate': rng.uniform(-0.001, 0.001),
+                'skew_usd': rng.uniform(-1_000_000, 1_000_000)
+            })
+    return funding_rates
+
+def time_engine(engine: Any, funding_rates: list, num_runs: int = NUM_RUNS) -> dict:
+    """
+    Time find_delta_neutral_arbitrage_opportunities and return statistics.
+
+    Args:
+        engine (Any): Engine exposing find_delta_neutral_arbitrage_opportunities.
+        funding_rates (list): Input rates for the cycle.
+        num_runs (int): The number of times to run the engine.
+
+    Returns:
+        dict: A dictionary containing average, min, and max times.
+    """
+    times = []
+    for _ in range(num_runs):
+        start_time = time.perf_counter()
+        engine.find_delta_neutral_arbitrage_opportunities(funding_rates)
+        times.append(time.perf_counter() - start_time)
+
+    return {
+        "average_time": statistics.mean(times),
+        "min_time": min(times),
+        "max_time": max(times)
+    }
+
+def opportunity_keys(opportunities: list) -> set:
+    return {
+        (o['symbol'], o['long_exchange'], o['short_exchange'], o['long_exchange_funding_rate_8hr'], o['short_exchange_funding_rate_8hr'])
+        for o in opportunities
+    }
+
+def print_stats(engine_name: str, stats: dict):
+    print(f"{engine_name} times:")
+    print(f"  Average time: {stats['average_time']:.6f} seconds")
+    print(f"  Min time:     {stats['min_time']:.6f} seconds")
+    print(f"  Max time:     {stats['max_time']:.6f} seconds")
+    print()
+
+if __name__ == "__main__":
+    BaseBlockClock.sync()
+    scalar_engine = matchingEngine()
+    vectorized_engine = VectorizedMatchingEngine()
+
+    for num_symbols in [20, 200, 1000]:
+        funding_rates = build_synthetic_funding_rates(num_symbols, EXCHANGES)
+
+        scalar_output = scalar_engine.find_delta_neutral_arbitrage_opportunities(funding_rates)
+        vectorized_output = vectorized_engine.find_delta_neutral_arbitrage_opportunities(funding_rates)
+        is_equivalent = opportunity_keys(scalar_output) == opportunity_keys(vectorized_output)
+
+        print(f"--- {num_symbols} symbols x {len(EXCHANGES)} exchanges, {len(funding_rates)} rates ---")
+        print(f"Opportunities: scalar={len(scalar_output)}, vectorized={len(vectorized_output)}, equivalent={is_equivalent}")
+        print_stats("matchingEngine", time_engine(scalar_engine, funding_rates))
+        print_stats("VectorizedMatchingEngine", time_engine(vectorized_engine, funding_rates))
@@ -0,0 +1,69 @@
+import subprocess
+import statistics
+import sys
+import time
+
+NUM_RUNS = 5
+STARTUP_MODULE = 'Main.main_class'
+
+IMPORT_SCRIPT = f"""
+import time
+start_time = time.perf_counter()
+import {STARTUP_MODULE}
+elapsed_time = time.perf_counter() - start_time
+from GlobalUtils.ClientRegistry import ClientRegistry
+print(elapsed_time)
+print(','.join(ClientRegistry.get_built_clients()))
+"""
+
+def time_cold_import(num_runs: int = NUM_RUNS) -> dict:
+    """
+    Import the project-run entry module in a fresh interpreter and return statistics.
+
+    Args:
+        num_runs (int): The number of cold imports to time.
+
+    Returns:
+        dict: Average, min and max import times, plus the clients built during import.
+    """
+    times = []
+    built_clients = ''
+    for run in range(num_runs):
+        output = subprocess.run(
+            [sys.executable, '-c', IMPORT_SCRIPT],
+            capture_output=True,
+            text=True,
+            check=True
+        ).stdout.strip().splitlines()
+        elapsed_time = float(output[0])
+        built_clients = output[1] if len(output) > 1 else ''
+        times.append(elapsed_time)
+        print(f"Run {run + 1}/{num_runs}: {elapsed_time:.4f} seconds")
+
+    return {
+        "average_time": statistics.mean(times),
+        "min_time": min(times),
+        "max_time": max(times),
+        "built_clients": built_clients
+    }
+
+def time_master_caller_construction() -> tuple:
+    from APICaller.master.MasterCaller import MasterCaller
+    from GlobalUtils.ClientRegistry import ClientRegistry
+
+    start_time = time.perf_counter()
+    caller = MasterCaller()
+    elapsed_time = time.perf_counter() - start_time
+    return elapsed_time, list(caller.filtered_exchange_objects_and_tokens.keys()), ClientRegistry.get_built_clients()
+
+if __name__ == "__main__":
+    stats = time_cold_import()
+    print(f"Import of {STARTUP_MODULE}:")
+    print(f"  Average time: {stats['average_time']:.4f} seconds")
+    print(f"  Min time:     {stats['min_time']:.4f} seconds")
+    print(f"  Max time:     {stats['max_time']:.4f} seconds")
+    print(f"  Clients built during import: {stats['built_clients'] or 'none'}")
+
+    elapsed_time, target_exchanges, built_clients = time_master_caller_construction()
+    print(f"MasterCaller() for {target_exchanges}: {elapsed_time:.4f} seconds")
+    print(f"  Clients built: {built_clients}")